@@ -30,27 +30,176 @@
 # Standard library
 # ----------------
 import sys
-import io
 import threading
 from queue import Queue
 import re
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+import functools
+import cProfile
+import itertools
+import logging
+import multiprocessing
+import io
+import os
+import socketserver
 
 # Third-party imports
 # -------------------
-from flask import Flask, request, make_response
+from flask import Flask, request, make_response, jsonify
 from flask_cors import cross_origin
+from werkzeug.serving import make_server
+from thrift.Thrift import TType
 from thrift.protocol import TJSONProtocol
 from thrift.server import TServer
 from thrift.transport import TTransport
 from thrift.transport import TSocket
 from thrift.protocol import TBinaryProtocol
-from CodeChat.CodeToRest import code_to_html_string
+from docutils import core
+from docutils import io as docutils_io
+from docutils.parsers.rst import Parser
+from docutils.writers.html4css1 import Writer
+from CodeChat.CodeToRest import html_static_path
+from CodeChat.SourceClassifier import get_lexer
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import TextLexer
+from pygments.util import ClassNotFound
 
 # Local application imports
 # -------------------------
 sys.path.append('gen-py')
 from CodeChat_Services import Editor_Extension, Web_Sync
-from CodeChat_Services.ttypes import Get_Result_Type, Get_Result_Return
+from CodeChat_Services.ttypes import (
+    Get_Result_Type, Get_Result_Return, Render_Client_Return, Editor_Result_Type,
+    Editor_Result_Return, Ownership_Return, Batch_Render_Result, Render_Quality,
+)
+from file_watcher import FileWatcher, is_supported, walk_files
+from lex_cache import LexCache
+from doctree_cache import DoctreeCache
+from metrics import registry
+from position_map import ANCHOR_PREFIX, add_sync_anchors
+from post_render import AssetStore, ExtractStylesheets, PostRenderPipeline, minify_html
+from render_backends import Source, default_backends
+from render_queue import RenderQueue, OVERLOADED, REJECTED
+from router import FRAME
+from window import WindowedView
+from shared_text import SharedTextReader
+from session import ClientState, SessionSaver, read_snapshot
+from scheduler import RenderScheduler, FOCUSED, VISIBLE, BACKGROUND, PRIORITY_NAMES
+from workspace import Workspace, WorkspaceCache
+
+logger = logging.getLogger(__name__)
+
+# Metrics
+# =======
+# These record the server's load; see |metrics|. They are served by `metrics_service`_.
+render_seconds = registry.histogram(
+    "codechat_render_seconds", "Time to render a document and enqueue the results."
+)
+render_input_characters = registry.histogram(
+    "codechat_render_input_characters", "Length of the documents rendered, in characters.",
+    buckets=(1000, 10000, 100000, 1000000, 10000000),
+)
+render_errors = registry.counter(
+    "codechat_render_errors_total", "Renders of files not supported by CodeChat."
+)
+renders_deferred = registry.counter(
+    "codechat_renders_deferred_total", "Renders put off since no web view of their client was shown."
+)
+renders_skipped = registry.counter(
+    "codechat_renders_skipped_total", "Editor text not rendered since it echoed edits made in a web view."
+)
+document_switches = registry.counter(
+    "codechat_document_switches_total", "Switches to another document in a workspace, by whether its last render was reused.", ["cached"]
+)
+watched_files_rendered = registry.counter(
+    "codechat_watched_files_rendered_total", "Files rendered after changing on disk, by whether they were shown in a web view, open in an editor, or rendered in advance.", ["kind"]
+)
+batch_renders = registry.counter(
+    "codechat_batch_renders_total", "Files rendered by render_batch, by whether they rendered without error.", ["result"]
+)
+backend_renders = registry.counter(
+    "codechat_backend_renders_total", "Renders by the backend chosen to render them.", ["backend"]
+)
+render_admissions = registry.counter(
+    "codechat_render_admissions_total", "Renders submitted to the render queue, by outcome.", ["outcome"]
+)
+preview_seconds = registry.histogram(
+    "codechat_preview_seconds", "Time to render a preview of the lines near the cursor."
+)
+render_wait_seconds = registry.histogram(
+    "codechat_render_wait_seconds", "Time a render waited for the scheduler, by priority.", ["priority"]
+)
+get_result_wait_seconds = registry.histogram(
+    "codechat_get_result_wait_seconds", "Time a web view waited for its next result."
+)
+results_delivered = registry.counter(
+    "codechat_results_delivered_total", "Results delivered to web views.", ["gr_type"]
+)
+web_sync_seconds = registry.histogram(
+    "codechat_web_sync_seconds", "Time to process a Web_Sync request, including the wait for a result."
+)
+web_sync_response_bytes = registry.counter(
+    "codechat_web_sync_response_bytes_total", "Bytes sent in Web_Sync responses."
+)
+# These are computed from the handler's state when read.
+registry.gauge(
+    "codechat_clients", "Number of web view clients.",
+    function=lambda: [({}, len(handler.results_dict))],
+)
+registry.gauge(
+    "codechat_workspace_cache_bytes", "Memory used by inactive workspace documents.",
+    function=lambda: [({}, handler.workspace_cache.memory_used)],
+)
+registry.gauge(
+    "codechat_workspace_cache_evictions", "Inactive workspace documents evicted to stay within the memory budget.",
+    function=lambda: [({}, handler.workspace_cache.evictions)],
+)
+registry.gauge(
+    "codechat_lex_cache_blocks", "Blocks of code whose tokens were found in the lexing cache, or weren't.", ["cached"],
+    function=lambda: [({"cached": "true"}, lex_cache.hits), ({"cached": "false"}, lex_cache.misses)],
+)
+registry.gauge(
+    "codechat_lex_cache_characters", "Characters of code whose tokens are in the lexing cache.",
+    function=lambda: [({}, lex_cache.chars_used)],
+)
+registry.gauge(
+    "codechat_doctree_cache_blocks", "Blocks of reST whose doctrees were found in the parsing cache, or weren't.", ["cached"],
+    function=lambda: [({"cached": "true"}, doctree_cache.hits), ({"cached": "false"}, doctree_cache.misses)],
+)
+registry.gauge(
+    "codechat_doctree_cache_characters", "Characters of reST whose doctrees are in the parsing cache.",
+    function=lambda: [({}, doctree_cache.chars_used)],
+)
+registry.gauge(
+    "codechat_render_queue_clients", "Clients with a render waiting in the render queue.",
+    function=lambda: [({}, handler.render_queue.waiting())],
+)
+registry.gauge(
+    "codechat_renders_waiting", "Renders waiting for the scheduler, by priority.", ["priority"],
+    function=lambda: [
+        ({"priority": PRIORITY_NAMES[priority]}, count) for priority, count in enumerate(handler.scheduler.waiting())
+    ],
+)
+registry.gauge(
+    "codechat_viewers", "Number of web views polling each client.", ["id"],
+    function=lambda: [
+        ({"id": id}, len(results.backlog())) for id, results in list(handler.results_dict.items())
+    ],
+)
+registry.gauge(
+    "codechat_results_backlog", "Results waiting to be delivered to each web view.", ["id", "viewer_id"],
+    function=lambda: [
+        ({"id": id, "viewer_id": viewer_id}, backlog)
+        for id, results in list(handler.results_dict.items())
+        for viewer_id, backlog in results.backlog().items()
+    ],
+)
 
 
 # Service provider
@@ -58,13 +207,60 @@ from CodeChat_Services.ttypes import Get_Result_Type, Get_Result_Return
 # This class implements both the Editor_Extension and Web_Sync services.
 class CodeChatHandler:
     def __init__(self):
+        # Maps each client's ID to its ResultChannel_.
         self.results_dict = {}
+        # Maps each client's ID to the PositionMap for its last render; see |position_map|.
+        self.position_map_dict = {}
+        # Maps each client's ID to the line of its editor's cursor, as sent by sync_web_view.
+        self.cursor_line_dict = {}
+        # Documents with at least this many lines are previewed before the full render; 0 disables previews. A preview renders about ``preview_lines`` lines near the cursor; see render_preview_.
+        self.preview_min_lines = 1000
+        self.preview_lines = 200
+        # Documents with at least this many lines are rendered in blocks of about ``window_block_lines`` lines, as the web views show them; 0 disables this. See |window|.
+        self.window_min_lines = 20000
+        self.window_block_lines = 500
+        # Maps each client's ID to the WindowedView of its last windowed render.
+        self.window_dict = {}
+        # Maps the ID of each client whose web views are all hidden to the arguments of its latest render put off until one is shown; see set_visibility_.
+        self.hidden_renders = {}
+        self._hidden_lock = threading.Lock()
+        # Maps each client's ID to a queue of results for its editor.
+        self.editor_results_dict = {}
+        # Maps each client's ID to its Workspace; see |workspace|.
+        self.workspace_dict = {}
+        # Inactive documents from all workspaces. The default memory budget is 256 MB.
+        self.workspace_cache = WorkspaceCache(256*2**20)
+        # Renders of files which no editor has open, keyed by normalized path, from `render_changed_files`_ and `render_batch`_. These share the memory budget of inactive documents.
+        self.prerender_workspace = Workspace(self.workspace_cache)
+        # The number of processes render_batch uses; None uses one per CPU.
+        self.render_workers = None
+        # The pool of these processes, created when first needed, and the settings passed to them.
+        self._render_pool = None
+        self._render_pool_settings = None
+        self._render_pool_lock = threading.Lock()
+        # The number of seconds a web view waits for the editor to grant ownership.
+        self.ownership_timeout = 30
+        self._ids = itertools.count(1)
+        # Runs renders from editors and web views, bounding the work pending; see |render_queue|.
+        self.render_queue = RenderQueue()
+        # Runs the quick highlights shown while the render queue is overloaded, so that ``start_render`` doesn't do this work; like renders, only each client's latest waits.
+        self.highlight_queue = RenderQueue(threads=1)
+        # Orders renders from editors, the FileWatcher and render_batch; see |scheduler|.
+        self.scheduler = RenderScheduler()
+        # Reads text which local editors pass through shared memory; see |shared_text|.
+        self.shared_text = SharedTextReader()
+        # A RenderProfiler_ when profiling is enabled, or None.
+        self.profiler = None
+        # Style sheets removed from the HTML sent to web views, and the stages which process that HTML; see |post_render|.
+        self.assets = AssetStore()
+        self.post_render = PostRenderPipeline([ExtractStylesheets(self.assets), minify_html])
 
-    # Return the HTML for a web client.
+    # Return the HTML for a new web client, along with the ID the editor uses to render to it.
     def render_client(self):
-        # TODO: Generate a unique ID and return it.
-        id = 1
-        self.results_dict[id] = Queue()
+        return self.render_client_with_id(next(self._ids))
+
+    def render_client_with_id(self, id):
+        self._add_client(id)
 
         # Return the HTML for the client.
         html = file_contents("CodeChat_client.html")
@@ -86,51 +282,951 @@ class CodeChatHandler:
             # Include the end of the script tag in this re.
             '"></script>', script_replacer, html
         )
-        # Manually replace the unique id in the HTML. TODO: use a unique ID.
+        # Manually replace the unique id in the HTML.
         html = html.replace(
             "<script>run_client(unique_id);</script>", 
             "<script>run_client({});</script>".format(id)
         )
-        return html
+        return Render_Client_Return(id, html)
 
-    # Render the provided text to HTML, then enqueue it for the web view.
+    # Render the provided text from the editor, unless it only echoes edits from a web view which were already rendered. When the editor switches to another document in its workspace whose text is unchanged, or opens a watched file rendered in advance, show that render instead.
     def start_render(self, text, path, id):
-        # Use StringIO to pass CodeChat compilation information back to
-        # the UI.
-        errStream = io.StringIO()
+        document, switched = self.workspace_dict[id].open(path)
+        if switched or not document.version:
+            render = document.get_render(text) or self._copy_prerender(document, text, path)
+            if switched:
+                document_switches.inc(cached=render is not None)
+            if render:
+                # Queue this like a render, so that it's shown after any render already running.
+                self._submit(id, lambda: self._show_render(id, *render))
+                return
+
+        version = document.update(text, path)
+        if version is None:
+            renders_skipped.inc()
+        else:
+            self._submit(id, lambda: self._render(document, version, text, path, id), text, path)
+
+    # Render text which an editor on this machine wrote to shared memory.
+    def start_render_shared(self, name, offset, length, path, id):
+        self.start_render(self.shared_text.read(name, offset, length), path, id)
+
+    # Submit ``job`` to the render queue for the client ``id``. If the server is overloaded, show a quick highlight of ``text`` while the job waits; if the job is rejected, tell the client's web views.
+    def _submit(self, id, job, text=None, path=None):
+        outcome = self.render_queue.submit(id, job)
+        render_admissions.inc(outcome=outcome)
+        if outcome == OVERLOADED and text is not None:
+            self.highlight_queue.submit(id, lambda: self._render_highlight(text, path, id))
+        elif outcome == REJECTED:
+            results = self.results_dict.get(id)
+            if results:
+                results.put(make_result(Get_Result_Type.status, json.dumps({"overload": "rejected"})))
+
+    def _show_render(self, id, html, position_map):
+        results = self.results_dict.get(id)
+        if results:
+            results.put(make_result(Get_Result_Type.status, json.dumps({"phase": "done", "time": 0, "cached": True})))
+            self.position_map_dict[id] = position_map
+            results.put(self._html_result(html, Render_Quality.full))
 
-        # Render the source code.
+    # Show source code highlighted by Pygments, which takes a small fraction of the time of a render, in place of the render. Skip this if the render is no longer waiting, so that it doesn't replace the render.
+    def _render_highlight(self, text, path, id):
+        results = self.results_dict.get(id)
+        if not results or not self.render_queue.is_waiting(id):
+            return
         try:
-            htmlString = code_to_html_string(text, errStream, filename=path)
+            lexer = get_lexer(filename=path, code=text)
+        except ClassNotFound:
+            lexer = TextLexer()
+        html = highlight(text, lexer, HtmlFormatter(full=True))
+        results.put(make_result(Get_Result_Type.status, json.dumps({"overload": "degraded"})))
+        # This HTML has no sync anchors.
+        self.position_map_dict[id] = None
+        results.put(self._html_result(html, Render_Quality.preview))
+
+    # Render at the given priority once the scheduler allows; see |scheduler|.
+    def _render(self, document, version, text, path, id, priority=FOCUSED):
+        results = self.results_dict.get(id)
+        with self._hidden_lock:
+            if results and results.hidden():
+                self.hidden_renders[id] = (document, version, text, path, id, priority)
+                renders_deferred.inc()
+                return
+        with self._render_slot(priority):
+            self._render_now(document, version, text, path, id)
+
+    @contextmanager
+    def _render_slot(self, priority):
+        with self.scheduler.slot(priority) as seconds:
+            render_wait_seconds.observe(seconds, priority=PRIORITY_NAMES[priority])
+            yield
+
+    # Render version ``version`` of a document to HTML, then enqueue it for the client's web views. Build output and phase markers are streamed to the web view while the render runs; the HTML is always the last result of a render.
+    @render_seconds.time()
+    def _render_now(self, document, version, text, path, id):
+        results = self.results_dict.get(id)
+        if not results:
+            # The client stopped while this render waited.
+            return
+        render_input_characters.observe(len(text))
+        stream = ResultStreamWriter(results)
+
+        line_count = text.count("\n")
+        if self.window_min_lines and line_count >= self.window_min_lines:
+            stream.phase('window')
+            self._render_window(results, stream, version, text, path, id)
+            return
+        self.window_dict.pop(id, None)
+
+        profiler = self.profiler
+        if profiler:
+            profile_state = profiler.begin()
+        try:
+            # A large document takes a while to render, so first show the lines near the cursor.
+            if self.preview_min_lines and line_count >= self.preview_min_lines:
+                stream.phase('preview')
+                self._put_preview(results, version, text, path, id)
+
+            # Render the source code.
+            try:
+                htmlString, position_map = render_phases(text, path, stream, stream.phase)
+            except KeyError:
+                # Although the file extension may be in the list of supported
+                # extensions, CodeChat may not support the lexer chosen by Pygments.
+                # For example, a ``.v`` file may be Verilog (supported by CodeChat)
+                # or Coq (not supported). In this case, provide an error messsage
+                stream.write('Error: this file is not supported by CodeChat.')
+                htmlString = ''
+                position_map = None
+                render_errors.inc()
+            else:
+                position_map.version = version
+
+            # Marking the end of the render also sends any remaining build output.
+            stream.phase('done')
+            html_result = self._html_result(htmlString, Render_Quality.full)
+            if profiler:
+                profiler.end(profile_state, stream, path, text, html_result)
+                profiler = None
+        finally:
+            if profiler:
+                # The render raised an exception.
+                profiler.cancel(profile_state)
+        document.set_render(version, htmlString, position_map)
+        # Sync requests use the map for the HTML the web views show.
+        self.position_map_dict[id] = position_map
+        results.put(html_result)
+
+    def _put_preview(self, results, version, text, path, id):
+        with preview_seconds.time():
+            try:
+                html, position_map = render_preview(text, path, self.cursor_line_dict.get(id, 1), self.preview_lines)
+            except KeyError:
+                # The full render reports this.
+                return
+        position_map.version = version
+        self.position_map_dict[id] = position_map
+        results.put(self._html_result(html, Render_Quality.preview))
+
+    # Render a skeleton of a very large document, with only the blocks around the cursor rendered; the web views request the rest using set_viewport_. This isn't kept for a later switch to this document, since the blocks shown change as the web views scroll.
+    def _render_window(self, results, stream, version, text, path, id):
+        view = self.window_dict.get(id)
+        if not view or view.path != path:
+            view = self.window_dict[id] = WindowedView(
+                path, lambda block_text, anchor_prefix: render_block(block_text, path, anchor_prefix), self.window_block_lines
+            )
+        view.update(text, version)
+        index = view.block_for_line(self.cursor_line_dict.get(id, 1))
+        try:
+            html = view.skeleton(range(index - 1, index + 2))
         except KeyError:
-            # Although the file extension may be in the list of supported
-            # extensions, CodeChat may not support the lexer chosen by Pygments.
-            # For example, a ``.v`` file may be Verilog (supported by CodeChat)
-            # or Coq (not supported). In this case, provide an error messsage
-            errStream.write('Error: this file is not supported by CodeChat.')
-            htmlString = ''
-
-        # Save any errors.
-        errString = errStream.getvalue()
-        errStream.close()
-
-        # Enqueue the results.
-        self.results_dict[id].put(Get_Result_Return(Get_Result_Type.build, errString))
-        self.results_dict[id].put(Get_Result_Return(Get_Result_Type.html, htmlString))
-
-    # Pass rendered results back to the web view.
-    def get_result(self, id):
-        return self.results_dict[id].get()
-
-    # TODO
+            stream.write('Error: this file is not supported by CodeChat.')
+            html = ''
+            render_errors.inc()
+        stream.phase('done')
+        self.position_map_dict[id] = view.position_map
+        results.put(self._html_result(html, Render_Quality.windowed))
+
+    # If the file at ``path`` was rendered in advance with this text, copy that render to ``document`` and return ``(html, position map)``; otherwise, return None.
+    def _copy_prerender(self, document, text, path):
+        render = self._get_prerender(path, text)
+        if not render:
+            return None
+        html, position_map = render
+        version = document.update(text, path)
+        position_map = position_map and position_map.with_version(version)
+        document.set_render(version, html, position_map)
+        return html, position_map
+
+    # .. _render_changed_files:
+    #
+    # Render files which changed on disk; the FileWatcher from |file_watcher| calls this with each batch of changed ``paths``. Files shown in a web view are submitted first to the render queue, as an edit is, for its viewers; next come files open in an editor, whose renders are kept for when the editor switches to them. Last come files no editor has open, rendered in advance so the first view of each is immediate. If ``is_interrupted()`` returns True, more changes are waiting, so stop and return the paths not yet rendered; these are included in the next batch.
+    def render_changed_files(self, paths, is_interrupted):
+        # Maps a normalized path to a list of ``(id, workspace, document)`` for each open document with that path.
+        open_documents = {}
+        for id, workspace in list(self.workspace_dict.items()):
+            for document in list(workspace.documents.values()):
+                open_documents.setdefault(_normalize_path(document.path), []).append((id, workspace, document))
+
+        def priority(path):
+            documents = open_documents.get(_normalize_path(path), [])
+            if any(document is workspace.active for id, workspace, document in documents):
+                return 0
+            return 1 if documents else 2
+
+        paths = sorted(paths, key=priority)
+        for index, path in enumerate(paths):
+            if index and is_interrupted():
+                return paths[index:]
+            try:
+                text = file_contents(path)
+            except (OSError, UnicodeDecodeError):
+                # The file was deleted or isn't text.
+                continue
+            self._render_changed_file(path, text, open_documents.get(_normalize_path(path), []))
+        return []
+
+    def _render_changed_file(self, path, text, documents):
+        # A render to reuse for each document not shown in a web view.
+        render = None
+        for id, workspace, document in documents:
+            version = document.update_from_file(text)
+            if version is None:
+                # The editor already sent this text.
+                continue
+            if document is workspace.active:
+                watched_files_rendered.inc(kind="shown")
+                self._submit(
+                    id,
+                    lambda document=document, version=version, id=id: self._render(document, version, text, document.path, id, VISIBLE),
+                    text,
+                    document.path,
+                )
+                # The render above runs later, so this finds only a render finished earlier.
+                render = render or document.get_render(text)
+            else:
+                watched_files_rendered.inc(kind="open")
+                render = render or self._render_quietly(text, path)
+                html, position_map = render
+                document.set_render(version, html, position_map and position_map.with_version(version))
+        if not documents and not self._get_prerender(path, text):
+            watched_files_rendered.inc(kind="advance")
+            self._set_prerender(path, text, *self._render_quietly(text, path))
+
+    # .. _render_batch:
+    #
+    # Render the given files, and the supported files in any directories given, in parallel using a pool of processes, since renders are CPU-bound. Keep each render so that opening the file shows it immediately. Return a Batch_Render_Result for each file.
+    def render_batch(self, paths):
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files += [file for file in walk_files(path) if is_supported(file)]
+            else:
+                files.append(path)
+        pool = self._get_render_pool()
+        # Submit each file only when the scheduler allows, so that interactive renders needn't wait for a whole batch. A future of None means the pool was broken before the file was submitted.
+        futures = []
+        for path in files:
+            render_wait_seconds.observe(self.scheduler.acquire(BACKGROUND), priority=PRIORITY_NAMES[BACKGROUND])
+            try:
+                future = pool.submit(render_file, path)
+            except BrokenProcessPool:
+                self.scheduler.release(BACKGROUND)
+                future = None
+            else:
+                future.add_done_callback(lambda future: self.scheduler.release(BACKGROUND))
+            futures.append((path, future))
+        batch_results = []
+        for path, future in futures:
+            try:
+                if future is None:
+                    raise BrokenProcessPool("A process of the render pool terminated abruptly.")
+                path, text, render, seconds, error = future.result()
+            except BrokenProcessPool as e:
+                # A process crashed, failing its render and every one still waiting. Report these as errors, and start a new pool for the next batch.
+                self._discard_render_pool(pool)
+                text = render = None
+                seconds = 0
+                error = '{}: {}'.format(type(e).__name__, e)
+            batch_renders.inc(result="error" if error else "ok")
+            if render:
+                self._set_prerender(path, text, *render)
+            batch_results.append(Batch_Render_Result(path, seconds, error))
+        return batch_results
+
+    # Return the pool of render processes. Since the processes don't share this process's settings, these are passed to each when it starts; if they have changed since, start a new pool.
+    def _get_render_pool(self):
+        settings = (lex_cache.max_chars, doctree_cache.max_chars, render_backends.enabled)
+        with self._render_pool_lock:
+            if self._render_pool and self._render_pool_settings != settings:
+                self._render_pool.shutdown(wait=False)
+                self._render_pool = None
+            if not self._render_pool:
+                # Forking a process running the servers' threads could copy locks they hold, so start fresh processes instead.
+                workers = self.render_workers or os.cpu_count()
+                self._render_pool = ProcessPoolExecutor(
+                    workers, multiprocessing.get_context("spawn"), initializer=init_render_process, initargs=settings
+                )
+                self._render_pool_settings = settings
+                # Let background renders use every process.
+                self.scheduler.background_limit = workers
+            return self._render_pool
+
+    # Discard ``pool`` if it's still the pool of render processes, so that the next batch starts a new one.
+    def _discard_render_pool(self, pool):
+        with self._render_pool_lock:
+            if self._render_pool is pool:
+                pool.shutdown(wait=False)
+                self._render_pool = None
+
+    # Return ``(html, position map)`` if the file at ``path`` was rendered in advance with this text; otherwise, return None.
+    def _get_prerender(self, path, text):
+        document = self.prerender_workspace.documents.get(_normalize_path(path))
+        return document and document.get_render(text)
+
+    def _set_prerender(self, path, text, html, position_map):
+        document, _ = self.prerender_workspace.open(_normalize_path(path))
+        if not document.get_render(text):
+            version = document.update(text, path)
+            document.set_render(version, html, position_map and position_map.with_version(version))
+
+    # Render in the background, without sending build output or phases to a web view. Return ``(html, position map)``.
+    def _render_quietly(self, text, path):
+        with self._render_slot(BACKGROUND), render_seconds.time():
+            render_input_characters.observe(len(text))
+            try:
+                return render_phases(text, path, io.StringIO(), lambda phase_name: None)
+            except KeyError:
+                render_errors.inc()
+                return '', None
+
+    # Pass rendered results back to the web view. Web views which omit the ``viewer_id`` share viewer 0. Once the client is stopped, this returns a ``stopped`` status, after which the web view should stop polling.
+    @get_result_wait_seconds.time()
+    def get_result(self, id, viewer_id):
+        results = self.results_dict.get(id)
+        if results:
+            # A new web view is shown, so a render put off while the others were hidden is due.
+            results.add_viewer(viewer_id or 0)
+            self._render_hidden(id)
+        result = results.get(viewer_id or 0) if results else None
+        if result is None:
+            result = make_result(Get_Result_Type.status, json.dumps({"stopped": True}))
+        results_delivered.inc(gr_type=Get_Result_Type._VALUES_TO_NAMES[result.gr_type])
+        return result
+
+    # Discard a client's results; its web views and editor stop polling.
     def stop_render_client(self, id):
-        return
+        self.render_queue.discard(id)
+        self.highlight_queue.discard(id)
+        results = self.results_dict.pop(id, None)
+        if results:
+            results.close()
+        self.position_map_dict.pop(id, None)
+        self.cursor_line_dict.pop(id, None)
+        self.window_dict.pop(id, None)
+        self.hidden_renders.pop(id, None)
+        editor_results = self.editor_results_dict.pop(id, None)
+        if editor_results:
+            editor_results.put(None)
+        workspace = self.workspace_dict.pop(id, None)
+        if workspace:
+            workspace.close()
+
+    # Scroll the client's web views to the element rendered from the given 1-based source line. This is a lookup in the last render's position map, so it's cheap enough to call on every cursor movement.
+    def sync_web_view(self, id, line):
+        self.cursor_line_dict[id] = line
+        position_map = self.position_map_dict.get(id)
+        results = self.results_dict.get(id)
+        if position_map and results:
+            anchor, line_offset = position_map.anchor_for_line(line)
+            if anchor:
+                results.put(make_result(
+                    Get_Result_Type.sync, json.dumps({"anchor": anchor, "line_offset": line_offset})
+                ))
+
+    # Return the next result for the editor, waiting until one is available. Once the client is stopped, this returns a ``stopped`` result.
+    def get_editor_result(self, id):
+        editor_results = self.editor_results_dict.get(id)
+        result = editor_results.get() if editor_results else None
+        if result is None:
+            if editor_results:
+                # Wake any other polls waiting on this queue.
+                editor_results.put(None)
+            result = Editor_Result_Return(Editor_Result_Type.stopped)
+        return result
+
+    # Move the editor's cursor to the source of an element clicked in a web view, given the element's anchor and the number of lines from its start. A web view sends the ids of the element and its ancestors, since it can't tell which is an anchor; see |position_map|.
+    def sync_editor(self, id, anchor, line_offset):
+        position_map = self.position_map_dict.get(id)
+        editor_results = self.editor_results_dict.get(id)
+        anchor = position_map and position_map.find_anchor(anchor)
+        if anchor and editor_results:
+            line = position_map.line_for_anchor(anchor, line_offset or 0)
+            if line is not None:
+                editor_results.put(Editor_Result_Return(Editor_Result_Type.sync, line))
+
+    # Ask the editor to let a web view edit the source of the element with the given anchor, and wait for it to agree. The web view receives only that element's source.
+    def request_ownership(self, id, anchor):
+        document = self._active_document(id)
+        editor_results = self.editor_results_dict.get(id)
+        if not (document and editor_results):
+            return Ownership_Return(False)
+        editor_results.put(Editor_Result_Return(Editor_Result_Type.request_ownership))
+        if not document.wait_for_grant(self.ownership_timeout):
+            return Ownership_Return(False)
+
+        # The web view shows the last render; if the editor sent changes since then, its lines may no longer match the document.
+        position_map = self.position_map_dict.get(id)
+        anchor = position_map and position_map.find_anchor(anchor)
+        line_range = anchor and position_map.line_range_for_anchor(anchor)
+        element = line_range and document.get_lines(*line_range)
+        if not element or element[0] != position_map.version:
+            document.release()
+            return Ownership_Return(False)
+        version, text = element
+        return Ownership_Return(True, version, line_range[0], line_range[1], text, anchor)
+
+    def grant_ownership(self, id):
+        document = self._active_document(id)
+        if document:
+            document.grant()
+
+    # Apply a web view's edits, send them to the editor, then render the result.
+    def edit_text(self, id, version, edits):
+        document = self._active_document(id)
+        editor_results = self.editor_results_dict.get(id)
+        if not (document and editor_results):
+            return False
+        new_version = document.apply_edits(version, edits)
+        if new_version is None:
+            return False
+        if edits:
+            editor_results.put(Editor_Result_Return(Editor_Result_Type.text, edits=edits))
+            version, text, path = document.snapshot()
+            self._submit(id, lambda: self._render(document, version, text, path, id), text, path)
+        return True
+
+    # .. _set_viewport:
+    #
+    # Send the blocks from ``first_block`` to ``last_block`` of version ``version`` of a windowed render, which a web view is about to show, unless they were already sent. At most ``MAX_VIEWPORT_BLOCKS`` are sent per call.
+    MAX_VIEWPORT_BLOCKS = 8
+
+    def set_viewport(self, id, version, first_block, last_block):
+        view = self.window_dict.get(id)
+        results = self.results_dict.get(id)
+        # Ignore requests for a render the web views no longer show.
+        if not (view and results and self.position_map_dict.get(id) is view.position_map):
+            return
+        with self._render_slot(VISIBLE):
+            first_block = max(first_block, 0)
+            for index in range(first_block, min(last_block, first_block + self.MAX_VIEWPORT_BLOCKS - 1) + 1):
+                try:
+                    html = view.take_block(version, index)
+                except KeyError:
+                    return
+                if html is not None:
+                    results.put(make_result(
+                        Get_Result_Type.block, json.dumps({"version": version, "index": index, "html": html})
+                    ))
+
+    # Return the text of an asset removed from the HTML sent to a web view, or an empty string if it's unknown. The ID is unused, except by |router|, which sends the call to the client's server process.
+    def get_asset(self, id, name):
+        return self.assets.get(name) or ""
+
+    # .. _set_visibility:
+    #
+    # Record whether a web view is shown. A hidden web view stops polling, and while all of a client's web views are hidden, its renders are put off; once one is shown, the latest is rendered.
+    def set_visibility(self, id, viewer_id, visible):
+        results = self.results_dict.get(id)
+        if results:
+            results.set_visible(viewer_id or 0, visible)
+            self._render_hidden(id)
+
+    # Submit the render put off for a client, if any, once one of its web views is shown.
+    def _render_hidden(self, id):
+        results = self.results_dict.get(id)
+        with self._hidden_lock:
+            if id not in self.hidden_renders or not results or results.hidden():
+                return
+            args = self.hidden_renders.pop(id)
+        self._submit(id, lambda: self._render(*args))
+
+    # Return a result with the HTML of a render, processed for the web views.
+    def _html_result(self, html, quality):
+        return make_result(Get_Result_Type.html, self.post_render(html), quality)
+
+    # Return the document shown in a client's web views, or None.
+    def _active_document(self, id):
+        workspace = self.workspace_dict.get(id)
+        return workspace and workspace.active
+
+    def _add_client(self, id):
+        self.results_dict[id] = ResultChannel()
+        self.editor_results_dict[id] = Queue()
+        self.workspace_dict[id] = Workspace(self.workspace_cache)
+
+    # Return a ClientState for each client, to save in a snapshot; see |session|. Only a render of the active document's current text is saved.
+    def session_clients(self):
+        clients = []
+        for id in list(self.results_dict):
+            document = self._active_document(id)
+            if not document:
+                clients.append(ClientState(id, self.cursor_line_dict.get(id, 1), None, 0, None, None, None))
+                continue
+            version, text, path = document.snapshot()
+            html, position_map = document.get_render(text) or (None, None)
+            clients.append(ClientState(
+                id, self.cursor_line_dict.get(id, 1), path, version, text if html is not None else None, html, position_map
+            ))
+        return clients
+
+    # Recreate clients from a snapshot. Each client's web views first show its saved render. That render is also kept as a render made in advance (see `render_batch`_), so that when the editor reconnects and sends the same text, it's shown rather than rendered again. New clients receive IDs after those restored.
+    def restore_clients(self, clients):
+        for client in clients:
+            self._add_client(client.id)
+            self.cursor_line_dict[client.id] = client.cursor_line
+            if client.html is not None:
+                self._set_prerender(client.path, client.text, client.html, client.position_map)
+                self.position_map_dict[client.id] = client.position_map
+                self.results_dict[client.id].put(self._html_result(client.html, Render_Quality.full))
+        if clients:
+            self._ids = itertools.count(max(client.id for client in clients) + 1)
 
 
 # Instantiate this class, which will be used by both servers.
 handler = CodeChatHandler()
 
 
+# .. _render_phases:
+#
+# Rendering
+# =========
+# This performs the same steps as ``CodeChat.CodeToRest.code_to_html_string``, but calls ``on_phase(phase_name)`` before each phase of the render so that progress can be reported while a long render runs. The phases are:
+#
+# lexer
+#   Choose the cheapest backend which can render the file; see |render_backends|. Most need the Pygments lexer for the source code.
+# convert
+#   Translate the source code to reST.
+# parse
+#   Parse the reST to a docutils doctree.
+# transform
+#   Apply docutils transforms to the doctree.
+# write
+#   Write the doctree as HTML.
+#
+# Before writing, this adds sync anchors, which begin with ``anchor_prefix``, to the doctree. It returns ``(html, position map)``; see |position_map|. If ``parts`` is true, it returns the writer's dict of the parts of the HTML in place of the HTML. ``settings_overrides`` are applied after the usual settings. A backend which writes HTML itself, such as the Markdown backend, does so in the convert phase.
+def render_phases(text, path, warning_stream, on_phase, anchor_prefix=ANCHOR_PREFIX, settings_overrides=None, parts=False):
+    on_phase('lexer')
+    source = Source(text, path, lex_cache)
+    backend = render_backends.choose(source)
+    backend_renders.inc(backend=backend.name)
+
+    def publish(rest):
+        on_phase('parse')
+        pub = core.Publisher(
+            doctree_cache.reader(), Parser(), Writer(),
+            source_class=docutils_io.StringInput,
+            destination_class=docutils_io.StringOutput
+        )
+        settings = html_settings(warning_stream)
+        settings.update(settings_overrides or {})
+        pub.process_programmatic_settings(None, settings, None)
+        pub.set_source(rest)
+        pub.set_destination()
+        pub.document = pub.reader.read(pub.source, pub.parser, pub.settings)
+
+        on_phase('transform')
+        pub.apply_transforms()
+        position_map = add_sync_anchors(pub.document, len(text.splitlines()), anchor_prefix)
+
+        on_phase('write')
+        html = pub.writer.write(pub.document, pub.destination)
+        if parts:
+            pub.writer.assemble_parts()
+            return pub.writer.parts, position_map
+        return html, position_map
+
+    on_phase('convert')
+    return backend.render(source, publish, anchor_prefix, parts)
+
+
+# The tokens of code blocks lexed by render_phases_, shared by all renders in this process; see |lex_cache|.
+lex_cache = LexCache()
+# Likewise, the doctrees of blocks of reST; see |doctree_cache|.
+doctree_cache = DoctreeCache()
+# The backends which render_phases_ chooses from.
+render_backends = default_backends()
+
+
+# .. _render_preview:
+#
+# Render a preview of about ``preview_lines`` lines of ``text`` around the 1-based ``line``, extending it to blank lines where possible so that comments and code blocks aren't split. Return ``(html, position map)``; the map gives lines in the whole text.
+def render_preview(text, path, line, preview_lines):
+    lines = text.splitlines(True)
+    start = max(0, min(line - 1 - preview_lines//2, len(lines) - preview_lines))
+    end = min(len(lines), start + preview_lines)
+    # Look at most this many lines for a blank line.
+    slack = preview_lines//4
+    for start in range(start, max(start - slack, 0) - 1, -1):
+        if not lines[start].strip():
+            break
+    for end in range(end, min(end + slack, len(lines))):
+        if not lines[end].strip():
+            break
+    html, position_map = render_phases("".join(lines[start:end]), path, io.StringIO(), lambda phase_name: None)
+    return html, position_map.offset(start, len(lines))
+
+
+# Render one block of a windowed render (see |window|), returning ``(the writer's dict of parts of the HTML, position map)``. Warnings are discarded. Since a block is part of a document, the first section title of a block isn't made the title of the document.
+def render_block(text, path, anchor_prefix):
+    return render_phases(
+        text, path, io.StringIO(), lambda phase_name: None, anchor_prefix, {"doctitle_xform": False}, parts=True
+    )
+
+
+# The style sheets included in each render.
+STYLESHEETS = Writer.default_stylesheets + ["CodeChat.css"]
+
+
+# Return the Docutils settings used by ``code_to_html_string``, which write warnings and errors to ``warning_stream``.
+def html_settings(warning_stream):
+    return {
+        # Include our custom css file: provide the path to the default css and
+        # then to our css. The style sheet dirs must include docutils defaults.
+        "stylesheet_path": ",".join(STYLESHEETS),
+        "stylesheet_dirs": Writer.default_stylesheet_dirs + html_static_path(),
+        # Make sure to use Unicode everywhere.
+        "output_encoding": "unicode",
+        "input_encoding": "unicode",
+        # Don't stop processing, no matter what.
+        "halt_level": 5,
+        # Capture errors to a string and return it.
+        "warning_stream": warning_stream,
+    }
+
+
+# A file-like object which streams build output (warnings and errors) to a web view's results queue as ``build`` results while a render runs, along with phase markers as ``status`` results. To avoid flooding the web view when a render produces many warnings, build output is sent at most once every ``min_interval`` seconds; anything written in between is batched.
+class ResultStreamWriter:
+    def __init__(self, results, min_interval=0.25):
+        self.results = results
+        self.min_interval = min_interval
+        self.start_time = time.perf_counter()
+        # A list of ``(phase name, seconds since the render began)`` for each phase reported.
+        self.phase_times = []
+        self._pending = []
+        self._last_put = 0
+
+    def write(self, s):
+        self._pending.append(s)
+        self._put_pending(False)
+
+    # Docutils may flush after each message; this still honors the rate limit.
+    def flush(self):
+        self._put_pending(False)
+
+    # Report the start of a phase, after sending all pending build output. ``time`` gives the number of seconds since the render began.
+    def phase(self, phase_name):
+        phase_time = time.perf_counter() - self.start_time
+        self.phase_times.append((phase_name, phase_time))
+        self._put_pending(True)
+        self.status(phase=phase_name, time=round(phase_time, 4))
+
+    # Send a status result; the status is JSON-encoded.
+    def status(self, **kwargs):
+        self.results.put(make_result(Get_Result_Type.status, json.dumps(kwargs)))
+
+    def _put_pending(self, force):
+        now = time.perf_counter()
+        if self._pending and (force or now - self._last_put >= self.min_interval):
+            self.results.put(make_result(Get_Result_Type.build, "".join(self._pending)))
+            self._pending = []
+            self._last_put = now
+
+
+# Results
+# =======
+# .. _CompactResult:
+#
+# A ``Get_Result_Return`` which takes less memory and is cheaper to send. A render's HTML may be megabytes, and every web view showing a client is sent the same result, so this stores the text only once, already encoded as a JSON string in UTF-8, which is how the Web_Sync service sends it. ``write`` copies those bytes to the wire instead of escaping the text again for each web view, one character at a time, as ``TJSONProtocol`` does. Slots avoid a ``__dict__`` for each result.
+class CompactResult:
+    __slots__ = ("gr_type", "quality", "json_text")
+    thrift_spec = Get_Result_Return.thrift_spec
+
+    def __init__(self, gr_type, text, quality=None):
+        self.gr_type = gr_type
+        self.quality = quality
+        self.json_text = json.dumps(text, ensure_ascii=False).encode("utf-8")
+
+    @property
+    def text(self):
+        return json.loads(self.json_text)
+
+    # This writes the same fields as ``Get_Result_Return.write``.
+    def write(self, oprot):
+        if not isinstance(oprot, TJSONProtocol.TJSONProtocolBase):
+            Get_Result_Return(self.gr_type, self.text, self.quality).write(oprot)
+            return
+        oprot.writeStructBegin('Get_Result_Return')
+        oprot.writeFieldBegin('gr_type', TType.I32, 1)
+        oprot.writeI32(self.gr_type)
+        oprot.writeFieldEnd()
+        oprot.writeFieldBegin('text', TType.STRING, 2)
+        # This is ``writeString`` without the escaping. A ChunkBuffer_ sends these bytes as they are.
+        oprot.context.write()
+        getattr(oprot.trans, "write_shared", oprot.trans.write)(self.json_text)
+        oprot.writeFieldEnd()
+        if self.quality is not None:
+            oprot.writeFieldBegin('quality', TType.I32, 3)
+            oprot.writeI32(self.quality)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def __repr__(self):
+        return "CompactResult(gr_type={}, {} bytes, quality={})".format(self.gr_type, len(self.json_text), self.quality)
+
+
+# Results are never changed once made, so short ones, such as the phase markers sent during every render, are shared.
+SHARED_RESULT_LENGTH = 64
+_shared_result = functools.lru_cache(maxsize=256)(CompactResult)
+
+
+# .. _make_result:
+#
+# Return a CompactResult_ for a web view.
+def make_result(gr_type, text, quality=None):
+    if len(text) <= SHARED_RESULT_LENGTH:
+        return _shared_result(gr_type, text, quality)
+    return CompactResult(gr_type, text, quality)
+
+
+# .. _ChunkBuffer:
+#
+# A transport which collects a Web_Sync response as a list of chunks. The text of a CompactResult_ becomes a chunk of its own, without being copied, so that every web view's response shares the one copy of a render's HTML.
+class ChunkBuffer(TTransport.TTransportBase):
+    def __init__(self):
+        self._chunks = []
+        self._buffer = bytearray()
+
+    def write(self, buf):
+        self._buffer += buf
+
+    # Add ``data``, which must not change, as a chunk.
+    def write_shared(self, data):
+        self._end_chunk()
+        self._chunks.append(data)
+
+    def flush(self):
+        pass
+
+    # Return a list of the chunks written.
+    def getchunks(self):
+        self._end_chunk()
+        return self._chunks
+
+    def _end_chunk(self):
+        if self._buffer:
+            self._chunks.append(bytes(self._buffer))
+            self._buffer = bytearray()
+
+
+# .. _ResultChannel:
+#
+# The results for one client, fanned out to every web view showing that client. Each web view, identified by its ``viewer_id``, has its own queue of results. A web view which begins polling after the client was created first receives the results of the last complete render and the render in progress, plus the latest sync request, so that it shows the current HTML immediately. Results aren't queued for a hidden web view; when it's shown, it receives these, as a new web view does. The queue for a web view which stops polling is discarded after ``viewer_timeout`` seconds; since a hidden web view stops polling until it's shown, its queue is kept for ``hidden_viewer_timeout`` seconds after it was hidden. If it's shown after that, it's added again, as a new web view.
+class ResultChannel:
+    def __init__(self, viewer_timeout=60, hidden_viewer_timeout=3600):
+        self.viewer_timeout = viewer_timeout
+        self.hidden_viewer_timeout = hidden_viewer_timeout
+        self._lock = threading.Lock()
+        # Maps a viewer_id to ``[results queue, time of its last poll, number of polls waiting, True if it's shown]``.
+        self._viewers = {}
+        # The results of the last complete render, and of the render in progress.
+        self._last_render = []
+        self._this_render = []
+        # The latest sync request, in a list if there is one.
+        self._last_sync = []
+        self._closed = False
+
+    def put(self, result):
+        with self._lock:
+            # A new web view doesn't need old sync requests, which would otherwise accumulate while the cursor moves between renders.
+            if result.gr_type == Get_Result_Type.sync:
+                self._last_sync = [result]
+            else:
+                self._this_render.append(result)
+            if result.gr_type == Get_Result_Type.html:
+                self._last_render = self._this_render
+                self._this_render = []
+            self._expire_viewers()
+            for viewer in self._viewers.values():
+                if viewer[3]:
+                    viewer[0].put(result)
+
+    # Return the next result for the given web view, waiting until one is available. Return None once the channel is closed.
+    def get(self, viewer_id):
+        with self._lock:
+            if self._closed:
+                return None
+            viewer = self._viewer(viewer_id)
+            viewer[2] += 1
+        try:
+            result = viewer[0].get()
+            if result is None:
+                # Wake any other polls waiting on this queue.
+                viewer[0].put(None)
+            return result
+        finally:
+            with self._lock:
+                viewer[1] = time.monotonic()
+                viewer[2] -= 1
+
+    # Add the given web view, if it's new.
+    def add_viewer(self, viewer_id):
+        with self._lock:
+            self._expire_viewers()
+            self._viewer(viewer_id)
+
+    # Record whether the given web view is shown. Hiding it discards the results it hasn't received.
+    def set_visible(self, viewer_id, visible):
+        with self._lock:
+            if self._closed:
+                return
+            self._expire_viewers()
+            viewer = self._viewer(viewer_id)
+            if visible and not viewer[3]:
+                for result in self._current_results():
+                    viewer[0].put(result)
+            elif not visible:
+                while not viewer[0].empty():
+                    viewer[0].get_nowait()
+                # Time the hidden web view's expiry from now.
+                viewer[1] = time.monotonic()
+            viewer[3] = visible
+
+    # Return True if there are web views, but none are shown.
+    def hidden(self):
+        with self._lock:
+            self._expire_viewers()
+            return bool(self._viewers) and not any(viewer[3] for viewer in self._viewers.values())
+
+    # Wake all waiting web views; later calls to ``get`` return None.
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for viewer in self._viewers.values():
+                viewer[0].put(None)
+
+    # Return a dict of ``{viewer_id: number of results waiting}``.
+    def backlog(self):
+        with self._lock:
+            return {viewer_id: viewer[0].qsize() for viewer_id, viewer in self._viewers.items()}
+
+    # The caller must hold ``_lock``.
+    def _viewer(self, viewer_id):
+        viewer = self._viewers.get(viewer_id)
+        if viewer is None:
+            viewer = self._viewers[viewer_id] = [Queue(), time.monotonic(), 0, True]
+            for result in self._current_results():
+                viewer[0].put(result)
+        return viewer
+
+    # The results which bring a new or newly shown web view up to date. The caller must hold ``_lock``.
+    def _current_results(self):
+        return self._last_render + self._this_render + self._last_sync
+
+    # The caller must hold ``_lock``.
+    def _expire_viewers(self):
+        now = time.monotonic()
+        for viewer_id, (_, last_poll, waiting, visible) in list(self._viewers.items()):
+            if not waiting and now - last_poll > (self.viewer_timeout if visible else self.hidden_viewer_timeout):
+                del self._viewers[viewer_id]
+
+
+# .. _RenderProfiler:
+#
+# Profiling
+# =========
+# When enabled by the ``--profile`` command-line option, this reports the time spent in each phase of every render (see render_phases_), plus the time to enqueue the results, including serializing the HTML as ``web_sync_service`` would. These timings are sent to the web view as a status with a ``profile`` key and written to the log. In addition, every ``cprofile_every``\ th render may be run under cProfile, saving its stats in ``cprofile_dir``.
+class RenderProfiler:
+    def __init__(self, cprofile_every=0, cprofile_dir='.'):
+        self.cprofile_every = cprofile_every
+        self.cprofile_dir = cprofile_dir
+        self._render_counter = itertools.count(1)
+
+    # Call this when a render begins; pass the returned state to ``end``.
+    def begin(self):
+        render_number = next(self._render_counter)
+        cprofile = None
+        if self.cprofile_every and render_number % self.cprofile_every == 0:
+            cprofile = cProfile.Profile()
+            cprofile.enable()
+        return render_number, cprofile
+
+    # Call this in place of ``end`` if the render fails.
+    def cancel(self, state):
+        render_number, cprofile = state
+        if cprofile:
+            cprofile.disable()
+
+    # Call this when the render is done, before enqueueing its HTML.
+    def end(self, state, stream, path, text, html_result):
+        render_number, cprofile = state
+        if cprofile:
+            cprofile.disable()
+            prof_path = os.path.join(
+                self.cprofile_dir,
+                "render-{}-{}.prof".format(render_number, os.path.basename(path))
+            )
+            cprofile.dump_stats(prof_path)
+            logger.info("Saved cProfile stats for render %d in %s.", render_number, prof_path)
+
+        otrans = TTransport.TMemoryBuffer()
+        html_result.write(TJSONProtocol.TJSONProtocol(otrans))
+
+        # Compute the duration of each phase from the time the next phase began. The phase after ``done`` is enqueueing the results.
+        phase_times = stream.phase_times + [('', time.perf_counter() - stream.start_time)]
+        profile = {}
+        for (phase_name, phase_time), (_, next_time) in zip(phase_times, phase_times[1:]):
+            profile['enqueue' if phase_name == 'done' else phase_name] = round(next_time - phase_time, 4)
+        profile['total'] = round(phase_times[-1][1], 4)
+
+        stream.status(
+            profile=profile, path=path, characters=len(text),
+            html_bytes=len(otrans.getvalue())
+        )
+        logger.info(
+            "Render %d of %s (%d characters): %s.", render_number, path, len(text),
+            ", ".join("{} {:.4f} s".format(k, v) for k, v in profile.items())
+        )
+
+
+# Give a worker process of `render_batch`_ the server's settings, which a spawned process doesn't inherit.
+def init_render_process(lex_cache_chars, doctree_cache_chars, enabled_backends):
+    lex_cache.max_chars = lex_cache_chars
+    doctree_cache.max_chars = doctree_cache_chars
+    render_backends.enabled = enabled_backends
+
+
+# Render the file at ``path``; `render_batch`_ runs this in a worker process. Return ``(path, text, (html, position map), seconds, error)``. If the file can't be rendered, the render is None and the error gives the reason; otherwise, the error is empty.
+def render_file(path):
+    start = time.perf_counter()
+    text = render = None
+    error = ''
+    try:
+        text = file_contents(path)
+        render = render_phases(text, path, io.StringIO(), lambda phase_name: None)
+    except KeyError:
+        error = 'This file is not supported by CodeChat.'
+    except Exception as e:
+        error = '{}: {}'.format(type(e).__name__, e)
+    return path, text, render, time.perf_counter() - start, error
+
+
+# Return a path in a form which compares equal for the same file, whether it came from an editor or the FileWatcher.
+def _normalize_path(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
 # Utility function to return the contents of a given file.
 def file_contents(file_path):
     with open(file_path, encoding="utf-8") as f:
@@ -139,19 +1235,17 @@ def file_contents(file_path):
 
 # Servers
 # =======
-# Server for the CodeChat editor extension service.
-def editor_extension_service():
-    transport = TSocket.TServerSocket(host='127.0.0.1', port=9090)
+# Server for the CodeChat editor extension service. Given ``unix_socket``, this listens on that Unix socket instead of ``host`` and ``port``.
+def editor_extension_service(host='127.0.0.1', port=9090, unix_socket=None):
+    transport = TSocket.TServerSocket(host=host, port=port, unix_socket=unix_socket)
     tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
     processor = Editor_Extension.Processor(handler)
 
-    # You could do one of these for a multithreaded server
-    ## server = TServer.TThreadedServer(
-    ##     processor, transport, tfactory, pfactory)
-    ## server = TServer.TThreadPoolServer(
-    ##     processor, transport, tfactory, pfactory)
-    server = TServer.TSimpleServer(processor, transport, tfactory, pfactory)
+    # Use a thread per connection, so that several editors may connect at once.
+    server = TServer.TThreadedServer(
+        processor, transport, tfactory, pfactory, daemon=True
+    )
     print('Starting the server...')
     server.serve()
 
@@ -163,21 +1257,175 @@ app = Flask(__name__)
 # See max ages at https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Max-Age.
 @cross_origin(max_age=100000)
 def web_sync_service():
+    return app.response_class(process_web_sync(request.data))
+
+
+# Process the Web_Sync request ``data``, returning the response as a list of chunks; see ChunkBuffer_.
+@web_sync_seconds.time()
+def process_web_sync(data):
     processor = Web_Sync.Processor(handler)
     protocol = TJSONProtocol.TJSONProtocolFactory()
     server = TServer.TServer(processor, None, None, None, protocol, protocol)
-    itrans = TTransport.TMemoryBuffer(request.data)
-    otrans = TTransport.TMemoryBuffer()
+    itrans = TTransport.TMemoryBuffer(data)
+    # Results are encoded when they're made, so this only encodes the framing around them; see CompactResult_.
+    otrans = ChunkBuffer()
     iprot = server.inputProtocolFactory.getProtocol(itrans)
     oprot = server.outputProtocolFactory.getProtocol(otrans)
     server.processor.process(iprot, oprot)
-    return make_response(otrans.getvalue())
+    chunks = otrans.getchunks()
+    web_sync_response_bytes.inc(sum(len(chunk) for chunk in chunks))
+    return chunks
+
+
+# Serve the Web_Sync service to the router (see |router|) through the Unix socket at ``path``. Each connection carries one request, then its response; each is preceded by its length, packed by ``FRAME``.
+def web_sync_socket_service(path):
+    class WebSyncRequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            header = self.rfile.read(FRAME.size)
+            if len(header) < FRAME.size:
+                return
+            chunks = process_web_sync(self.rfile.read(FRAME.unpack(header)[0]))
+            self.wfile.write(FRAME.pack(sum(len(chunk) for chunk in chunks)))
+            for chunk in chunks:
+                self.wfile.write(chunk)
+
+    if os.path.exists(path):
+        os.remove(path)
+    server = socketserver.ThreadingUnixStreamServer(path, WebSyncRequestHandler)
+    server.daemon_threads = True
+    server.serve_forever()
+
+
+# .. _metrics_service:
+#
+# Provide server metrics in the `Prometheus text format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_.
+@app.route('/metrics', methods=['GET'])
+def metrics_service():
+    return make_response(registry.prometheus_text(), 200, {
+        "Content-Type": "text/plain; version=0.0.4; charset=utf-8"
+    })
+
+
+# Provide a JSON snapshot of the server metrics.
+@app.route('/metrics.json', methods=['GET'])
+def metrics_json_service():
+    return jsonify(registry.snapshot())
 
 
 # Main
 # ====
 # Run both servers.
 if __name__ == '__main__':
-    t = threading.Thread(target=editor_extension_service)
-    t.start()
-    app.run()
+    parser = argparse.ArgumentParser(description="The CodeChat rendering server.")
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="Report the time spent in each phase of every render."
+    )
+    parser.add_argument(
+        '--cprofile-every', type=int, default=0, metavar='N',
+        help="With --profile, also run every Nth render under cProfile."
+    )
+    parser.add_argument(
+        '--cprofile-dir', default='.',
+        help="The directory in which to save cProfile stats."
+    )
+    parser.add_argument(
+        '--workspace-memory-mb', type=float, default=256,
+        help="Memory for the renders of documents open in an editor but not shown, in MB."
+    )
+    parser.add_argument(
+        '--watch', metavar='DIR',
+        help="Render files in this directory as they change on disk, including files no editor has open."
+    )
+    parser.add_argument(
+        '--watch-polling', action='store_true',
+        help="With --watch, poll for changes instead of using inotify."
+    )
+    parser.add_argument(
+        '--lex-cache-mb', type=float, default=8, metavar='MB',
+        help="Keep the tokens of about this many MB of code, so unchanged code isn't lexed again; 0 disables this."
+    )
+    parser.add_argument(
+        '--doctree-cache-mb', type=float, default=2, metavar='MB',
+        help="Keep the doctrees of about this many MB of reST, so unchanged comments aren't parsed again; 0 disables this."
+    )
+    parser.add_argument(
+        '--render-backends', nargs='+', choices=render_backends.names(), metavar='NAME',
+        help="Render only with these backends, plus codechat for files they don't accept; by default, any of {} may be chosen.".format(
+            ", ".join(render_backends.names())
+        )
+    )
+    parser.add_argument(
+        '--render-workers', type=int, metavar='N',
+        help="The number of processes used to render files in a batch; by default, one per CPU."
+    )
+    parser.add_argument(
+        '--render-threads', type=int, default=2, metavar='N',
+        help="The number of threads rendering changes from editors and web views."
+    )
+    parser.add_argument(
+        '--max-queued', type=int, default=4, metavar='N',
+        help="Show a quick highlight in place of a render while more than N clients wait for renders."
+    )
+    parser.add_argument(
+        '--preview-min-lines', type=int, default=1000, metavar='N',
+        help="Before rendering a document of at least N lines, show a preview of the lines near the cursor; 0 disables previews."
+    )
+    parser.add_argument(
+        '--window-min-lines', type=int, default=20000, metavar='N',
+        help="Render a document of at least N lines in blocks, as the web view scrolls to them; 0 disables this."
+    )
+    parser.add_argument(
+        '--editor-socket', metavar='PATH',
+        help="Also serve editors through a Unix socket at PATH."
+    )
+    parser.add_argument(
+        '--web-socket', metavar='PATH',
+        help="Also serve web views through a Unix socket at PATH, such as for a reverse proxy."
+    )
+    parser.add_argument(
+        '--session', metavar='FILE',
+        help="Restore clients and their last renders from FILE on startup, then save them there periodically."
+    )
+    parser.add_argument(
+        '--session-interval', type=float, default=10, metavar='SECONDS',
+        help="With --session, save clients at most every SECONDS seconds."
+    )
+    parser.add_argument(
+        '--router-socket', metavar='PATH',
+        help="Run as a worker of router.py, serving both services through Unix sockets at PATH.editor and PATH.web."
+    )
+    args = parser.parse_args()
+    if args.session and args.router_socket:
+        # The router assigns the IDs, and would assign restored IDs again.
+        parser.error("--session can't be used with --router-socket.")
+    handler.workspace_cache.memory_budget = args.workspace_memory_mb*2**20
+    handler.render_workers = args.render_workers
+    lex_cache.max_chars = int(args.lex_cache_mb*2**20)
+    doctree_cache.max_chars = int(args.doctree_cache_mb*2**20)
+    if args.render_backends:
+        render_backends.enabled = set(args.render_backends)
+    handler.render_queue.threads = args.render_threads
+    handler.render_queue.max_queued = args.max_queued
+    handler.preview_min_lines = args.preview_min_lines
+    handler.window_min_lines = args.window_min_lines
+    if args.profile:
+        logging.basicConfig(level=logging.INFO)
+        handler.profiler = RenderProfiler(args.cprofile_every, args.cprofile_dir)
+    if args.session:
+        handler.restore_clients(read_snapshot(args.session))
+        SessionSaver(args.session, handler.session_clients, args.session_interval).start()
+    if args.watch:
+        FileWatcher(args.watch, handler.render_changed_files, args.watch_polling).start()
+
+    if args.router_socket:
+        threading.Thread(target=editor_extension_service, kwargs=dict(unix_socket=args.router_socket + ".editor")).start()
+        web_sync_socket_service(args.router_socket + ".web")
+    else:
+        t = threading.Thread(target=editor_extension_service)
+        t.start()
+        if args.editor_socket:
+            threading.Thread(target=editor_extension_service, kwargs=dict(unix_socket=args.editor_socket), daemon=True).start()
+        if args.web_socket:
+            threading.Thread(target=make_server("unix://" + args.web_socket, 0, app, threaded=True).serve_forever, daemon=True).start()
+        app.run()
@@ -2,24 +2,373 @@ function run_client(id) {
     var transport = new Thrift.TXHRTransport("http://127.0.0.1:5000");
     var protocol  = new Thrift.TJSONProtocol(transport);
     var client    = new Web_SyncClient(protocol);
+    // Sync requests use their own transport, since ``get_result`` is nearly always waiting on the one above.
+    var sync_client = new Web_SyncClient(new Thrift.TJSONProtocol(new Thrift.TXHRTransport("http://127.0.0.1:5000")));
+    // Likewise, editing uses its own transport, since ``request_ownership`` waits for the editor.
+    var edit_client = new Web_SyncClient(new Thrift.TJSONProtocol(new Thrift.TXHRTransport("http://127.0.0.1:5000")));
+    // Style sheets are fetched with their own transport, since a render waits for them.
+    var asset_transport = new Thrift.TXHRTransport("http://127.0.0.1:5000");
+    var asset_client = new Web_SyncClient(new Thrift.TJSONProtocol(asset_transport));
+    // The text of each style sheet the server removed from the HTML it sent, by name; these are fetched once.
+    var assets = {};
     var status_div = document.getElementById("status");
     var outputElement = document.getElementById("output");
     var build_div = document.getElementById("build");
+    // The HTML is always the last result of a render, except for a preview, which the full render follows. Therefore, the next received build output or status starts a new render, or continues one after a preview; either way, any build output shown is from an earlier render, so it should be cleared.
+    var b_clear_output = true;
+    // Several web views may show the same client; each needs its own viewer ID to receive every result.
+    var viewer_id = Math.floor(Math.random()*0x7fffffff) + 1;
+    // The last sync request from the editor; it's applied again after each render loads, so the web view stays at the editor's cursor.
+    var last_sync = null;
+    // For a windowed render, its version; otherwise, null.
+    var window_version = null;
+    // Blocks received while the render they belong to loads; null once it's loaded.
+    var pending_blocks = null;
+    // True while a ``get_result`` call is waiting, or about to be made.
+    var b_polling = false;
+    // True once the server stopped this client.
+    var b_stopped = false;
 
     function do_get_result() {
-        client.get_result(id, function(result) {
+        b_polling = true;
+        // If the request fails, the transport would otherwise parse the previous response again.
+        transport.setRecvBuffer("");
+        client.get_result(id, viewer_id, function(result) {
+            if (!(result instanceof Get_Result_Return)) {
+                // The server is unreachable, perhaps restarting; if it restores this client, the web view continues from its last render.
+                status_div.textContent = "Lost the connection to the server; reconnecting...";
+                setTimeout(poll, 1000);
+                return;
+            }
             if (result.gr_type == Get_Result_Type.html) {
-                outputElement.srcdoc = result.text;
+                b_clear_output = true;
+                window_version = null;
+                pending_blocks = [];
+                if (result.quality == Render_Quality.preview) {
+                    status_div.textContent = "Showing a preview; rendering the whole document...";
+                } else if (result.quality == Render_Quality.windowed) {
+                    // The version is recorded in the skeleton.
+                    var match = result.text.match(/data-codechat-version="(\d+)"/);
+                    window_version = match && Number(match[1]);
+                }
+                queue_html(result.text);
             } else if (result.gr_type == Get_Result_Type.build) {
-                build_div.innerHTML = result.text;
+                start_render_output();
+                // Build output is streamed in pieces while the render runs.
+                build_div.textContent += result.text;
             } else if (result.gr_type == Get_Result_Type.status) {
-                status_div.innerHTML = result.text;
+                if (JSON.parse(result.text).stopped) {
+                    // The server stopped this client, so stop polling.
+                    status_div.textContent = "Stopped.";
+                    b_polling = false;
+                    b_stopped = true;
+                    return;
+                }
+                start_render_output();
+                show_status(result.text);
+            } else if (result.gr_type == Get_Result_Type.sync) {
+                scroll_to_anchor(JSON.parse(result.text));
+            } else if (result.gr_type == Get_Result_Type.block) {
+                fill_block(JSON.parse(result.text));
             } else {
                 console.log("Unknown Get_Result_Type:", result.gr_type);
             }
 
-            do_get_result();
+            poll();
+        });
+    }
+
+    // Poll for the next result, unless this page is hidden.
+    function poll() {
+        if (document.visibilityState === "hidden") {
+            b_polling = false;
+            return;
+        }
+        do_get_result();
+    }
+
+    // Showing HTML
+    // ------------
+    // Results may arrive faster than the browser can show them. So, keep only the latest HTML not yet shown, then show it at the browser's next frame, once any HTML shown before it has loaded. Browsers don't run frames for a hidden page, so nothing is shown until the page is visible.
+    var pending_html = null;
+    // True from when HTML is queued until the latest HTML has loaded.
+    var b_showing_html = false;
+
+    function queue_html(html) {
+        pending_html = html;
+        if (!b_showing_html) {
+            b_showing_html = true;
+            requestAnimationFrame(show_pending_html);
+        }
+    }
+
+    // Show the pending HTML, first putting back the style sheets the server removed.
+    function show_pending_html() {
+        var html = pending_html;
+        if (html === null) {
+            return;
+        }
+        fetch_assets(html, function() {
+            if (pending_html !== html) {
+                // Newer HTML arrived while fetching style sheets; show it instead.
+                requestAnimationFrame(show_pending_html);
+                return;
+            }
+            pending_html = null;
+            outputElement.srcdoc = html.replace(ASSET_RE, function(tag, name) {
+                return '<style type="text/css">' + assets[name] + "</style>";
+            });
+        });
+    }
+
+    // Fetch the style sheets of ``html`` not yet fetched, then call ``done``.
+    var ASSET_RE = /<style data-codechat-asset="([0-9a-f]+)"><\/style>/g;
+    function fetch_assets(html, done) {
+        var match;
+        ASSET_RE.lastIndex = 0;
+        while ((match = ASSET_RE.exec(html)) !== null) {
+            if (!(match[1] in assets)) {
+                var name = match[1];
+                asset_transport.setRecvBuffer("");
+                asset_client.get_asset(id, name, function(text) {
+                    // If the request failed, show the HTML without this style sheet.
+                    assets[name] = typeof text === "string" ? text : "";
+                    fetch_assets(html, done);
+                });
+                return;
+            }
+        }
+        done();
+    }
+
+    function start_render_output() {
+        if (b_clear_output) {
+            build_div.textContent = "";
+            b_clear_output = false;
+        }
+    }
+
+    // Scroll the rendered HTML to show the element with the given anchor, moving down ``line_offset`` lines if it's a code block.
+    function scroll_to_anchor(sync) {
+        last_sync = sync;
+        var doc = outputElement.contentDocument;
+        var element = doc && doc.getElementById(sync.anchor);
+        if (!element) {
+            // The HTML hasn't loaded yet; this is applied when it does.
+            return;
+        }
+        var rect = element.getBoundingClientRect();
+        var y = rect.top + doc.defaultView.scrollY;
+        if (element.tagName == "PRE") {
+            y += rect.height*sync.line_offset/element.textContent.split("\n").length;
+        } else if (element.classList.contains("CodeChat-placeholder")) {
+            // Estimate the line's position in a block not yet rendered; this scroll requests the block, which is scrolled to when it arrives.
+            y += rect.height*sync.line_offset/Number(element.dataset.lines);
+        }
+        // Place the line a third of the way down the web view.
+        doc.defaultView.scrollTo(0, y - doc.defaultView.innerHeight/3);
+    }
+
+    // Windowed renders
+    // ----------------
+    // Request the blocks of a windowed render within a screen of the part shown.
+    function request_blocks() {
+        var doc = outputElement.contentDocument;
+        if (window_version === null || !doc) {
+            return;
+        }
+        var height = doc.defaultView.innerHeight;
+        var indices = [];
+        doc.querySelectorAll(".CodeChat-placeholder").forEach(function(element) {
+            var rect = element.getBoundingClientRect();
+            if (rect.bottom > -height && rect.top < 2*height) {
+                indices.push(Number(element.dataset.index));
+            }
         });
+        if (indices.length) {
+            sync_client.set_viewport(id, window_version, Math.min.apply(null, indices), Math.max.apply(null, indices), function() {});
+        }
+    }
+
+    // Request blocks at most every 100 ms while scrolling.
+    var request_timer = null;
+    function on_scroll() {
+        if (request_timer === null) {
+            request_timer = setTimeout(function() {
+                request_timer = null;
+                request_blocks();
+            }, 100);
+        }
+    }
+
+    // Replace a block's placeholder with the block.
+    function fill_block(block) {
+        if (pending_blocks !== null) {
+            pending_blocks.push(block);
+            return;
+        }
+        var doc = outputElement.contentDocument;
+        var element = doc && doc.getElementById("CodeChat-block-" + block.index);
+        if (block.version !== window_version || !element || !element.classList.contains("CodeChat-placeholder")) {
+            return;
+        }
+        element.innerHTML = block.html;
+        element.classList.remove("CodeChat-placeholder");
+        element.style.minHeight = "";
+        // Scroll to the editor's cursor again if it's in this block, now that its position is known.
+        if (last_sync && last_sync.anchor == element.id) {
+            scroll_to_anchor(last_sync);
+        }
+        // Filling this may have moved other placeholders into view.
+        on_scroll();
+    }
+
+    // Return the ids of ``element`` and its ancestors, innermost first, separated by spaces. Most anchors begin with ``CodeChat-sync-``, but an element which already had an id is anchored by that id, so the server chooses the anchor from these.
+    function anchor_ids(element) {
+        var ids = [];
+        for (; element; element = element.parentElement) {
+            if (element.id) {
+                ids.push(element.id);
+            }
+        }
+        return ids.join(" ");
+    }
+
+    // Move the editor's cursor to the source of the clicked element.
+    function sync_editor(event) {
+        var element = event.target.closest("[id]");
+        if (!element) {
+            return;
+        }
+        var line_offset = 0;
+        var doc = outputElement.contentDocument;
+        var selection = doc.getSelection();
+        if (element.tagName == "PRE" && selection.rangeCount) {
+            // Count the lines in the code block before the click.
+            var range = doc.createRange();
+            range.setStart(element, 0);
+            range.setEnd(selection.anchorNode, selection.anchorOffset);
+            line_offset = range.toString().split("\n").length - 1;
+        }
+        sync_client.sync_editor(id, anchor_ids(element), line_offset, function() {});
+    }
+
+    // Edit the source of the double-clicked element in place, once the editor grants ownership. Only that element's source is sent here, and only the changed lines are sent back.
+    function edit_element(event) {
+        var element = event.target.closest("[id]");
+        if (!element) {
+            return;
+        }
+        status_div.textContent = "Waiting for the editor to allow editing...";
+        edit_client.request_ownership(id, anchor_ids(element), function(ownership) {
+            if (!ownership.granted) {
+                status_div.textContent = "The editor didn't allow editing.";
+                return;
+            }
+            // Edit the element whose source was sent, which may contain the one clicked.
+            element = outputElement.contentDocument.getElementById(ownership.anchor) || element;
+            status_div.textContent = "Editing: press Ctrl+Enter to save or Escape to cancel.";
+            var textarea = outputElement.contentDocument.createElement("textarea");
+            textarea.value = ownership.text;
+            textarea.rows = ownership.end_line - ownership.start_line + 1;
+            textarea.style.width = "100%";
+            textarea.style.fontFamily = "monospace";
+            element.replaceWith(textarea);
+            textarea.focus();
+
+            textarea.addEventListener("keydown", function(event) {
+                var edits = [];
+                if (event.key == "Enter" && event.ctrlKey) {
+                    var text = textarea.value;
+                    // Keep the line break which ends this element, so it doesn't join the next one.
+                    if (ownership.text.endsWith("\n") && !text.endsWith("\n")) {
+                        text += "\n";
+                    }
+                    if (text != ownership.text) {
+                        edits.push(new Text_Edit({
+                            start_line: ownership.start_line,
+                            end_line: ownership.end_line,
+                            text: text,
+                        }));
+                    }
+                } else if (event.key != "Escape") {
+                    return;
+                }
+                event.preventDefault();
+                if (!edits.length) {
+                    textarea.replaceWith(element);
+                }
+                // This returns ownership to the editor; the server then renders the edited document.
+                edit_client.edit_text(id, ownership.version, edits, function(ok) {
+                    if (ok !== true) {
+                        status_div.textContent = "The document changed in the editor, so this edit was discarded.";
+                        textarea.replaceWith(element);
+                    }
+                });
+            });
+        });
+    }
+
+    outputElement.addEventListener("load", function() {
+        if (pending_html !== null) {
+            // Newer HTML is waiting, so the blocks received belong to it.
+            requestAnimationFrame(show_pending_html);
+            return;
+        }
+        b_showing_html = false;
+        outputElement.contentDocument.addEventListener("click", sync_editor);
+        outputElement.contentDocument.addEventListener("dblclick", edit_element);
+        if (last_sync) {
+            scroll_to_anchor(last_sync);
+        }
+        var blocks = pending_blocks || [];
+        pending_blocks = null;
+        blocks.forEach(fill_block);
+        if (window_version !== null) {
+            outputElement.contentDocument.addEventListener("scroll", on_scroll);
+            on_scroll();
+        }
+    });
+
+    // The status is JSON-encoded.
+    function show_status(text) {
+        var status = JSON.parse(text);
+        if (status.overload === "degraded") {
+            // The server is busy; the render follows.
+            status_div.textContent = "The server is busy; showing highlighted source until the render is ready.";
+        } else if (status.overload === "rejected") {
+            status_div.textContent = "The server is too busy to render this change; it will render after your next change.";
+        } else if (status.cached) {
+            // The server showed a document's last render again.
+            status_div.textContent = "Shown from memory.";
+        } else if (status.phase === "done") {
+            status_div.textContent = "Rendered in " + status.time + " s.";
+        } else if (status.phase !== undefined) {
+            status_div.textContent = "Rendering: " + status.phase + "...";
+        } else if (status.profile !== undefined) {
+            // Timings from a server run with ``--profile``.
+            var timings = [];
+            for (var phase in status.profile) {
+                timings.push(phase + " " + status.profile[phase] + " s");
+            }
+            status_div.textContent += " Profile: " + timings.join(", ") + ".";
+        }
+    }
+
+    // Hidden pages
+    // ------------
+    // While this page is hidden, such as in a background tab or a collapsed panel, stop polling and tell the server, which doesn't render for this client until one of its web views is shown.
+    document.addEventListener("visibilitychange", function() {
+        var visible = document.visibilityState !== "hidden";
+        sync_client.set_visibility(id, viewer_id, visible, function() {});
+        if (visible && !b_polling && !b_stopped) {
+            do_get_result();
+        }
+    });
+
+    if (document.visibilityState === "hidden") {
+        sync_client.set_visibility(id, viewer_id, false, function() {});
+    } else {
+        do_get_result();
     }
-    do_get_result();
 }
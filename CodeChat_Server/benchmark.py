@@ -0,0 +1,552 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***********************************************
+# |docname| - Benchmarks for the rendering server
+# ***********************************************
+# This renders a corpus of synthetic source files, which vary in size and comment density, and reports the throughput, p50/p99 latency, memory high-water mark and bytes on the wire for each. It can drive the server in several ways:
+#
+# direct
+#   Call ``CodeChatHandler`` methods directly, measuring only the server's own work.
+# thrift
+#   Call ``start_render`` through the Editor_Extension service (binary protocol over a socket, port 9090 by default), then call ``get_result`` through the Web_Sync service (JSON over HTTP, port 5000 by default), as the VSCode extension and web client do.
+# unix
+#   Like thrift, but call the Editor_Extension service through the Unix socket given by ``--editor-socket``.
+# shared
+#   Like unix, but pass the text through shared memory, calling ``start_render_shared``; see |shared_text|.
+#
+# Each render is timed until the web view receives its full HTML. So that this is the only HTML, this turns off the server's previews and windowed renders of large documents; start an external server with ``--preview-min-lines 0 --window-min-lines 0`` to do the same. If previews are on, they aren't timed; a windowed render is timed instead of the full render.
+#
+# By default, this uses the direct and thrift modes. With ``--transfer``, it measures only the time taken to send each document to the server, without rendering it, to compare the ways of sending large documents.
+#
+# To compare the server's render backends, give several to ``--backends``; for example, ``python benchmark.py --mode direct --densities 0 0.5 --backends all codechat``.
+#
+# Unless ``--external`` is given, the modes other than direct run the servers in this process on the given ports. Run this from the ``CodeChat_Server`` directory; for example, ``python benchmark.py --json after.json --compare before.json``. Use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib.metadata import version, PackageNotFoundError
+import http.client
+import io
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # This isn't available on Windows.
+    resource = None
+
+# Third-party imports
+# -------------------
+from thrift.protocol import TBinaryProtocol, TJSONProtocol
+from thrift.transport import TSocket, TTransport, THttpClient
+from werkzeug.serving import make_server
+
+# Local application imports
+# -------------------------
+import CodeChatServer
+from CodeChat_Services import Editor_Extension, Web_Sync
+from CodeChat_Services.ttypes import Get_Result_Type, Render_Quality
+from shared_text import SharedTextWriter
+
+
+# Corpus
+# ======
+# Words used to build synthetic comments and identifiers.
+_WORDS = (
+    "render server client document comment code block editor view result "
+    "queue thread cache parse write lexer token index line value"
+).split()
+
+
+# Return the text of a synthetic Python source file with approximately ``lines`` lines, of which about ``comment_density`` (0 to 1) are reST comments. The same ``seed`` always produces the same file. With a density of 0, the file has no reST comments, though lines of code end with comments.
+def make_source(lines, comment_density, seed=0):
+    rand = random.Random(seed)
+    out = ["# Synthetic benchmark file", "# ==========================", ""] if comment_density else []
+    section = 0
+    while len(out) < lines:
+        if rand.random() < comment_density:
+            # A block of reST: sometimes a heading, then a paragraph with inline markup or a list.
+            if rand.random() < 0.1:
+                section += 1
+                title = "Section {}: {}".format(section, " ".join(rand.sample(_WORDS, 3)))
+                out += ["# " + title, "# " + "-"*len(title)]
+            for _ in range(rand.randint(1, 4)):
+                words = rand.sample(_WORDS, 8)
+                words[2] = "*{}*".format(words[2])
+                words[5] = "``{}``".format(words[5])
+                out.append("# " + " ".join(words) + ".")
+            if rand.random() < 0.3:
+                out.append("#")
+                out += ["# - " + " ".join(rand.sample(_WORDS, 4)) for _ in range(3)]
+            out.append("")
+        else:
+            # A block of code: a small function.
+            name = "_".join(rand.sample(_WORDS, 2)) + str(len(out))
+            out.append("def {}(x, y):".format(name))
+            for _ in range(rand.randint(2, 6)):
+                out.append("    x = x * {} + y  # {}".format(rand.randint(1, 99), rand.choice(_WORDS)))
+            out += ["    return x", ""]
+    return "\n".join(out[:lines]) + "\n"
+
+
+# The default corpus: each combination of these sizes (in lines) and comment densities.
+DEFAULT_SIZES = (100, 1000, 5000)
+DEFAULT_DENSITIES = (0.1, 0.5, 0.9)
+
+
+# Clients
+# =======
+# A transport wrapper which counts the bytes sent and received through it.
+class CountingTransport(TTransport.TTransportBase):
+    def __init__(self, trans):
+        self.trans = trans
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def isOpen(self):
+        return self.trans.isOpen()
+
+    def open(self):
+        return self.trans.open()
+
+    def close(self):
+        return self.trans.close()
+
+    def read(self, sz):
+        buf = self.trans.read(sz)
+        self.bytes_read += len(buf)
+        return buf
+
+    def write(self, buf):
+        self.bytes_written += len(buf)
+        self.trans.write(buf)
+
+    def flush(self):
+        self.trans.flush()
+
+
+# True if ``result`` is the last HTML of a render, rather than a preview of it.
+def is_final_html(result):
+    return result.gr_type == Get_Result_Type.html and result.quality in (None, Render_Quality.full, Render_Quality.windowed)
+
+
+# Call the handler directly. Each method returns the number of bytes sent and received, which is 0 here.
+class DirectClient:
+    name = "direct"
+
+    def __init__(self, args):
+        self.handler = CodeChatServer.handler
+        self.id = self.handler.render_client().id
+
+    def start_render(self, text, path):
+        self.handler.start_render(text, path, self.id)
+
+    # Wait for the last HTML produced by a render.
+    def wait_for_html(self):
+        while not is_final_html(self.handler.get_result(self.id, 0)):
+            pass
+
+    def wire_bytes(self):
+        return 0
+
+
+# Call the server through both Thrift endpoints.
+class ThriftClient:
+    name = "thrift"
+
+    def __init__(self, args):
+        self.editor_trans = CountingTransport(self.editor_socket(args))
+        self.editor_client = Editor_Extension.Client(
+            TBinaryProtocol.TBinaryProtocol(TTransport.TBufferedTransport(self.editor_trans))
+        )
+        self.editor_trans.open()
+        self.web_trans = CountingTransport(
+            THttpClient.THttpClient("http://{}:{}/".format(args.host, args.web_port))
+        )
+        self.web_client = Web_Sync.Client(TJSONProtocol.TJSONProtocol(self.web_trans))
+        self.id = self.editor_client.render_client().id
+
+    def start_render(self, text, path):
+        self.editor_client.start_render(text, path, self.id)
+
+    def wait_for_html(self):
+        while not is_final_html(self.web_client.get_result(self.id, 0)):
+            pass
+
+    def editor_socket(self, args):
+        return TSocket.TSocket(args.host, args.editor_port)
+
+    def wire_bytes(self):
+        return sum(
+            t.bytes_written + t.bytes_read for t in (self.editor_trans, self.web_trans)
+        )
+
+
+# Call the Editor_Extension service through a Unix socket.
+class UnixClient(ThriftClient):
+    name = "unix"
+
+    def editor_socket(self, args):
+        return TSocket.TSocket(unix_socket=args.editor_socket)
+
+
+# Also pass the text through shared memory; see |shared_text|.
+class SharedClient(UnixClient):
+    name = "shared"
+
+    def __init__(self, args):
+        super().__init__(args)
+        self.writer = SharedTextWriter()
+
+    def start_render(self, text, path):
+        data = text.encode("utf-8")
+        offset = self.writer.write(data)
+        if offset is None:
+            super().start_render(text, path)
+        else:
+            self.editor_client.start_render_shared(self.writer.name, offset, len(data), path, self.id)
+            self.writer.release(len(data))
+
+
+CLIENTS = {c.name: c for c in (DirectClient, ThriftClient, UnixClient, SharedClient)}
+
+
+# Run the editor and web servers in this process. The editor server also listens on the Unix socket given by ``--editor-socket`` only if a mode which uses it was chosen, since Unix sockets may not be available; load_test.py has neither option.
+def start_servers(args):
+    sockets = [TSocket.TSocket(args.host, args.editor_port)]
+    threading.Thread(
+        target=CodeChatServer.editor_extension_service,
+        args=(args.host, args.editor_port), daemon=True
+    ).start()
+    if set(getattr(args, "mode", ())) & {UnixClient.name, SharedClient.name}:
+        threading.Thread(
+            target=CodeChatServer.editor_extension_service,
+            kwargs=dict(unix_socket=args.editor_socket), daemon=True
+        ).start()
+        sockets.append(TSocket.TSocket(unix_socket=args.editor_socket))
+    # Don't log every request.
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    web_server = make_server(args.host, args.web_port, CodeChatServer.app, threaded=True)
+    threading.Thread(target=web_server.serve_forever, daemon=True).start()
+    # Wait for the editor servers to accept connections.
+    for sock in sockets:
+        for _ in range(100):
+            try:
+                sock.open()
+            except TTransport.TTransportException:
+                time.sleep(0.05)
+            else:
+                sock.close()
+                break
+        else:
+            raise RuntimeError("The editor server did not start.")
+
+
+# Benchmarks
+# ==========
+# Return the value at the given percentile (0 to 100) of a sorted list, using the nearest-rank method.
+def percentile(sorted_values, pct):
+    index = max(0, -(-len(sorted_values)*pct//100) - 1)
+    return sorted_values[int(index)]
+
+
+def max_rss_kb():
+    if resource is None:
+        return None
+    # Linux reports kilobytes; macOS reports bytes.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+# Return ``text`` with trailing spaces added to its middle line, a different number for each ``iteration``, so that each render changes one part of the document, as typing does.
+def edit_text(text, iteration):
+    lines = text.split("\n")
+    middle = len(lines)//2
+    lines[middle] += " "*(iteration + 1)
+    return "\n".join(lines)
+
+
+# Render one document ``iterations`` times after ``warmup`` renders, returning a dict of results. If ``edit`` is true, change the document before each render.
+def run_case(client, text, path, iterations, warmup, use_tracemalloc, edit=False):
+    for iteration in range(warmup):
+        client.start_render(edit_text(text, iteration) if edit else text, path)
+        client.wait_for_html()
+
+    if use_tracemalloc:
+        tracemalloc.start()
+    bytes_before = client.wire_bytes()
+    latencies = []
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        rendered = edit_text(text, warmup + iteration) if edit else text
+        render_start = time.perf_counter()
+        client.start_render(rendered, path)
+        client.wait_for_html()
+        latencies.append(time.perf_counter() - render_start)
+    elapsed = time.perf_counter() - start
+    heap_peak = None
+    if use_tracemalloc:
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "throughput": iterations/elapsed,
+        "characters_per_second": iterations*len(text)/elapsed,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max_rss_kb": max_rss_kb(),
+        "heap_peak_bytes": heap_peak,
+        "wire_bytes_per_render": (client.wire_bytes() - bytes_before)/iterations,
+    }
+
+
+# Send one document ``iterations`` times, returning a dict of results. This measures only the time taken by ``start_render`` to receive the text, which grows with the size of the document; the caller must prevent renders.
+def run_transfer_case(client, text, path, iterations):
+    latencies = []
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        # Change the text each time, as typing does.
+        changed = text + str(iteration)
+        transfer_start = time.perf_counter()
+        client.start_render(changed, path)
+        latencies.append(time.perf_counter() - transfer_start)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "throughput": iterations/elapsed,
+        "characters_per_second": iterations*len(text)/elapsed,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max_rss_kb": max_rss_kb(),
+        "heap_peak_bytes": None,
+        "wire_bytes_per_render": 0,
+    }
+
+
+def run(args):
+    CodeChatServer.lex_cache.max_chars = int(args.lex_cache_mb*2**20)
+    CodeChatServer.doctree_cache.max_chars = int(args.doctree_cache_mb*2**20)
+    # Time only full renders; these have no effect on an external server.
+    CodeChatServer.handler.preview_min_lines = 0
+    CodeChatServer.handler.window_min_lines = 0
+    if set(args.mode) - {"direct"} and not args.external:
+        start_servers(args)
+    if args.transfer:
+        # So that renders don't compete with the transfers for the CPU, reject them; ``start_render`` then only receives the text and updates the document.
+        CodeChatServer.handler.render_queue.max_waiting = 0
+
+    results = []
+    for mode in args.mode:
+        client = CLIENTS[mode](args)
+        for lines in args.sizes:
+            for density in args.densities:
+                text = make_source(lines, density, args.seed)
+                for backend in args.backends:
+                    # See |render_backends|; this has no effect on an external server.
+                    CodeChatServer.render_backends.enabled = None if backend == "all" else {backend}
+                    case = "{}-{}-{}".format(mode, lines, density)
+                    if backend != "all":
+                        case += "-" + backend
+                    if args.transfer:
+                        result = run_transfer_case(client, text, "benchmark.py", args.iterations)
+                    else:
+                        result = run_case(
+                            client, text, "benchmark.py", args.iterations, args.warmup,
+                            args.tracemalloc, args.edit
+                        )
+                    result.update(
+                        case=case, mode=mode, lines=lines, comment_density=density, backend=backend, characters=len(text)
+                    )
+                    results.append(result)
+                    print_result(result)
+    return results
+
+
+# Fan-out
+# -------
+# Measure the memory and time taken to deliver one large HTML result to many web views of one client, which are idle until it arrives. The web views poll ``get_result`` over HTTP but don't decode the response, as a browser decodes it natively; decoding it in Python would take far longer than the server's work. This needs the servers to run in this process, so that it can put the result directly.
+def run_fanout(args):
+    start_servers(args)
+    handler = CodeChatServer.handler
+    id = handler.render_client().id
+    html = make_html(int(args.fanout_mb*2**20))
+
+    # Each web view's ``get_result`` request, as the web client sends it.
+    def request_body(viewer_id):
+        buf = TTransport.TMemoryBuffer()
+        Web_Sync.Client(TJSONProtocol.TJSONProtocol(buf)).send_get_result(id, viewer_id)
+        return buf.getvalue()
+
+    def poll(viewer_id):
+        connection = http.client.HTTPConnection(args.host, args.web_port)
+        connection.request("POST", "/", request_body(viewer_id), {"Content-Type": "application/x-thrift"})
+        response = connection.getresponse()
+        # Read in pieces, so that the web views' copies of the result don't count towards the server's memory use.
+        size = 0
+        while True:
+            data = response.read(2**16)
+            if not data:
+                break
+            size += len(data)
+        connection.close()
+        return size, time.perf_counter()
+
+    executor = ThreadPoolExecutor(args.fanout)
+    futures = [executor.submit(poll, viewer_id) for viewer_id in range(1, args.fanout + 1)]
+    # Wait until every web view is waiting for a result.
+    results = handler.results_dict[id]
+    while len(results.backlog()) < args.fanout:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    rss_before = max_rss_kb()
+    if args.tracemalloc:
+        tracemalloc.start()
+    start = time.perf_counter()
+    results.put(CodeChatServer.make_result(Get_Result_Type.html, html))
+    responses = [future.result() for future in futures]
+    heap_peak = None
+    if args.tracemalloc:
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    executor.shutdown()
+    handler.stop_render_client(id)
+
+    latencies = sorted(end - start for size, end in responses)
+    result = {
+        "case": "fanout-{}-{}MB".format(args.fanout, args.fanout_mb),
+        "viewers": args.fanout,
+        "html_bytes": len(html.encode("utf-8")),
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max_rss_growth_kb": rss_before and max_rss_kb() - rss_before,
+        "heap_peak_bytes": heap_peak,
+        "wire_bytes_per_viewer": sum(size for size, end in responses)/len(responses),
+    }
+    print(
+        "{case:<24} p50 {p50_ms:8.1f} ms  p99 {p99_ms:8.1f} ms  max RSS growth {max_rss_growth_kb} kB  "
+        "heap peak {heap_peak_bytes} B".format(p50_ms=result["p50"]*1000, p99_ms=result["p99"]*1000, **result)
+    )
+    return [result]
+
+
+# Return about ``size`` characters of HTML, made by repeating the body of a rendered synthetic file.
+def make_html(size):
+    html, position_map = CodeChatServer.render_phases(make_source(500, 0.5), "benchmark.py", io.StringIO(), lambda phase_name: None)
+    head, body = html.split("<body>", 1)
+    body, tail = body.rsplit("</body>", 1)
+    return head + "<body>" + body*max(1, (size - len(head) - len(tail))//len(body)) + "</body>" + tail
+
+
+# Reporting
+# =========
+def print_result(result):
+    print(
+        "{case:<24} {throughput:8.2f} renders/s  p50 {p50_ms:8.1f} ms  p99 {p99_ms:8.1f} ms  "
+        "max RSS {max_rss_kb} kB  {wire_bytes_per_render:10.0f} B/render".format(
+            p50_ms=result["p50"]*1000, p99_ms=result["p99"]*1000, **result
+        )
+    )
+
+
+# Print the change in each case's p50 latency and throughput relative to a previous run.
+def print_comparison(results, old_run):
+    old_results = {r["case"]: r for r in old_run["results"]}
+    print("\nCompared to {}:".format(old_run["timestamp"]))
+    for result in results:
+        old = old_results.get(result["case"])
+        if old:
+            line = "{:<24} p50 {:+7.1%}".format(result["case"], result["p50"]/old["p50"] - 1)
+            if "throughput" in result:
+                line += "  throughput {:+7.1%}".format(result["throughput"]/old["throughput"] - 1)
+            print(line)
+
+
+def versions():
+    ret = {"python": platform.python_version()}
+    for package in ("CodeChat", "docutils", "pygments", "thrift", "flask"):
+        try:
+            ret[package] = version(package)
+        except PackageNotFoundError:
+            ret[package] = None
+    return ret
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the CodeChat rendering server.")
+    parser.add_argument('--mode', nargs='+', choices=sorted(CLIENTS), default=["direct", "thrift"], help="How to drive the server.")
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help="Sizes of the synthetic files, in lines.")
+    parser.add_argument('--densities', nargs='+', type=float, default=DEFAULT_DENSITIES, help="Fractions of each file which are comments.")
+    parser.add_argument('--iterations', type=int, default=10, help="Measured renders per case.")
+    parser.add_argument('--warmup', type=int, default=1, help="Unmeasured renders per case.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the synthetic corpus.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--editor-port', type=int, default=9090)
+    parser.add_argument('--web-port', type=int, default=5000)
+    parser.add_argument('--editor-socket', default=os.path.join(tempfile.gettempdir(), "codechat-benchmark.sock"), help="The Unix socket of the editor server, for the unix and shared modes.")
+    parser.add_argument('--edit', action='store_true', help="Change one line of the document before each render, as typing does.")
+    parser.add_argument('--lex-cache-mb', type=float, default=8, help="The size of the server's lexing cache, in MB; 0 disables it.")
+    parser.add_argument('--doctree-cache-mb', type=float, default=2, help="The size of the server's parsing cache, in MB of reST; 0 disables it.")
+    parser.add_argument(
+        '--backends', nargs='+', choices=["all"] + CodeChatServer.render_backends.names(), default=["all"],
+        help="Run each case with each of these render backends, plus codechat for files they don't accept; all lets the server choose any."
+    )
+    parser.add_argument('--transfer', action='store_true', help="Measure only the time to send each document to the server, without rendering it.")
+    parser.add_argument('--external', action='store_true', help="Use an already-running server instead of starting one in this process.")
+    parser.add_argument('--tracemalloc', action='store_true', help="Report the peak Python heap use of each case. This slows rendering.")
+    parser.add_argument('--fanout', type=int, metavar='VIEWERS', help="Instead of rendering, measure delivering one large result to this many idle web views.")
+    parser.add_argument('--fanout-mb', type=float, default=5, help="The size of the result delivered by --fanout, in MB.")
+    parser.add_argument('--json', metavar='FILE', help="Save the results as JSON.")
+    parser.add_argument('--compare', metavar='FILE', help="Compare the results with a previous run saved by --json.")
+    args = parser.parse_args(argv)
+
+    run_info = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "versions": versions(),
+        "args": vars(args),
+        "results": run_fanout(args) if args.fanout else run(args),
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(run_info, f, indent=4)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(run_info["results"], json.load(f))
+
+
+if __name__ == '__main__':
+    main()
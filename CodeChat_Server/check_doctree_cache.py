@@ -0,0 +1,130 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***************************************************************
+# |docname| - Check that the parsing cache doesn't change renders
+# ***************************************************************
+# The parsing cache (see |doctree_cache|) must be transparent: a render through it must produce the same HTML, build output and position map as a render which parses the whole document. This renders each supported file in a corpus of real files three ways: with the cache disabled, with an empty cache, which parses each block, and again with that cache, which reuses each block's doctree. It reports each file whose cached renders differ from its uncached render, and exits with a status of 1 if any do.
+#
+# By default, the corpus is the source of Docutils and CodeChat, which use most reST features in their comments, plus this repository. Run this from the ``CodeChat_Server`` directory; for example, ``python check_doctree_cache.py`` or ``python check_doctree_cache.py path/to/files``. Use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+import io
+import os
+import sys
+
+# Third-party imports
+# -------------------
+import CodeChat
+import docutils
+
+# Local application imports
+# -------------------------
+import CodeChatServer
+from doctree_cache import DoctreeCache
+from file_watcher import is_supported, walk_files
+
+
+# Rendering
+# =========
+# Render ``text`` through ``cache``, returning ``(HTML, build output, the lines of the position map)``, or None if CodeChat doesn't support the file.
+def render(text, path, cache):
+    CodeChatServer.doctree_cache = cache
+    warnings = io.StringIO()
+    try:
+        html, position_map = CodeChatServer.render_phases(text, path, warnings, lambda phase_name: None)
+    except KeyError:
+        return None
+    return html, warnings.getvalue(), position_map and list(position_map.lines)
+
+
+# Return a description of the first difference between ``expected`` and ``actual``, two strings, showing about ``context`` characters of each around it.
+def describe_difference(expected, actual, context=120):
+    index = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+    start = max(0, index - context)
+    return "at character {}:\n    expected {!r}\n    actual   {!r}".format(
+        index, expected[start:index + context], actual[start:index + context]
+    )
+
+
+# Return a list of descriptions of how the renders of the file at ``path`` differ; it's empty if they don't.
+def check_file(path, max_chars):
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return []
+    expected = render(text, path, DoctreeCache(0))
+    if expected is None:
+        return []
+    cache = DoctreeCache(max_chars)
+    differences = []
+    for kind in ("parsed", "reused"):
+        actual = render(text, path, cache)
+        for name, expected_part, actual_part in zip(("HTML", "build output", "position map"), expected, actual):
+            if expected_part != actual_part:
+                if name == "position map":
+                    expected_part, actual_part = str(expected_part), str(actual_part)
+                differences.append("{} of the {} render differs {}".format(
+                    name, kind, describe_difference(expected_part, actual_part)
+                ))
+    return differences
+
+
+# Yield the supported files in ``paths``, which may name files or directories.
+def find_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(file for file in walk_files(path) if is_supported(file))
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that renders through the parsing cache match those without it.")
+    parser.add_argument(
+        'paths', nargs='*', help="Files, or directories of files, to render. By default, the source of Docutils and CodeChat, plus this repository."
+    )
+    parser.add_argument('--cache-mb', type=float, default=64, help="The size of the parsing cache, in MB of reST; it should hold every block of the largest file.")
+    args = parser.parse_args(argv)
+    paths = args.paths or [
+        os.path.dirname(docutils.__file__), os.path.dirname(CodeChat.__file__),
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ]
+
+    checked = failed = 0
+    for path in find_files(paths):
+        differences = check_file(path, int(args.cache_mb*2**20))
+        checked += 1
+        if differences:
+            failed += 1
+            print("{}:".format(path))
+            for difference in differences:
+                print("  " + difference)
+    print("Checked {} files; {} differ.".format(checked, failed))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
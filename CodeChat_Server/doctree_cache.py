@@ -0,0 +1,447 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***********************************************
+# |docname| - Cache the parsing of comment blocks
+# ***********************************************
+# For a file which is mostly comments, most of a render is spent parsing reST, although an edit usually changes only one comment. So, the server parses the reST produced from a file one block at a time, keeping the doctree of each block in a cache shared by all files and clients; only blocks which changed are parsed again. The doctrees of all blocks are then joined into one document, which is transformed and written as usual, so that references, footnotes and the like work across blocks just as they do when the document is parsed as a whole.
+#
+# Blocks
+# ======
+# CodeChat's reST precedes each comment with a ``.. set-line:: N`` directive, which makes errors report the line of the source file; each block begins there, holding a comment and the code following it. Parsing blocks separately gives the same doctree as parsing the whole, except in three ways, which the cache handles as follows:
+#
+# Sections
+#   A block may continue the section of an earlier block, or start a new section at any level above it. The reST parser determines the level of a title from the title styles seen so far and the current section. So, a block's entry is keyed by these as well as by its text, and the block is parsed into a stand-in for the current section, nested in stand-ins for its parents. When joining, the contents of each stand-in are added to the section it stands for.
+# Names and IDs
+#   While parsing, the parser registers targets, references, footnotes and the like with the document, which checks for duplicate names and assigns IDs. These depend on all earlier blocks, so while parsing a block, these registrations are recorded rather than performed, then performed on the joined document when the block is joined. The few IDs which the parser itself uses are given placeholders until then.
+# Line numbers
+#   A block is parsed as if its ``set-line`` gave line 0, so that it needn't be parsed again when it moves; the lines of its nodes and messages are then shifted when it's joined. Its messages are reported when it's joined, as the parser would have reported them. The parser's state machine also gives the document's reporter the line of each line of reST, which transforms use to report messages; a LineMap_ stands in for it.
+#
+# A document which uses a directive that changes how the rest of the document is parsed, such as ``role``, or that changes the document outside of its place in it, such as ``title``, is parsed as a whole. Blocks using directives which read other files are parsed each time, rather than cached, since those files may change.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from collections import OrderedDict, namedtuple
+import copy
+import re
+import threading
+
+# Third-party imports
+# -------------------
+from docutils import nodes, utils
+from docutils.parsers.rst import states
+from docutils.readers.standalone import Reader
+from docutils.statemachine import StateMachine, StateMachineWS, StringList, string2lines
+
+
+# The ``set-line`` directive which begins each block.
+SET_LINE_RE = re.compile(r"\.\. set-line:: (-?\d+)$")
+# Directives which prevent parsing a document in blocks.
+WHOLE_DOCUMENT_RE = re.compile(
+    r"^[ \t]*\.\.[ \t]+(role|default-role|title|header|footer|meta|contents|include)::", re.M
+)
+# Directives, or their options, which read other files.
+READS_FILES_RE = re.compile(r"^[ \t]*(\.\.[ \t]+codeinclude::|:(file|url):)", re.M)
+# Blocks are parsed as if they began at this line of the reST. Most lines given to nodes are those the set-line directive gives, but a few are lines of the reST; this tells them apart.
+INPUT_OFFSET = 10**9
+# The IDs given while parsing a block, which are replaced when it's joined.
+PLACEHOLDER_PREFIX = "codechat-placeholder-"
+
+# A parsed block. The doctree is split among ``chain``, which holds the stand-ins for the document and each section containing the block; the contents of each stand-in follow the next stand-in. ``contents`` is ``(a list of Event_, the section where parsing ended, the nodes given placeholder IDs)``, which is copied along with the doctree when the block is joined. ``title_styles`` holds the title styles known after this block.
+Fragment = namedtuple("Fragment", "chain contents title_styles")
+
+
+# Cache
+# =====
+# The doctrees of blocks, in least-recently-used order, keeping those of at most about ``max_chars`` characters of reST; a block's doctree takes about 25 times the memory of its text.
+class DoctreeCache:
+    def __init__(self, max_chars=2*2**20):
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        # Maps ``(settings, title styles, section depth, text)`` to a Fragment.
+        self._entries = OrderedDict()
+        self.chars_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    # Return a Docutils reader which parses through this cache.
+    def reader(self):
+        return CachedReader(self)
+
+    # Parse ``text``, a string of reST, into ``document`` using ``parser``, a reST parser. This follows ``docutils.parsers.rst.Parser.parse``, v. 0.23.
+    def parse(self, text, document, parser):
+        settings = document.settings
+        if not self.max_chars or WHOLE_DOCUMENT_RE.search(text):
+            parser.parse(text, document)
+            return
+        parser.setup_parse(text, document)
+        settings.setdefault("tab_width", 8)
+        settings.setdefault("syntax_highlight", "long")
+        lines = string2lines(text, tab_width=settings.tab_width, convert_whitespace=True)
+        if any(len(line) > settings.line_length_limit for line in lines):
+            parser.finish_parse()
+            parser.parse(text, document)
+            return
+
+        settings_key = repr(sorted(
+            (name, value) for name, value in vars(settings).items()
+            if name not in ("warning_stream", "record_dependencies")
+        ))
+        current = document
+        title_styles = ()
+        # The index of each block's set-line directive in ``lines``, and the line it gives.
+        set_lines = []
+        for block_lines, start, line in split_blocks(lines):
+            if start:
+                set_lines.append((start + 1, line))
+            chain = [document] + current.section_hierarchy()
+            block_text = "\n".join(block_lines)
+            if READS_FILES_RE.search(block_text):
+                fragment = parse_fragment(block_lines, document, parser, title_styles, len(chain) - 1)
+            else:
+                key = (settings_key, title_styles, len(chain) - 1, block_text)
+                fragment = self._get(key)
+                if fragment is None:
+                    fragment = parse_fragment(block_lines, document, parser, title_styles, len(chain) - 1)
+                    self._put(key, fragment)
+            current = join_fragment(fragment, chain, start, line)
+            title_styles = fragment.title_styles
+        parser.finish_parse()
+        document.reporter.get_source_and_line = LineMap(lines, document["source"], set_lines).get_source_and_line
+
+    def _get(self, key):
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return fragment
+
+    def _put(self, key, fragment):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.chars_used -= len(key[3])
+            self._entries[key] = fragment
+            self.chars_used += len(key[3])
+            while self.chars_used > self.max_chars and self._entries:
+                old_key = self._entries.popitem(last=False)[0]
+                self.chars_used -= len(old_key[3])
+
+
+# A standalone reader which parses through ``cache``.
+class CachedReader(Reader):
+    def __init__(self, cache):
+        super().__init__()
+        self.cache = cache
+
+    # This follows ``docutils.readers.Reader.parse``.
+    def parse(self):
+        document = self.new_document()
+        self.cache.parse(self.input, document, self.parser)
+        document.current_source = document.current_line = None
+        self.document = document
+
+
+# .. _LineMap:
+#
+# Find the source and line of a line of the reST, as the parser's state machine does for the document's reporter once it has parsed the whole document. A ``set-line`` directive numbers the lines following it from the line it gives; ``set_lines`` lists the index of each and that line. A message which gives no line is reported at the line after the end, as the state machine would.
+class LineMap:
+    def __init__(self, lines, source, set_lines):
+        items = []
+        set_lines = dict(set_lines)
+        base_index = base_line = 0
+        for index in range(len(lines)):
+            if index - 1 in set_lines:
+                base_index, base_line = index, set_lines[index - 1]
+            items.append((source, base_line + index - base_index))
+        self.input_lines = StringList(lines, items=items)
+        self.input_offset = 0
+        self.line_offset = len(lines)
+
+    # This follows ``docutils.statemachine.StateMachine.get_source_and_line``, v. 0.23, using the attributes above.
+    get_source_and_line = StateMachine.get_source_and_line
+
+
+# Splitting
+# =========
+# Yield ``(the lines of a block, the index of its first line, the line its set-line directive gives)`` for each block of ``lines``. In each block, the set-line directive gives line 0. The first block, before any set-line directive, begins at line 0.
+def split_blocks(lines):
+    start = 0
+    line = 0
+    for index in range(1, len(lines)):
+        match = SET_LINE_RE.match(lines[index])
+        if match and not lines[index - 1]:
+            # Begin the block with the blank line before its set-line, as in the whole document.
+            yield lines[start:index - 1], start, line
+            start = index - 1
+            line = int(match.group(1))
+            lines[index] = ".. set-line:: 0"
+    yield lines[start:], start, line
+
+
+# Parsing
+# =======
+# A document which records the registrations made while parsing a block, rather than performing them.
+class FragmentDocument(nodes.document):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The registrations and messages of the block in the order they occurred; see Event_.
+        self.events = []
+        self.placeholders = []
+
+    # Record a registration. A registration may report a problem with its node, such as a duplicate name, placing the message in one of its arguments; so, also record the line which the reporter would give the message, following ``docutils.utils.Reporter.system_message``, and the place where the message would go.
+    def record(self, name, args, placeholder=None):
+        source, line = utils.get_source_line(args[0]) if isinstance(args[0], nodes.Node) else (None, None)
+        if source is None:
+            try:
+                line = self.reporter.get_source_and_line(line)[1]
+            except AttributeError:
+                pass
+        places = [len(arg.children) if isinstance(arg, nodes.Element) else None for arg in args]
+        self.events.append(Event(name, args, placeholder, line, places, None))
+
+    # Give a node which has no ID a placeholder. The parser uses the ID which this returns, so it can't wait.
+    def set_id(self, node, msgnode=None, suggested_prefix=""):
+        placeholder = None
+        if not node["ids"]:
+            placeholder = PLACEHOLDER_PREFIX + str(len(self.placeholders))
+            node["ids"].append(placeholder)
+            self.placeholders.append(node)
+        self.record("set_id", (node, msgnode, suggested_prefix), placeholder)
+        return node["ids"][-1]
+
+    # Record a message, as an observer of the reporter. Also record its text now, as the reporter wrote it, since a directive may add to the message after reporting it.
+    def report(self, message):
+        self.events.append(Event(None, (message,), None, None, None, nodes.Element.astext(message)))
+
+
+def _record(name):
+    def note(self, *args):
+        self.record(name, args)
+    return note
+
+
+for name in (
+    "note_implicit_target", "note_explicit_target", "note_refname", "note_refid", "note_indirect_target",
+    "note_anonymous_target", "note_autofootnote", "note_autofootnote_ref", "note_symbol_footnote",
+    "note_symbol_footnote_ref", "note_footnote", "note_footnote_ref", "note_citation", "note_citation_ref",
+    "note_substitution_def", "note_substitution_ref", "note_pending",
+):
+    setattr(FragmentDocument, name, _record(name))
+
+
+# .. _Event:
+#
+# A registration, given by the name of the document's method and its ``args``, or a message reported by the parser, given by a ``name`` of None and ``args`` of ``(message,)``. For a registration, ``placeholder`` is the placeholder ID it gave, if any; ``line`` is the line of any message it reports; ``places`` gives the number of children of each of its arguments which is an element. For a message, ``text`` is its text when it was reported.
+Event = namedtuple("Event", "name args placeholder line places text")
+
+
+# The parser's state machine, starting in a given section with the given title styles.
+class FragmentStateMachine(states.RSTStateMachine):
+    # This follows ``docutils.parsers.rst.states.RSTStateMachine.run``, v. 0.23, but doesn't discard ``node`` and ``memo`` at the end.
+    def run(self, input_lines, document, node, title_styles, inliner=None):
+        self.language = states.languages.get_language(document.settings.language_code, document.reporter)
+        self.match_titles = True
+        if inliner is None:
+            inliner = states.Inliner()
+        inliner.init_customizations(document.settings)
+        self.memo = states.Struct(
+            document=document, reporter=document.reporter, language=self.language,
+            title_styles=list(title_styles), section_level=0, section_bubble_up_kludge=False, inliner=inliner
+        )
+        self.document = document
+        self.attach_observer(document.note_source)
+        self.reporter = self.document.reporter
+        self.node = node
+        StateMachineWS.run(self, input_lines, INPUT_OFFSET, input_source=document["source"])
+
+
+# Parse a block, given as a list of lines, in a section nested ``depth`` deep, after the given title styles. ``document`` supplies the settings and source.
+def parse_fragment(lines, document, parser, title_styles, depth):
+    reporter = utils.new_reporter(document["source"], document.settings)
+    # Messages are reported when the block is joined.
+    reporter.stream = None
+    fragment_document = FragmentDocument(document.settings, reporter, source=document["source"])
+    fragment_document.note_source(document["source"], -1)
+    reporter.attach_observer(fragment_document.report)
+    chain = [fragment_document]
+    for _ in range(depth):
+        section = nodes.section()
+        chain[-1] += section
+        chain.append(section)
+
+    state_machine = FragmentStateMachine(
+        state_classes=parser.state_classes, initial_state=parser.initial_state, debug=reporter.debug_flag
+    )
+    state_machine.run(lines, fragment_document, chain[-1], title_styles, parser.inliner)
+    contents = (fragment_document.events, state_machine.node, fragment_document.placeholders)
+    title_styles = tuple(state_machine.memo.title_styles)
+    state_machine.unlink()
+    fragment_document.reporter = fragment_document.transformer = None
+    return Fragment(chain, contents, title_styles)
+
+
+# Joining
+# =======
+# Add a copy of ``fragment`` to ``chain``, the document followed by the sections which its stand-ins stand for. The block begins at index ``start`` of the reST and its set-line directive gives ``line``. Return the section where its parsing ended.
+def join_fragment(fragment, chain, start, line):
+    # Convert a line of the fragment to a line of the document.
+    def document_line(fragment_line):
+        if fragment_line >= INPUT_OFFSET:
+            return fragment_line - INPUT_OFFSET + start
+        return fragment_line + line
+
+    # Copy the doctree, putting the stand-ins' contents in ``chain``.
+    memo = {id(stand_in): node for stand_in, node in zip(fragment.chain, chain)}
+    children = [
+        [copy_node(child, memo) for child in stand_in.children if child is not next_stand_in]
+        for stand_in, next_stand_in in zip(fragment.chain, fragment.chain[1:] + [None])
+    ]
+    events, end_node, placeholders = copy.deepcopy(fragment.contents, memo)
+    # The number of children each node of ``chain`` had, not counting the next, before the fragment's; a message placed in a node of the fragment goes this much further along.
+    places = {id(node): len(node.children) - 1 for node in chain[:-1]}
+    places[id(chain[-1])] = len(chain[-1].children)
+    for node, level_children in zip(chain, children):
+        node.children.extend(level_children)
+
+    document = chain[0]
+    source = document["source"]
+    shifted = set()
+
+    # Shift the lines of a copied subtree.
+    def shift_lines(subtree):
+        for node in subtree.findall(nodes.Element):
+            if id(node) in shifted:
+                continue
+            shifted.add(id(node))
+            # Lines of included files aren't renumbered by set-line.
+            if node.line is not None and node.source in (source, None):
+                node.line = document_line(node.line)
+            if isinstance(node, nodes.system_message) and node.get("line") is not None and node["source"] == source:
+                node["line"] = document_line(node["line"])
+
+    for level_children in children:
+        for child in level_children:
+            shift_lines(child)
+    for event in events:
+        if event.name is None:
+            shift_lines(event.args[0])
+
+    # Perform the registrations and report the messages in order, replacing placeholder IDs.
+    for node in placeholders:
+        node["ids"] = [id_ for id_ in node["ids"] if not id_.startswith(PLACEHOLDER_PREFIX)]
+    ids = {}
+    reporter = document.reporter
+    stream = reporter.stream
+    reported = []
+    reporter.attach_observer(reported.append)
+    reporter.stream = None
+    try:
+        for event in events:
+            if event.name is None:
+                report(reporter, stream, event.args[0], event.text)
+                continue
+            del reported[:]
+            counts = [len(arg.children) if place is not None else None for arg, place in zip(event.args, event.places)]
+            result = getattr(document, event.name)(*event.args)
+            if event.placeholder:
+                ids[event.placeholder] = result
+            if not reported:
+                continue
+            for message in reported:
+                if event.line is not None and message["source"] == source:
+                    message["line"] = document_line(event.line)
+                write_message(reporter, stream, message)
+            # Move the messages placed in an argument to where the parser would have placed them.
+            moved = set()
+            for arg, place, count in zip(event.args, event.places, counts):
+                if place is not None and len(arg.children) > count and id(arg) not in moved:
+                    moved.add(id(arg))
+                    added = arg.children[count:]
+                    del arg.children[count:]
+                    index = place + places.get(id(arg), 0)
+                    arg.children[index:index] = added
+                    places[id(arg)] = places.get(id(arg), 0) + len(added)
+    finally:
+        reporter.detach_observer(reported.append)
+        reporter.stream = stream
+
+    if ids:
+        for level_children in children:
+            for child in level_children:
+                for node in child.findall(nodes.Element):
+                    if node.get("refid") in ids:
+                        node["refid"] = ids[node["refid"]]
+                    if node.get("backrefs"):
+                        node["backrefs"] = [ids.get(id_, id_) for id_ in node["backrefs"]]
+    return end_node
+
+
+# Return a copy of ``node``, a node of a fragment, and its children. ``memo`` maps the ``id`` of each node already copied to its copy, as for ``copy.deepcopy``, which is much slower on a doctree.
+def copy_node(node, memo):
+    copied = memo.get(id(node))
+    if copied is not None:
+        return copied
+    if isinstance(node, nodes.Text):
+        copied = str.__new__(type(node), node)
+    else:
+        copied = object.__new__(type(node))
+    memo[id(node)] = copied
+    attributes = copied.__dict__
+    for name, value in node.__dict__.items():
+        if name == "children":
+            value = [copy_node(child, memo) for child in value]
+        elif name == "attributes":
+            value = {key: copy_value(item, memo) for key, item in value.items()}
+        elif isinstance(value, nodes.Node):
+            value = copy_node(value, memo)
+        else:
+            value = copy_value(value, memo)
+        attributes[name] = value
+    return copied
+
+
+# Attributes are mostly strings, or lists of strings.
+def copy_value(value, memo):
+    if isinstance(value, (str, int, type(None))):
+        return value
+    if type(value) is list and all(type(item) is str for item in value):
+        return list(value)
+    return copy.deepcopy(value, memo)
+
+
+# Report a message from parsing a block as the reporter would have when it occurred, writing it to ``stream``. ``text`` is its text then.
+def report(reporter, stream, message, text):
+    write_message(reporter, stream, message, text)
+    reporter.notify_observers(message)
+    reporter.max_level = max(message["level"], reporter.max_level)
+
+
+# Write ``message`` to ``stream`` if the reporter would, as ``docutils.nodes.system_message.astext`` gives it. ``text`` is its text when it was reported; by default, this is its text now.
+def write_message(reporter, stream, message, text=None):
+    level = message["level"]
+    if stream and (level >= reporter.report_level or reporter.debug_flag and level == reporter.DEBUG_LEVEL):
+        if text is None:
+            text = nodes.Element.astext(message)
+        stream.write("{}:{}: ({}/{}) {}\n".format(message["source"], message.get("line", ""), message["type"], level, text))
@@ -0,0 +1,173 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************
+# |docname| - A versioned document model
+# ****************************************
+# The server keeps a model of each document an editor sends: its text and path, a version number which increases with every change, and which side may edit it. As described in ``CodeChat idea.rst``, the editor begins with this ownership; a web view must request it, and the editor must grant it, before the web view may edit. Ownership returns to the editor when the web view sends its edits.
+#
+# Each document also keeps its latest render and position map, so that a workspace can show it again without rendering; see |workspace|.
+#
+# Edits from a web view are ranged diffs which replace whole source lines, so that neither side needs to send the whole document. After the server applies them, it sends the same edits to the editor, which applies them and then sends the resulting text back through ``start_render`` as it does for any change. The model recognizes this echo, so the text isn't rendered twice.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import sys
+import threading
+
+
+# The values for ``Document.owner``.
+EDITOR = "editor"
+WEB_VIEW = "web view"
+
+
+# Document
+# ========
+class Document:
+    def __init__(self, path=None):
+        self.text = ""
+        self.path = path
+        self.version = 0
+        self.owner = EDITOR
+        self.closed = False
+        # The text split into lines, computed only when needed.
+        self._lines = None
+        # True when the text came from a web view's edits which the editor hasn't yet sent back.
+        self._awaiting_echo = False
+        # The HTML and PositionMap of the latest render, and the version rendered.
+        self._html = None
+        self._position_map = None
+        self._rendered_version = None
+        self._condition = threading.Condition()
+
+    # Update the document with text from the editor. Return the new version, or None if this text echoes edits already applied from a web view, meaning it's already been rendered.
+    def update(self, text, path):
+        with self._condition:
+            if self._awaiting_echo and text == self.text and path == self.path:
+                self._awaiting_echo = False
+                return None
+            self._awaiting_echo = False
+            self._set_text(text)
+            self.path = path
+            # A change from the editor revokes the web view's ownership, so any edits it sends based on an earlier version are rejected.
+            self._set_owner(EDITOR)
+            return self.version
+
+    # Update the document with text read from its file after another program changed it. Return the new version, or None if the text is unchanged. The editor sends this text too once it reloads the file; like edits from a web view, that echo isn't rendered again.
+    def update_from_file(self, text):
+        with self._condition:
+            if text == self.text:
+                return None
+            self._set_text(text)
+            self._awaiting_echo = True
+            self._set_owner(EDITOR)
+            return self.version
+
+    # Return ``(version, text, path)``.
+    def snapshot(self):
+        with self._condition:
+            return self.version, self.text, self.path
+
+    # Record the result of rendering the given version.
+    def set_render(self, version, html, position_map):
+        with self._condition:
+            if self._rendered_version is None or version >= self._rendered_version:
+                self._html, self._position_map, self._rendered_version = html, position_map, version
+
+    # Return ``(html, position map)`` from the latest render if it rendered the current version and that version's text is ``text``; otherwise, return None.
+    def get_render(self, text):
+        with self._condition:
+            if self._rendered_version == self.version and text == self.text:
+                return self._html, self._position_map
+            return None
+
+    # Return the approximate memory used by this document, in bytes.
+    def memory_size(self):
+        with self._condition:
+            size = sys.getsizeof(self.text) + sys.getsizeof(self._html or "")
+            if self._position_map:
+                size += self._position_map.lines.itemsize*len(self._position_map.lines)
+            return size
+
+    # Give the web view ownership.
+    def grant(self):
+        with self._condition:
+            self._set_owner(WEB_VIEW)
+
+    # Return ownership to the editor.
+    def release(self):
+        with self._condition:
+            self._set_owner(EDITOR)
+
+    # Wait up to ``timeout`` seconds for the editor to grant ownership. Return True if it was granted.
+    def wait_for_grant(self, timeout):
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.owner == WEB_VIEW or self.closed, timeout
+            ) and not self.closed
+
+    # Return ``(version, text)`` for the given 1-based lines, from ``start_line`` up to but not including ``end_line``, or None if the web view doesn't own the document.
+    def get_lines(self, start_line, end_line):
+        with self._condition:
+            if self.owner != WEB_VIEW:
+                return None
+            return self.version, "".join(self._get_lines()[start_line - 1:end_line - 1])
+
+    # Apply a web view's edits, made to the given version of the document, and return ownership to the editor. Each edit is a ``Text_Edit`` whose text replaces lines ``start_line`` up to but not including ``end_line``; all line numbers refer to that version. Return the new version, or None if the document changed since that version, the web view didn't own it, or the edits are out of range or overlap.
+    def apply_edits(self, version, edits):
+        with self._condition:
+            if version != self.version or self.owner != WEB_VIEW:
+                return None
+            self._set_owner(EDITOR)
+            if not edits:
+                return self.version
+            lines = list(self._get_lines())
+            limit = len(lines) + 1
+            # Apply edits from the end of the document, so that earlier line numbers remain valid.
+            for edit in sorted(edits, key=lambda edit: edit.start_line, reverse=True):
+                if not 1 <= edit.start_line <= edit.end_line <= limit:
+                    return None
+                lines[edit.start_line - 1:edit.end_line - 1] = edit.text.splitlines(True)
+                limit = edit.start_line
+            self._set_text("".join(lines))
+            self._awaiting_echo = True
+            return self.version
+
+    # Wake any web view waiting for ownership; it won't be granted.
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def _set_text(self, text):
+        self.text = text
+        self._lines = None
+        self.version += 1
+
+    def _get_lines(self):
+        if self._lines is None:
+            self._lines = self.text.splitlines(True)
+        return self._lines
+
+    def _set_owner(self, owner):
+        self.owner = owner
+        self._condition.notify_all()
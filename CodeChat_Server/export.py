@@ -0,0 +1,213 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ******************************************
+# |docname| - Export a tree as a static site
+# ******************************************
+# This renders every supported file in a source tree to HTML in an output directory, so that a project's literate code can be published without a Sphinx build; for example, ``python export.py ~/project ~/project-html``. Each file ``path`` becomes ``path.html``, so that ``foo.py`` and ``foo.js`` don't collide.
+#
+# To make a re-export fast, this:
+#
+# -   renders files in parallel, in a pool of processes;
+# -   records the SHA-256 hash of each file's contents in a manifest in the output directory, and skips files whose contents haven't changed since the last export. A change in the versions of the packages which render files, or ``--force``, renders every file again;
+# -   links each page to one shared copy of the style sheets in ``_static``, instead of embedding them in every page as a render for the web view does.
+#
+# Files removed from the source tree since the last export are removed from the output. Run this from the ``CodeChat_Server`` directory; use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+from importlib.metadata import version
+import io
+import json
+import os
+import sys
+import time
+
+# Third-party imports
+# -------------------
+from docutils import core
+from docutils.writers.html4css1 import Writer
+from CodeChat.CodeToRest import code_to_rest_string
+from CodeChat.SourceClassifier import get_lexer
+
+# Local application imports
+# -------------------------
+from CodeChatServer import STYLESHEETS, html_settings
+from file_watcher import is_supported, walk_files
+
+
+# The manifest's name in the output directory, and the directory of shared style sheets.
+MANIFEST = ".codechat-export.json"
+STATIC_DIR = "_static"
+
+
+# Return a SHA-256 hash of ``data``, which is bytes.
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Return a hash identifying the packages which render files, so that upgrading any of them renders every file again.
+def renderer_hash():
+    packages = ["CodeChat", "docutils", "Pygments"]
+    return content_hash(json.dumps([version(package) for package in packages] + STYLESHEETS).encode("utf-8"))
+
+
+# Style sheets
+# ============
+# Return the path of the named style sheet, searching the same directories as a render does.
+def find_stylesheet(name):
+    for directory in html_settings(None)["stylesheet_dirs"]:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(name)
+
+
+# Copy each style sheet to the static directory, unless an identical copy is already there.
+def copy_stylesheets(output_dir):
+    static_dir = os.path.join(output_dir, STATIC_DIR)
+    os.makedirs(static_dir, exist_ok=True)
+    for name in STYLESHEETS:
+        with open(find_stylesheet(name), "rb") as f:
+            data = f.read()
+        dest = os.path.join(static_dir, name)
+        if os.path.isfile(dest):
+            with open(dest, "rb") as f:
+                if f.read() == data:
+                    continue
+        with open(dest, "wb") as f:
+            f.write(data)
+
+
+# Rendering
+# =========
+# Render the file at ``source`` to ``dest``, linking to the style sheets at the given relative URLs; the export's pool of processes runs this. Return ``(seconds, error)``; the error is empty on success.
+def export_file(source, dest, stylesheet_urls):
+    start = time.perf_counter()
+    try:
+        with open(source, encoding="utf-8") as f:
+            text = f.read()
+        rest = code_to_rest_string(text, lexer=get_lexer(filename=source, code=text))
+        settings = html_settings(io.StringIO())
+        settings.update({
+            "stylesheet_path": None,
+            "stylesheet": ",".join(stylesheet_urls),
+            "embed_stylesheet": False,
+        })
+        html = core.publish_string(rest, writer=Writer(), settings_overrides=settings)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with open(dest, "w", encoding="utf-8") as f:
+            f.write(html)
+    except KeyError:
+        return time.perf_counter() - start, "This file is not supported by CodeChat."
+    except Exception as e:
+        return time.perf_counter() - start, "{}: {}".format(type(e).__name__, e)
+    return time.perf_counter() - start, ""
+
+
+# Export
+# ======
+# Export the supported files in ``source_dir`` to ``output_dir``. Return a dict summarizing the export, including a list of ``{"path", "seconds", "error"}`` for each file rendered.
+def export(source_dir, output_dir, workers=None, force=False):
+    start = time.perf_counter()
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    renderer = renderer_hash()
+    # Maps each file's path, relative to the source directory, to the hash of its contents when last exported.
+    old_hashes = manifest.get("files", {}) if manifest.get("renderer") == renderer and not force else {}
+
+    # Find the files which changed. Skip the output directory, which includes the stylesheets, if it's in the source tree; otherwise, each export would export the output of the last one.
+    hashes = {}
+    jobs = []
+    for source in walk_files(source_dir, [output_dir]):
+        if not is_supported(source):
+            continue
+        relpath = os.path.relpath(source, source_dir)
+        with open(source, "rb") as f:
+            hashes[relpath] = content_hash(f.read())
+        dest = os.path.join(output_dir, relpath + ".html")
+        if old_hashes.get(relpath) == hashes[relpath] and os.path.isfile(dest):
+            continue
+        static_url = os.path.relpath(os.path.join(output_dir, STATIC_DIR), os.path.dirname(dest)).replace(os.sep, "/")
+        jobs.append((relpath, source, dest, [static_url + "/" + name for name in STYLESHEETS]))
+
+    copy_stylesheets(output_dir)
+    sources = set(hashes)
+    skipped = len(hashes) - len(jobs)
+    files = []
+    if jobs:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(export_file, source, dest, urls) for relpath, source, dest, urls in jobs]
+            for (relpath, source, dest, urls), future in zip(jobs, futures):
+                seconds, error = future.result()
+                files.append({"path": relpath, "seconds": seconds, "error": error})
+                if error:
+                    # Render this file again next time.
+                    del hashes[relpath]
+
+    # Remove the output of files no longer in the source tree.
+    removed = [relpath for relpath in manifest.get("files", {}) if relpath not in sources]
+    for relpath in removed:
+        try:
+            os.remove(os.path.join(output_dir, relpath + ".html"))
+        except OSError:
+            pass
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"renderer": renderer, "files": hashes}, f, indent=0, sort_keys=True)
+    return {
+        "seconds": time.perf_counter() - start,
+        "skipped": skipped,
+        "removed": len(removed),
+        "files": files,
+    }
+
+
+# Main
+# ====
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the supported files in a source tree to HTML.")
+    parser.add_argument("source_dir", help="The source tree to export.")
+    parser.add_argument("output_dir", help="The directory for the HTML.")
+    parser.add_argument("--workers", type=int, help="The number of processes to use; by default, one per CPU.")
+    parser.add_argument("--force", action="store_true", help="Render every file, even those unchanged since the last export.")
+    args = parser.parse_args(argv)
+
+    summary = export(args.source_dir, args.output_dir, args.workers, args.force)
+    errors = [file for file in summary["files"] if file["error"]]
+    for file in errors:
+        print("Error in {}: {}".format(file["path"], file["error"]))
+    print("Rendered {} files, skipped {} unchanged and removed {} in {:.2f} s; {} errors.".format(
+        len(summary["files"]) - len(errors), summary["skipped"], summary["removed"], summary["seconds"], len(errors)
+    ))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *************************************************
+# |docname| - Watch a project directory for changes
+# *************************************************
+# This watches a directory tree for changes to files which CodeChat can render, such as those made by other editors or by a ``git checkout``. On Linux, it uses `inotify <https://man7.org/linux/man-pages/man7/inotify.7.html>`_ through ctypes, so it needs no additional packages; elsewhere, or if inotify isn't available, it polls the tree for changed modification times and sizes.
+#
+# Changes often arrive in bursts. So, this collects changes until none arrive for ``settle`` seconds, or until ``max_delay`` seconds after the first, then passes all the changed paths to a callback in one batch.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import ctypes
+import ctypes.util
+from fnmatch import fnmatch
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+# Third-party imports
+# -------------------
+from CodeChat.CommentDelimiterInfo import SUPPORTED_GLOBS
+
+logger = logging.getLogger(__name__)
+
+
+# Files
+# =====
+# Directories which aren't watched: version control, caches and build output.
+EXCLUDED_DIRS = {"__pycache__", "node_modules", "_build"}
+
+
+def is_excluded_dir(name):
+    return name.startswith(".") or name in EXCLUDED_DIRS
+
+
+# Return True if CodeChat can render the file at ``path``.
+def is_supported(path):
+    name = os.path.basename(path)
+    return any(fnmatch(name, glob) for glob in SUPPORTED_GLOBS)
+
+
+# Yield the path of every file in the tree at ``top``, skipping excluded directories and the directories whose paths are in ``skip_dirs``.
+def walk_files(top, skip_dirs=()):
+    skip_dirs = {os.path.normcase(os.path.abspath(d)) for d in skip_dirs}
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = [
+            d for d in dirnames
+            if not is_excluded_dir(d) and os.path.normcase(os.path.abspath(os.path.join(dirpath, d))) not in skip_dirs
+        ]
+        for filename in filenames:
+            yield os.path.join(dirpath, filename)
+
+
+# Watchers
+# ========
+# Each watcher provides ``read(timeout)``, which waits up to ``timeout`` seconds for changes and returns a list of the paths changed; ``has_pending()``, which returns True if changes are waiting to be read; and ``close()``.
+#
+# inotify
+# -------
+# Constants from ``<sys/inotify.h>``.
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+# A file changes when it's closed after writing, or when another file is renamed to it, as editors which save atomically do. Creating a directory requires watching it.
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+# The fixed part of an ``inotify_event``: ``wd``, ``mask``, ``cookie`` and ``len``.
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    def __init__(self, root):
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        # Maps a watch descriptor to the directory it watches.
+        self._dirs = {}
+        self._add_tree(root)
+
+    # Watch every directory in the tree at ``top``, returning the files in it.
+    def _add_tree(self, top):
+        files = []
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not is_excluded_dir(d)]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd < 0:
+                # This is usually the per-user limit on watches; see ``/proc/sys/fs/inotify/max_user_watches``.
+                logger.warning("Unable to watch %s: %s.", dirpath, os.strerror(ctypes.get_errno()))
+            else:
+                self._dirs[wd] = dirpath
+            files += [os.path.join(dirpath, filename) for filename in filenames]
+        return files
+
+    def has_pending(self):
+        return bool(select.select([self._fd], [], [], 0)[0])
+
+    def read(self, timeout):
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return []
+        buf = os.read(self._fd, 64*1024)
+        changed = []
+        offset = 0
+        while offset < len(buf):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, so assume everything changed.
+                changed += walk_files(self.root)
+            elif mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+            elif wd in self._dirs and name:
+                path = os.path.join(self._dirs[wd], name)
+                if not mask & IN_ISDIR:
+                    changed.append(path)
+                elif not is_excluded_dir(name):
+                    # A new directory, perhaps with files already in it.
+                    changed += self._add_tree(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+# Polling
+# -------
+class PollingWatcher:
+    def __init__(self, root, interval=1.0):
+        self.root = root
+        self.interval = interval
+        self._stats = self._scan()
+
+    # Return ``{path: (modification time, size)}`` for every file in the tree.
+    def _scan(self):
+        stats = {}
+        for path in walk_files(self.root):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def has_pending(self):
+        return False
+
+    def read(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            time.sleep(max(0, min(self.interval, deadline - time.monotonic())))
+            stats = self._scan()
+            changed = [path for path, stat in stats.items() if self._stats.get(path) != stat]
+            self._stats = stats
+            if changed or time.monotonic() >= deadline:
+                return changed
+
+    def close(self):
+        pass
+
+
+# Watching
+# ========
+# Watch ``root`` in a background thread, calling ``on_batch(paths, is_interrupted)`` with each batch of changed files which CodeChat can render. ``is_interrupted()`` returns True when more changes are waiting; the callback may then stop early, returning the paths it didn't process, which are included in the next batch. If it raises, its batch is logged and dropped.
+class FileWatcher(threading.Thread):
+    def __init__(self, root, on_batch, polling=False, settle=0.2, max_delay=2.0):
+        super().__init__(daemon=True)
+        self.root = os.path.abspath(root)
+        self.on_batch = on_batch
+        self.settle = settle
+        self.max_delay = max_delay
+        self._stop_event = threading.Event()
+        self.watcher = None
+        if not polling and sys.platform.startswith("linux"):
+            try:
+                self.watcher = InotifyWatcher(self.root)
+            except OSError as e:
+                logger.warning("Unable to use inotify (%s); polling instead.", e)
+        if not self.watcher:
+            self.watcher = PollingWatcher(self.root)
+
+    def run(self):
+        # Maps each changed path to None; this is an ordered set.
+        pending = {}
+        first_change = None
+        while not self._stop_event.is_set():
+            # Wait briefly when changes are pending, to see if the burst is over; otherwise, wake periodically to check for a stop.
+            changed = [path for path in self.watcher.read(self.settle if pending else 1.0) if is_supported(path)]
+            if changed and first_change is None:
+                first_change = time.monotonic()
+            pending.update(dict.fromkeys(changed))
+            if pending and (not changed or time.monotonic() - first_change >= self.max_delay):
+                batch = list(pending)
+                try:
+                    pending = dict.fromkeys(self.on_batch(batch, self.watcher.has_pending))
+                except Exception:
+                    # Drop this batch rather than retry it, since the same paths would likely fail again; keep watching.
+                    logger.exception("Rendering changed files %s failed.", batch)
+                    pending = {}
+                first_change = time.monotonic() if pending else None
+        self.watcher.close()
+
+    def stop(self):
+        self._stop_event.set()
@@ -39,7 +39,7 @@ Editor_Extension_render_client_result = function(args) {
   this.success = null;
   if (args) {
     if (args.success !== undefined && args.success !== null) {
-      this.success = args.success;
+      this.success = new Render_Client_Return(args.success);
     }
   }
 };
@@ -55,8 +55,9 @@ Editor_Extension_render_client_result.prototype.read = function(input) {
     }
     switch (fid) {
       case 0:
-      if (ftype == Thrift.Type.STRING) {
-        this.success = input.readString().value;
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new Render_Client_Return();
+        this.success.read(input);
       } else {
         input.skip(ftype);
       }
@@ -76,8 +77,109 @@ Editor_Extension_render_client_result.prototype.read = function(input) {
 Editor_Extension_render_client_result.prototype.write = function(output) {
   output.writeStructBegin('Editor_Extension_render_client_result');
   if (this.success !== null && this.success !== undefined) {
-    output.writeFieldBegin('success', Thrift.Type.STRING, 0);
-    output.writeString(this.success);
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_render_client_with_id_args.prototype = {};
+Editor_Extension_render_client_with_id_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_client_with_id_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new Render_Client_Return(args.success);
+    }
+  }
+};
+Editor_Extension_render_client_with_id_result.prototype = {};
+Editor_Extension_render_client_with_id_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new Render_Client_Return();
+        this.success.read(input);
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_client_with_id_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
     output.writeFieldEnd();
   }
   output.writeFieldStop();
@@ -189,6 +291,142 @@ Editor_Extension_start_render_result.prototype.write = function(output) {
   return;
 };
 
+Editor_Extension_start_render_shared_args = function(args) {
+  this.name = null;
+  this.offset = null;
+  this.length = null;
+  this.path = null;
+  this.id = null;
+  if (args) {
+    if (args.name !== undefined && args.name !== null) {
+      this.name = args.name;
+    }
+    if (args.offset !== undefined && args.offset !== null) {
+      this.offset = args.offset;
+    }
+    if (args.length !== undefined && args.length !== null) {
+      this.length = args.length;
+    }
+    if (args.path !== undefined && args.path !== null) {
+      this.path = args.path;
+    }
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_start_render_shared_args.prototype = {};
+Editor_Extension_start_render_shared_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.STRING) {
+        this.name = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.offset = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.length = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 4:
+      if (ftype == Thrift.Type.STRING) {
+        this.path = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 5:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_start_render_shared_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_start_render_shared_args');
+  if (this.name !== null && this.name !== undefined) {
+    output.writeFieldBegin('name', Thrift.Type.STRING, 1);
+    output.writeString(this.name);
+    output.writeFieldEnd();
+  }
+  if (this.offset !== null && this.offset !== undefined) {
+    output.writeFieldBegin('offset', Thrift.Type.I32, 2);
+    output.writeI32(this.offset);
+    output.writeFieldEnd();
+  }
+  if (this.length !== null && this.length !== undefined) {
+    output.writeFieldBegin('length', Thrift.Type.I32, 3);
+    output.writeI32(this.length);
+    output.writeFieldEnd();
+  }
+  if (this.path !== null && this.path !== undefined) {
+    output.writeFieldBegin('path', Thrift.Type.STRING, 4);
+    output.writeString(this.path);
+    output.writeFieldEnd();
+  }
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 5);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_start_render_shared_result = function(args) {
+};
+Editor_Extension_start_render_shared_result.prototype = {};
+Editor_Extension_start_render_shared_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_start_render_shared_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_start_render_shared_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
 Editor_Extension_stop_render_client_args = function(args) {
   this.id = null;
   if (args) {
@@ -264,50 +502,503 @@ Editor_Extension_stop_render_client_result.prototype.write = function(output) {
   return;
 };
 
-Editor_ExtensionClient = function(input, output) {
-  this.input = input;
-  this.output = (!output) ? input : output;
-  this.seqid = 0;
-};
-Editor_ExtensionClient.prototype = {};
-
-Editor_ExtensionClient.prototype.render_client = function(callback) {
-  this.send_render_client(callback); 
-  if (!callback) {
-    return this.recv_render_client();
+Editor_Extension_sync_web_view_args = function(args) {
+  this.id = null;
+  this.line = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.line !== undefined && args.line !== null) {
+      this.line = args.line;
+    }
   }
 };
-
-Editor_ExtensionClient.prototype.send_render_client = function(callback) {
-  var args = new Editor_Extension_render_client_args();
-  try {
-    this.output.writeMessageBegin('render_client', Thrift.MessageType.CALL, this.seqid);
-    args.write(this.output);
-    this.output.writeMessageEnd();
-    if (callback) {
-      var self = this;
-      this.output.getTransport().flush(true, function() {
-        var result = null;
-        try {
-          result = self.recv_render_client();
-        } catch (e) {
-          result = e;
-        }
-        callback(result);
-      });
-    } else {
-      return this.output.getTransport().flush();
+Editor_Extension_sync_web_view_args.prototype = {};
+Editor_Extension_sync_web_view_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
     }
-  }
-  catch (e) {
-    if (typeof this.output.getTransport().reset === 'function') {
-      this.output.getTransport().reset();
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.line = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
     }
-    throw e;
+    input.readFieldEnd();
   }
+  input.readStructEnd();
+  return;
 };
 
-Editor_ExtensionClient.prototype.recv_render_client = function() {
+Editor_Extension_sync_web_view_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_sync_web_view_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.line !== null && this.line !== undefined) {
+    output.writeFieldBegin('line', Thrift.Type.I32, 2);
+    output.writeI32(this.line);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_sync_web_view_result = function(args) {
+};
+Editor_Extension_sync_web_view_result.prototype = {};
+Editor_Extension_sync_web_view_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_sync_web_view_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_sync_web_view_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_get_editor_result_args.prototype = {};
+Editor_Extension_get_editor_result_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_get_editor_result_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new Editor_Result_Return(args.success);
+    }
+  }
+};
+Editor_Extension_get_editor_result_result.prototype = {};
+Editor_Extension_get_editor_result_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new Editor_Result_Return();
+        this.success.read(input);
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_get_editor_result_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_grant_ownership_args.prototype = {};
+Editor_Extension_grant_ownership_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_grant_ownership_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_result = function(args) {
+};
+Editor_Extension_grant_ownership_result.prototype = {};
+Editor_Extension_grant_ownership_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_grant_ownership_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_args = function(args) {
+  this.paths = null;
+  if (args) {
+    if (args.paths !== undefined && args.paths !== null) {
+      this.paths = Thrift.copyList(args.paths, [null]);
+    }
+  }
+};
+Editor_Extension_render_batch_args.prototype = {};
+Editor_Extension_render_batch_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.LIST) {
+        this.paths = [];
+        var _rtmp36 = input.readListBegin();
+        var _size5 = _rtmp36.size || 0;
+        for (var _i7 = 0; _i7 < _size5; ++_i7) {
+          var elem8 = null;
+          elem8 = input.readString().value;
+          this.paths.push(elem8);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_batch_args');
+  if (this.paths !== null && this.paths !== undefined) {
+    output.writeFieldBegin('paths', Thrift.Type.LIST, 1);
+    output.writeListBegin(Thrift.Type.STRING, this.paths.length);
+    for (var iter9 in this.paths) {
+      if (this.paths.hasOwnProperty(iter9)) {
+        iter9 = this.paths[iter9];
+        output.writeString(iter9);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = Thrift.copyList(args.success, [Batch_Render_Result]);
+    }
+  }
+};
+Editor_Extension_render_batch_result.prototype = {};
+Editor_Extension_render_batch_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.LIST) {
+        this.success = [];
+        var _rtmp311 = input.readListBegin();
+        var _size10 = _rtmp311.size || 0;
+        for (var _i12 = 0; _i12 < _size10; ++_i12) {
+          var elem13 = null;
+          elem13 = new Batch_Render_Result();
+          elem13.read(input);
+          this.success.push(elem13);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_batch_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.LIST, 0);
+    output.writeListBegin(Thrift.Type.STRUCT, this.success.length);
+    for (var iter14 in this.success) {
+      if (this.success.hasOwnProperty(iter14)) {
+        iter14 = this.success[iter14];
+        iter14.write(output);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Editor_ExtensionClient = function(input, output) {
+  this.input = input;
+  this.output = (!output) ? input : output;
+  this.seqid = 0;
+};
+Editor_ExtensionClient.prototype = {};
+
+Editor_ExtensionClient.prototype.render_client = function(callback) {
+  this.send_render_client(callback); 
+  if (!callback) {
+    return this.recv_render_client();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_render_client = function(callback) {
+  var args = new Editor_Extension_render_client_args();
+  try {
+    this.output.writeMessageBegin('render_client', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_render_client();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_render_client = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_render_client_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'render_client failed: unknown result';
+};
+
+Editor_ExtensionClient.prototype.render_client_with_id = function(id, callback) {
+  this.send_render_client_with_id(id, callback); 
+  if (!callback) {
+    return this.recv_render_client_with_id();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_render_client_with_id = function(id, callback) {
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_render_client_with_id_args(params);
+  try {
+    this.output.writeMessageBegin('render_client_with_id', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_render_client_with_id();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_render_client_with_id = function() {
   var ret = this.input.readMessageBegin();
   var mtype = ret.mtype;
   if (mtype == Thrift.MessageType.EXCEPTION) {
@@ -316,14 +1007,14 @@ Editor_ExtensionClient.prototype.recv_render_client = function() {
     this.input.readMessageEnd();
     throw x;
   }
-  var result = new Editor_Extension_render_client_result();
+  var result = new Editor_Extension_render_client_with_id_result();
   result.read(this.input);
   this.input.readMessageEnd();
 
   if (null !== result.success) {
     return result.success;
   }
-  throw 'render_client failed: unknown result';
+  throw 'render_client_with_id failed: unknown result';
 };
 
 Editor_ExtensionClient.prototype.start_render = function(text, path, id, callback) {
@@ -383,6 +1074,65 @@ Editor_ExtensionClient.prototype.recv_start_render = function() {
   return;
 };
 
+Editor_ExtensionClient.prototype.start_render_shared = function(name, offset, length, path, id, callback) {
+  this.send_start_render_shared(name, offset, length, path, id, callback); 
+  if (!callback) {
+  this.recv_start_render_shared();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_start_render_shared = function(name, offset, length, path, id, callback) {
+  var params = {
+    name: name,
+    offset: offset,
+    length: length,
+    path: path,
+    id: id
+  };
+  var args = new Editor_Extension_start_render_shared_args(params);
+  try {
+    this.output.writeMessageBegin('start_render_shared', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_start_render_shared();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_start_render_shared = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_start_render_shared_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
+};
+
 Editor_ExtensionClient.prototype.stop_render_client = function(id, callback) {
   this.send_stop_render_client(id, callback); 
   if (!callback) {
@@ -437,3 +1187,230 @@ Editor_ExtensionClient.prototype.recv_stop_render_client = function() {
 
   return;
 };
+
+Editor_ExtensionClient.prototype.sync_web_view = function(id, line, callback) {
+  this.send_sync_web_view(id, line, callback); 
+  if (!callback) {
+  this.recv_sync_web_view();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_sync_web_view = function(id, line, callback) {
+  var params = {
+    id: id,
+    line: line
+  };
+  var args = new Editor_Extension_sync_web_view_args(params);
+  try {
+    this.output.writeMessageBegin('sync_web_view', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_sync_web_view();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_sync_web_view = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_sync_web_view_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
+};
+
+Editor_ExtensionClient.prototype.get_editor_result = function(id, callback) {
+  this.send_get_editor_result(id, callback); 
+  if (!callback) {
+    return this.recv_get_editor_result();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_get_editor_result = function(id, callback) {
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_get_editor_result_args(params);
+  try {
+    this.output.writeMessageBegin('get_editor_result', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_get_editor_result();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_get_editor_result = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_get_editor_result_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'get_editor_result failed: unknown result';
+};
+
+Editor_ExtensionClient.prototype.grant_ownership = function(id, callback) {
+  this.send_grant_ownership(id, callback); 
+  if (!callback) {
+  this.recv_grant_ownership();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_grant_ownership = function(id, callback) {
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_grant_ownership_args(params);
+  try {
+    this.output.writeMessageBegin('grant_ownership', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_grant_ownership();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_grant_ownership = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_grant_ownership_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
+};
+
+Editor_ExtensionClient.prototype.render_batch = function(paths, callback) {
+  this.send_render_batch(paths, callback); 
+  if (!callback) {
+    return this.recv_render_batch();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_render_batch = function(paths, callback) {
+  var params = {
+    paths: paths
+  };
+  var args = new Editor_Extension_render_batch_args(params);
+  try {
+    this.output.writeMessageBegin('render_batch', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_render_batch();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_render_batch = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Editor_Extension_render_batch_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'render_batch failed: unknown result';
+};
@@ -12,10 +12,14 @@ if (typeof Int64 === 'undefined' && typeof require === 'function') {
 
 Web_Sync_get_result_args = function(args) {
   this.id = null;
+  this.viewer_id = null;
   if (args) {
     if (args.id !== undefined && args.id !== null) {
       this.id = args.id;
     }
+    if (args.viewer_id !== undefined && args.viewer_id !== null) {
+      this.viewer_id = args.viewer_id;
+    }
   }
 };
 Web_Sync_get_result_args.prototype = {};
@@ -36,9 +40,13 @@ Web_Sync_get_result_args.prototype.read = function(input) {
         input.skip(ftype);
       }
       break;
-      case 0:
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.viewer_id = input.readI32().value;
+      } else {
         input.skip(ftype);
-        break;
+      }
+      break;
       default:
         input.skip(ftype);
     }
@@ -55,6 +63,11 @@ Web_Sync_get_result_args.prototype.write = function(output) {
     output.writeI32(this.id);
     output.writeFieldEnd();
   }
+  if (this.viewer_id !== null && this.viewer_id !== undefined) {
+    output.writeFieldBegin('viewer_id', Thrift.Type.I32, 2);
+    output.writeI32(this.viewer_id);
+    output.writeFieldEnd();
+  }
   output.writeFieldStop();
   output.writeStructEnd();
   return;
@@ -111,67 +124,1118 @@ Web_Sync_get_result_result.prototype.write = function(output) {
   return;
 };
 
-Web_SyncClient = function(input, output) {
-  this.input = input;
-  this.output = (!output) ? input : output;
-  this.seqid = 0;
+Web_Sync_sync_editor_args = function(args) {
+  this.id = null;
+  this.anchor = null;
+  this.line_offset = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.anchor !== undefined && args.anchor !== null) {
+      this.anchor = args.anchor;
+    }
+    if (args.line_offset !== undefined && args.line_offset !== null) {
+      this.line_offset = args.line_offset;
+    }
+  }
+};
+Web_Sync_sync_editor_args.prototype = {};
+Web_Sync_sync_editor_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.anchor = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.line_offset = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
 };
-Web_SyncClient.prototype = {};
 
-Web_SyncClient.prototype.get_result = function(id, callback) {
-  this.send_get_result(id, callback); 
-  if (!callback) {
-    return this.recv_get_result();
+Web_Sync_sync_editor_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_sync_editor_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.anchor !== null && this.anchor !== undefined) {
+    output.writeFieldBegin('anchor', Thrift.Type.STRING, 2);
+    output.writeString(this.anchor);
+    output.writeFieldEnd();
+  }
+  if (this.line_offset !== null && this.line_offset !== undefined) {
+    output.writeFieldBegin('line_offset', Thrift.Type.I32, 3);
+    output.writeI32(this.line_offset);
+    output.writeFieldEnd();
   }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
 };
 
-Web_SyncClient.prototype.send_get_result = function(id, callback) {
-  var params = {
-    id: id
-  };
-  var args = new Web_Sync_get_result_args(params);
-  try {
-    this.output.writeMessageBegin('get_result', Thrift.MessageType.CALL, this.seqid);
-    args.write(this.output);
-    this.output.writeMessageEnd();
-    if (callback) {
-      var self = this;
-      this.output.getTransport().flush(true, function() {
-        var result = null;
-        try {
-          result = self.recv_get_result();
-        } catch (e) {
-          result = e;
-        }
-        callback(result);
-      });
-    } else {
-      return this.output.getTransport().flush();
+Web_Sync_sync_editor_result = function(args) {
+};
+Web_Sync_sync_editor_result.prototype = {};
+Web_Sync_sync_editor_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_sync_editor_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_sync_editor_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_request_ownership_args = function(args) {
+  this.id = null;
+  this.anchor = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.anchor !== undefined && args.anchor !== null) {
+      this.anchor = args.anchor;
     }
   }
-  catch (e) {
-    if (typeof this.output.getTransport().reset === 'function') {
-      this.output.getTransport().reset();
+};
+Web_Sync_request_ownership_args.prototype = {};
+Web_Sync_request_ownership_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
     }
-    throw e;
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.anchor = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
   }
+  input.readStructEnd();
+  return;
 };
 
-Web_SyncClient.prototype.recv_get_result = function() {
-  var ret = this.input.readMessageBegin();
-  var mtype = ret.mtype;
-  if (mtype == Thrift.MessageType.EXCEPTION) {
-    var x = new Thrift.TApplicationException();
-    x.read(this.input);
-    this.input.readMessageEnd();
-    throw x;
+Web_Sync_request_ownership_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_request_ownership_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
   }
-  var result = new Web_Sync_get_result_result();
-  result.read(this.input);
-  this.input.readMessageEnd();
+  if (this.anchor !== null && this.anchor !== undefined) {
+    output.writeFieldBegin('anchor', Thrift.Type.STRING, 2);
+    output.writeString(this.anchor);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
 
-  if (null !== result.success) {
-    return result.success;
+Web_Sync_request_ownership_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new Ownership_Return(args.success);
+    }
   }
-  throw 'get_result failed: unknown result';
+};
+Web_Sync_request_ownership_result.prototype = {};
+Web_Sync_request_ownership_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new Ownership_Return();
+        this.success.read(input);
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_request_ownership_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_request_ownership_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_args = function(args) {
+  this.id = null;
+  this.version = null;
+  this.edits = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.version !== undefined && args.version !== null) {
+      this.version = args.version;
+    }
+    if (args.edits !== undefined && args.edits !== null) {
+      this.edits = Thrift.copyList(args.edits, [Text_Edit]);
+    }
+  }
+};
+Web_Sync_edit_text_args.prototype = {};
+Web_Sync_edit_text_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.version = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.LIST) {
+        this.edits = [];
+        var _rtmp316 = input.readListBegin();
+        var _size15 = _rtmp316.size || 0;
+        for (var _i17 = 0; _i17 < _size15; ++_i17) {
+          var elem18 = null;
+          elem18 = new Text_Edit();
+          elem18.read(input);
+          this.edits.push(elem18);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_edit_text_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.version !== null && this.version !== undefined) {
+    output.writeFieldBegin('version', Thrift.Type.I32, 2);
+    output.writeI32(this.version);
+    output.writeFieldEnd();
+  }
+  if (this.edits !== null && this.edits !== undefined) {
+    output.writeFieldBegin('edits', Thrift.Type.LIST, 3);
+    output.writeListBegin(Thrift.Type.STRUCT, this.edits.length);
+    for (var iter19 in this.edits) {
+      if (this.edits.hasOwnProperty(iter19)) {
+        iter19 = this.edits[iter19];
+        iter19.write(output);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = args.success;
+    }
+  }
+};
+Web_Sync_edit_text_result.prototype = {};
+Web_Sync_edit_text_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.BOOL) {
+        this.success = input.readBool().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_edit_text_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.BOOL, 0);
+    output.writeBool(this.success);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_args = function(args) {
+  this.id = null;
+  this.version = null;
+  this.first_block = null;
+  this.last_block = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.version !== undefined && args.version !== null) {
+      this.version = args.version;
+    }
+    if (args.first_block !== undefined && args.first_block !== null) {
+      this.first_block = args.first_block;
+    }
+    if (args.last_block !== undefined && args.last_block !== null) {
+      this.last_block = args.last_block;
+    }
+  }
+};
+Web_Sync_set_viewport_args.prototype = {};
+Web_Sync_set_viewport_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.version = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.first_block = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 4:
+      if (ftype == Thrift.Type.I32) {
+        this.last_block = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_viewport_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.version !== null && this.version !== undefined) {
+    output.writeFieldBegin('version', Thrift.Type.I32, 2);
+    output.writeI32(this.version);
+    output.writeFieldEnd();
+  }
+  if (this.first_block !== null && this.first_block !== undefined) {
+    output.writeFieldBegin('first_block', Thrift.Type.I32, 3);
+    output.writeI32(this.first_block);
+    output.writeFieldEnd();
+  }
+  if (this.last_block !== null && this.last_block !== undefined) {
+    output.writeFieldBegin('last_block', Thrift.Type.I32, 4);
+    output.writeI32(this.last_block);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_result = function(args) {
+};
+Web_Sync_set_viewport_result.prototype = {};
+Web_Sync_set_viewport_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_viewport_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_args = function(args) {
+  this.id = null;
+  this.name = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.name !== undefined && args.name !== null) {
+      this.name = args.name;
+    }
+  }
+};
+Web_Sync_get_asset_args.prototype = {};
+Web_Sync_get_asset_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.name = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_get_asset_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.name !== null && this.name !== undefined) {
+    output.writeFieldBegin('name', Thrift.Type.STRING, 2);
+    output.writeString(this.name);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = args.success;
+    }
+  }
+};
+Web_Sync_get_asset_result.prototype = {};
+Web_Sync_get_asset_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRING) {
+        this.success = input.readString().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_get_asset_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRING, 0);
+    output.writeString(this.success);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_args = function(args) {
+  this.id = null;
+  this.viewer_id = null;
+  this.visible = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.viewer_id !== undefined && args.viewer_id !== null) {
+      this.viewer_id = args.viewer_id;
+    }
+    if (args.visible !== undefined && args.visible !== null) {
+      this.visible = args.visible;
+    }
+  }
+};
+Web_Sync_set_visibility_args.prototype = {};
+Web_Sync_set_visibility_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.viewer_id = input.readI32().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.BOOL) {
+        this.visible = input.readBool().value;
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_visibility_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.viewer_id !== null && this.viewer_id !== undefined) {
+    output.writeFieldBegin('viewer_id', Thrift.Type.I32, 2);
+    output.writeI32(this.viewer_id);
+    output.writeFieldEnd();
+  }
+  if (this.visible !== null && this.visible !== undefined) {
+    output.writeFieldBegin('visible', Thrift.Type.BOOL, 3);
+    output.writeBool(this.visible);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_result = function(args) {
+};
+Web_Sync_set_visibility_result.prototype = {};
+Web_Sync_set_visibility_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_visibility_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+Web_SyncClient = function(input, output) {
+  this.input = input;
+  this.output = (!output) ? input : output;
+  this.seqid = 0;
+};
+Web_SyncClient.prototype = {};
+
+Web_SyncClient.prototype.get_result = function(id, viewer_id, callback) {
+  this.send_get_result(id, viewer_id, callback); 
+  if (!callback) {
+    return this.recv_get_result();
+  }
+};
+
+Web_SyncClient.prototype.send_get_result = function(id, viewer_id, callback) {
+  var params = {
+    id: id,
+    viewer_id: viewer_id
+  };
+  var args = new Web_Sync_get_result_args(params);
+  try {
+    this.output.writeMessageBegin('get_result', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_get_result();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_get_result = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_get_result_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'get_result failed: unknown result';
+};
+
+Web_SyncClient.prototype.sync_editor = function(id, anchor, line_offset, callback) {
+  this.send_sync_editor(id, anchor, line_offset, callback); 
+  if (!callback) {
+  this.recv_sync_editor();
+  }
+};
+
+Web_SyncClient.prototype.send_sync_editor = function(id, anchor, line_offset, callback) {
+  var params = {
+    id: id,
+    anchor: anchor,
+    line_offset: line_offset
+  };
+  var args = new Web_Sync_sync_editor_args(params);
+  try {
+    this.output.writeMessageBegin('sync_editor', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_sync_editor();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_sync_editor = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_sync_editor_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
+};
+
+Web_SyncClient.prototype.request_ownership = function(id, anchor, callback) {
+  this.send_request_ownership(id, anchor, callback); 
+  if (!callback) {
+    return this.recv_request_ownership();
+  }
+};
+
+Web_SyncClient.prototype.send_request_ownership = function(id, anchor, callback) {
+  var params = {
+    id: id,
+    anchor: anchor
+  };
+  var args = new Web_Sync_request_ownership_args(params);
+  try {
+    this.output.writeMessageBegin('request_ownership', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_request_ownership();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_request_ownership = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_request_ownership_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'request_ownership failed: unknown result';
+};
+
+Web_SyncClient.prototype.edit_text = function(id, version, edits, callback) {
+  this.send_edit_text(id, version, edits, callback); 
+  if (!callback) {
+    return this.recv_edit_text();
+  }
+};
+
+Web_SyncClient.prototype.send_edit_text = function(id, version, edits, callback) {
+  var params = {
+    id: id,
+    version: version,
+    edits: edits
+  };
+  var args = new Web_Sync_edit_text_args(params);
+  try {
+    this.output.writeMessageBegin('edit_text', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_edit_text();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_edit_text = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_edit_text_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'edit_text failed: unknown result';
+};
+
+Web_SyncClient.prototype.set_viewport = function(id, version, first_block, last_block, callback) {
+  this.send_set_viewport(id, version, first_block, last_block, callback); 
+  if (!callback) {
+  this.recv_set_viewport();
+  }
+};
+
+Web_SyncClient.prototype.send_set_viewport = function(id, version, first_block, last_block, callback) {
+  var params = {
+    id: id,
+    version: version,
+    first_block: first_block,
+    last_block: last_block
+  };
+  var args = new Web_Sync_set_viewport_args(params);
+  try {
+    this.output.writeMessageBegin('set_viewport', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_set_viewport();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_set_viewport = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_set_viewport_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
+};
+
+Web_SyncClient.prototype.get_asset = function(id, name, callback) {
+  this.send_get_asset(id, name, callback); 
+  if (!callback) {
+    return this.recv_get_asset();
+  }
+};
+
+Web_SyncClient.prototype.send_get_asset = function(id, name, callback) {
+  var params = {
+    id: id,
+    name: name
+  };
+  var args = new Web_Sync_get_asset_args(params);
+  try {
+    this.output.writeMessageBegin('get_asset', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_get_asset();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_get_asset = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_get_asset_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  if (null !== result.success) {
+    return result.success;
+  }
+  throw 'get_asset failed: unknown result';
+};
+
+Web_SyncClient.prototype.set_visibility = function(id, viewer_id, visible, callback) {
+  this.send_set_visibility(id, viewer_id, visible, callback); 
+  if (!callback) {
+  this.recv_set_visibility();
+  }
+};
+
+Web_SyncClient.prototype.send_set_visibility = function(id, viewer_id, visible, callback) {
+  var params = {
+    id: id,
+    viewer_id: viewer_id,
+    visible: visible
+  };
+  var args = new Web_Sync_set_visibility_args(params);
+  try {
+    this.output.writeMessageBegin('set_visibility', Thrift.MessageType.CALL, this.seqid);
+    args.write(this.output);
+    this.output.writeMessageEnd();
+    if (callback) {
+      var self = this;
+      this.output.getTransport().flush(true, function() {
+        var result = null;
+        try {
+          result = self.recv_set_visibility();
+        } catch (e) {
+          result = e;
+        }
+        callback(result);
+      });
+    } else {
+      return this.output.getTransport().flush();
+    }
+  }
+  catch (e) {
+    if (typeof this.output.getTransport().reset === 'function') {
+      this.output.getTransport().reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_set_visibility = function() {
+  var ret = this.input.readMessageBegin();
+  var mtype = ret.mtype;
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(this.input);
+    this.input.readMessageEnd();
+    throw x;
+  }
+  var result = new Web_Sync_set_visibility_result();
+  result.read(this.input);
+  this.input.readMessageEnd();
+
+  return;
 };
@@ -20,17 +20,62 @@ class Get_Result_Type(object):
     html = 0
     build = 1
     status = 2
+    sync = 3
+    block = 4
 
     _VALUES_TO_NAMES = {
         0: "html",
         1: "build",
         2: "status",
+        3: "sync",
+        4: "block",
     }
 
     _NAMES_TO_VALUES = {
         "html": 0,
         "build": 1,
         "status": 2,
+        "sync": 3,
+        "block": 4,
+    }
+
+
+class Render_Quality(object):
+    full = 0
+    preview = 1
+    windowed = 2
+
+    _VALUES_TO_NAMES = {
+        0: "full",
+        1: "preview",
+        2: "windowed",
+    }
+
+    _NAMES_TO_VALUES = {
+        "full": 0,
+        "preview": 1,
+        "windowed": 2,
+    }
+
+
+class Editor_Result_Type(object):
+    sync = 0
+    stopped = 1
+    text = 2
+    request_ownership = 3
+
+    _VALUES_TO_NAMES = {
+        0: "sync",
+        1: "stopped",
+        2: "text",
+        3: "request_ownership",
+    }
+
+    _NAMES_TO_VALUES = {
+        "sync": 0,
+        "stopped": 1,
+        "text": 2,
+        "request_ownership": 3,
     }
 
 
@@ -39,13 +84,15 @@ class Get_Result_Return(object):
     Attributes:
      - gr_type
      - text
+     - quality
 
     """
 
 
-    def __init__(self, gr_type=None, text=None,):
+    def __init__(self, gr_type=None, text=None, quality=None,):
         self.gr_type = gr_type
         self.text = text
+        self.quality = quality
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -66,6 +113,11 @@ class Get_Result_Return(object):
                     self.text = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.quality = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -84,6 +136,10 @@ class Get_Result_Return(object):
             oprot.writeFieldBegin('text', TType.STRING, 2)
             oprot.writeString(self.text.encode('utf-8') if sys.version_info[0] == 2 else self.text)
             oprot.writeFieldEnd()
+        if self.quality is not None:
+            oprot.writeFieldBegin('quality', TType.I32, 3)
+            oprot.writeI32(self.quality)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -105,6 +161,470 @@ Get_Result_Return.thrift_spec = (
     None,  # 0
     (1, TType.I32, 'gr_type', None, None, ),  # 1
     (2, TType.STRING, 'text', 'UTF8', None, ),  # 2
+    (3, TType.I32, 'quality', None, None, ),  # 3
+)
+
+
+class Render_Client_Return(object):
+    """
+    Attributes:
+     - id
+     - html
+
+    """
+
+
+    def __init__(self, id=None, html=None,):
+        self.id = id
+        self.html = html
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.id = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.html = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Render_Client_Return')
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I32, 1)
+            oprot.writeI32(self.id)
+            oprot.writeFieldEnd()
+        if self.html is not None:
+            oprot.writeFieldBegin('html', TType.STRING, 2)
+            oprot.writeString(self.html.encode('utf-8') if sys.version_info[0] == 2 else self.html)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Render_Client_Return)
+Render_Client_Return.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'id', None, None, ),  # 1
+    (2, TType.STRING, 'html', 'UTF8', None, ),  # 2
+)
+
+
+class Text_Edit(object):
+    """
+    Attributes:
+     - start_line
+     - end_line
+     - text
+
+    """
+
+
+    def __init__(self, start_line=None, end_line=None, text=None,):
+        self.start_line = start_line
+        self.end_line = end_line
+        self.text = text
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.start_line = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.end_line = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.text = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Text_Edit')
+        if self.start_line is not None:
+            oprot.writeFieldBegin('start_line', TType.I32, 1)
+            oprot.writeI32(self.start_line)
+            oprot.writeFieldEnd()
+        if self.end_line is not None:
+            oprot.writeFieldBegin('end_line', TType.I32, 2)
+            oprot.writeI32(self.end_line)
+            oprot.writeFieldEnd()
+        if self.text is not None:
+            oprot.writeFieldBegin('text', TType.STRING, 3)
+            oprot.writeString(self.text.encode('utf-8') if sys.version_info[0] == 2 else self.text)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Text_Edit)
+Text_Edit.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'start_line', None, None, ),  # 1
+    (2, TType.I32, 'end_line', None, None, ),  # 2
+    (3, TType.STRING, 'text', 'UTF8', None, ),  # 3
+)
+
+
+class Editor_Result_Return(object):
+    """
+    Attributes:
+     - er_type
+     - line
+     - edits
+
+    """
+
+
+    def __init__(self, er_type=None, line=None, edits=None,):
+        self.er_type = er_type
+        self.line = line
+        self.edits = edits
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.er_type = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.line = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.edits = []
+                    (_etype3, _size0) = iprot.readListBegin()
+                    for _i4 in range(_size0):
+                        _elem5 = Text_Edit()
+                        _elem5.read(iprot)
+                        self.edits.append(_elem5)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Editor_Result_Return')
+        if self.er_type is not None:
+            oprot.writeFieldBegin('er_type', TType.I32, 1)
+            oprot.writeI32(self.er_type)
+            oprot.writeFieldEnd()
+        if self.line is not None:
+            oprot.writeFieldBegin('line', TType.I32, 2)
+            oprot.writeI32(self.line)
+            oprot.writeFieldEnd()
+        if self.edits is not None:
+            oprot.writeFieldBegin('edits', TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.edits))
+            for iter6 in self.edits:
+                iter6.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Editor_Result_Return)
+Editor_Result_Return.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'er_type', None, None, ),  # 1
+    (2, TType.I32, 'line', None, None, ),  # 2
+    (3, TType.LIST, 'edits', (TType.STRUCT, [Text_Edit, None], False), None, ),  # 3
+)
+
+
+class Ownership_Return(object):
+    """
+    Attributes:
+     - granted
+     - version
+     - start_line
+     - end_line
+     - text
+     - anchor
+
+    """
+
+
+    def __init__(self, granted=None, version=None, start_line=None, end_line=None, text=None, anchor=None,):
+        self.granted = granted
+        self.version = version
+        self.start_line = start_line
+        self.end_line = end_line
+        self.text = text
+        self.anchor = anchor
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.BOOL:
+                    self.granted = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.start_line = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.end_line = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.text = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.anchor = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Ownership_Return')
+        if self.granted is not None:
+            oprot.writeFieldBegin('granted', TType.BOOL, 1)
+            oprot.writeBool(self.granted)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 2)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.start_line is not None:
+            oprot.writeFieldBegin('start_line', TType.I32, 3)
+            oprot.writeI32(self.start_line)
+            oprot.writeFieldEnd()
+        if self.end_line is not None:
+            oprot.writeFieldBegin('end_line', TType.I32, 4)
+            oprot.writeI32(self.end_line)
+            oprot.writeFieldEnd()
+        if self.text is not None:
+            oprot.writeFieldBegin('text', TType.STRING, 5)
+            oprot.writeString(self.text.encode('utf-8') if sys.version_info[0] == 2 else self.text)
+            oprot.writeFieldEnd()
+        if self.anchor is not None:
+            oprot.writeFieldBegin('anchor', TType.STRING, 6)
+            oprot.writeString(self.anchor.encode('utf-8') if sys.version_info[0] == 2 else self.anchor)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Ownership_Return)
+Ownership_Return.thrift_spec = (
+    None,  # 0
+    (1, TType.BOOL, 'granted', None, None, ),  # 1
+    (2, TType.I32, 'version', None, None, ),  # 2
+    (3, TType.I32, 'start_line', None, None, ),  # 3
+    (4, TType.I32, 'end_line', None, None, ),  # 4
+    (5, TType.STRING, 'text', 'UTF8', None, ),  # 5
+    (6, TType.STRING, 'anchor', 'UTF8', None, ),  # 6
+)
+
+
+class Batch_Render_Result(object):
+    """
+    Attributes:
+     - path
+     - seconds
+     - error
+
+    """
+
+
+    def __init__(self, path=None, seconds=None, error=None,):
+        self.path = path
+        self.seconds = seconds
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.path = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.DOUBLE:
+                    self.seconds = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Batch_Render_Result')
+        if self.path is not None:
+            oprot.writeFieldBegin('path', TType.STRING, 1)
+            oprot.writeString(self.path.encode('utf-8') if sys.version_info[0] == 2 else self.path)
+            oprot.writeFieldEnd()
+        if self.seconds is not None:
+            oprot.writeFieldBegin('seconds', TType.DOUBLE, 2)
+            oprot.writeDouble(self.seconds)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 3)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Batch_Render_Result)
+Batch_Render_Result.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'path', 'UTF8', None, ),  # 1
+    (2, TType.DOUBLE, 'seconds', None, None, ),  # 2
+    (3, TType.STRING, 'error', 'UTF8', None, ),  # 3
 )
 fix_spec(all_structs)
 del all_structs
@@ -0,0 +1,179 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *******************************************
+# |docname| - Cache the lexing of code blocks
+# *******************************************
+# To tell comments from code, CodeChat lexes the whole file with Pygments before converting it to reST; for a file which is mostly code, this is about a third of the render. Yet most changes touch only one part of the file. So, the server lexes a file in blocks, split as |window| splits a file, and keeps the tokens of each block in a cache shared by all files and clients, keyed by the lexer, the text of the block and the lexer's state at its start. Only blocks whose text or starting state changed are lexed again.
+#
+# Pygments' ``RegexLexer`` keeps its state in a stack which begins as ``root`` and isn't visible to its caller, so blocks are lexed by lex_block_, which follows ``RegexLexer.get_tokens_unprocessed`` but stops at the end of a block and returns the stack. Since it matches within the whole text, a token may extend past the end of a block; the block's entry then records the text it read past the end, and applies only if the text which follows matches. Lexers which don't use ``RegexLexer``'s method of lexing aren't cached.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from collections import OrderedDict
+import threading
+
+# Third-party imports
+# -------------------
+from pygments.lexer import RegexLexer
+from pygments.token import Error, Whitespace, _TokenType
+
+# Local application imports
+# -------------------------
+from window import split_blocks
+
+
+# Cache
+# =====
+# The tokens of blocks, in least-recently-used order, keeping at most about ``max_chars`` characters of text. Each entry holds its block's text and its tokens, which together are a few times the size of the text.
+class LexCache:
+    def __init__(self, max_chars=8*2**20, block_lines=50):
+        self.max_chars = max_chars
+        self.block_lines = block_lines
+        self._lock = threading.Lock()
+        # Maps ``(lexer key, stack, text)`` to ``(tokens, text read past the block, stack)``, where each token is ``(offset from the start of the block, tokentype, value)``.
+        self._entries = OrderedDict()
+        self.chars_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    # Return ``lexer``, wrapped to use this cache if possible.
+    def wrap(self, lexer):
+        if not self.max_chars or type(lexer).get_tokens_unprocessed is not RegexLexer.get_tokens_unprocessed:
+            return lexer
+        return CachedLexer(lexer, self)
+
+    def _get(self, key, text, end):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and text.startswith(entry[1], end):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def _put(self, key, entry):
+        size = len(key[2]) + len(entry[1])
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.chars_used -= len(key[2]) + len(old[1])
+            self._entries[key] = entry
+            self.chars_used += size
+            while self.chars_used > self.max_chars and self._entries:
+                old_key, old = self._entries.popitem(last=False)
+                self.chars_used -= len(old_key[2]) + len(old[1])
+
+
+# Lexer
+# =====
+# A lexer which behaves as ``lexer``, but lexes through the cache.
+class CachedLexer:
+    def __init__(self, lexer, cache):
+        self._lexer = lexer
+        self._cache = cache
+        # Lexers of the same class and options lex the same text the same way.
+        self._key = (type(lexer), repr(sorted(lexer.options.items())))
+
+    def __getattr__(self, name):
+        return getattr(self._lexer, name)
+
+    def get_tokens_unprocessed(self, text):
+        lines = text.splitlines(True)
+        pos = 0
+        end = 0
+        stack = ("root",)
+        for start_line, end_line in split_blocks(lines, self._cache.block_lines):
+            end += sum(map(len, lines[start_line:end_line]))
+            if pos >= end:
+                # A token from an earlier block included all of this one.
+                continue
+            key = (self._key, stack, text[pos:end])
+            entry = self._cache._get(key, text, end)
+            if entry is None:
+                tokens, stop, end_stack = lex_block(self._lexer, text, pos, end, stack)
+                entry = (
+                    tuple((index - pos, tokentype, value) for index, tokentype, value in tokens),
+                    text[end:stop], end_stack
+                )
+                self._cache._put(key, entry)
+            for offset, tokentype, value in entry[0]:
+                yield pos + offset, tokentype, value
+            pos = end + len(entry[1])
+            stack = entry[2]
+
+
+# .. _lex_block:
+#
+# Lex ``text`` from ``pos``, with the lexer's state stack beginning as ``stack``, until reaching ``end``. Return ``(a list of (index, tokentype, value), the index where lexing stopped, the stack there as a tuple)``. This follows ``pygments.lexer.RegexLexer.get_tokens_unprocessed``, v. 2.21.
+def lex_block(lexer, text, pos, end, stack):
+    tokens = []
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    while pos < end:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        tokens.append((pos, action, m.group()))
+                    else:
+                        tokens.extend(action(lexer, m))
+                pos = m.end()
+                if new_state is not None:
+                    # State transition.
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        # Pop, but keep at least one state on the stack.
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    else:
+                        assert False, "wrong state def: {!r}".format(new_state)
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            # No rule matched.
+            if pos >= len(text):
+                break
+            if text[pos] == '\n':
+                # At the end of a line, reset the state to ``root``.
+                statestack = ['root']
+                statetokens = tokendefs['root']
+                tokens.append((pos, Whitespace, '\n'))
+            else:
+                tokens.append((pos, Error, text[pos]))
+            pos += 1
+    return tokens, pos, tuple(statestack)
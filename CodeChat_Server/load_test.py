@@ -0,0 +1,339 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************************************
+# |docname| - Load tests for the rendering server
+# ************************************************
+# This simulates many editors and web views using the server at once, using the generated ``Editor_Extension.Client`` and ``Web_Sync.Client``:
+#
+# editors
+#   Each editor connects to the Editor_Extension service, creates a client with ``render_client``, then types into a synthetic document (see |benchmark|) at a realistic rate, calling ``start_render`` after every keystroke as the VSCode extension does.
+# viewers
+#   Each viewer long-polls ``get_result`` through the Web_Sync service for one editor's client, as the web client does. Several viewers may show the same editor's client.
+#
+# Every keystroke updates a marker in the document which gives its sequence number. When a viewer receives HTML, it finds the marker and records the time since that keystroke was typed: the keystroke-to-HTML latency. Since the time is measured from when the keystroke was typed, not from when ``start_render`` was sent, this includes any time a keystroke waited for earlier renders to finish. The server renders only the latest text of a burst of keystrokes (see |render_queue|), so the HTML for a keystroke also delivers the keystrokes before it which weren't yet shown; each of these is recorded with its own latency.
+#
+# Given several numbers of editors with ``--ramp``, this runs a step for each and reports the first step at which the server saturates: the p99 latency exceeds ``--latency-target``, fewer than ``--min-delivery-ratio`` of the keystrokes typed were shown, or keystrokes are never delivered.
+#
+# Unless ``--external`` is given, this runs both servers in this process; since the simulated editors and viewers then compete with the server for the CPU, use ``--external`` with a separately started server for accurate saturation points. Run this from the ``CodeChat_Server`` directory; for example, ``python load_test.py --ramp 1 2 4 8 --viewers-per-editor 2``. Use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from datetime import datetime, timezone
+import json
+import platform
+import random
+import re
+import threading
+import time
+
+# Third-party imports
+# -------------------
+from thrift.Thrift import TApplicationException
+from thrift.protocol import TBinaryProtocol, TJSONProtocol
+from thrift.transport import TSocket, TTransport, THttpClient
+
+# Local application imports
+# -------------------------
+from benchmark import make_source, start_servers, percentile, max_rss_kb, versions
+from CodeChat_Services import Editor_Extension, Web_Sync
+from CodeChat_Services.ttypes import Get_Result_Type
+
+
+# The marker comment placed at the top of each document; the rendered HTML contains its text.
+MARKER = "# Load test keystroke {}."
+MARKER_RE = re.compile(r"Load test keystroke (\d+)\.")
+
+
+# Editors
+# =======
+# Type into a document, rendering after each keystroke.
+class Editor(threading.Thread):
+    def __init__(self, index, args, stop_typing):
+        super().__init__(daemon=True)
+        self.args = args
+        self.stop_typing = stop_typing
+        self.rand = random.Random(args.seed + index)
+        self.lines = make_source(args.lines, args.comment_density, args.seed + index).splitlines()
+        self.typed_line = len(self.lines)//2
+        self.lines.insert(self.typed_line, "#")
+        # Maps a keystroke's sequence number to the time it was typed.
+        self.keystroke_times = {}
+        self.seq = 0
+        # The time taken by each ``start_render`` call.
+        self.call_times = []
+        self.errors = 0
+        # Set by the viewers when they receive HTML, so the editor can wait for them to catch up before stopping.
+        self.delivered = threading.Condition()
+        self.viewer_seqs = {}
+
+        trans = TTransport.TBufferedTransport(TSocket.TSocket(args.host, args.editor_port))
+        self.client = Editor_Extension.Client(TBinaryProtocol.TBinaryProtocol(trans))
+        trans.open()
+        self.trans = trans
+        self.id = self.client.render_client().id
+
+    def text(self):
+        return "\n".join([MARKER.format(self.seq)] + self.lines) + "\n"
+
+    # Type one character into the current line, starting a new line when it's full.
+    def type_character(self):
+        line = self.lines[self.typed_line]
+        if len(line) >= 72:
+            self.typed_line += 1
+            self.lines.insert(self.typed_line, "#")
+        else:
+            self.lines[self.typed_line] += " " if self.rand.random() < 0.2 else self.rand.choice("abcdefghijklmnopqrstuvwxyz")
+
+    def render(self):
+        start = time.perf_counter()
+        try:
+            self.client.start_render(self.text(), "load_test.py", self.id)
+        except TApplicationException:
+            self.errors += 1
+        self.call_times.append(time.perf_counter() - start)
+
+    def run(self):
+        # The initial render, as the VSCode extension does when it opens a web view.
+        self.keystroke_times[0] = time.perf_counter()
+        self.render()
+        next_time = time.perf_counter()
+        while not self.stop_typing.is_set():
+            # Keystrokes arrive at random, at an average of ``cps`` characters per second.
+            next_time += self.rand.expovariate(self.args.cps)
+            delay = next_time - time.perf_counter()
+            if delay > 0 and self.stop_typing.wait(delay):
+                break
+            self.type_character()
+            self.seq += 1
+            self.keystroke_times[self.seq] = next_time
+            self.render()
+
+    # Called by a viewer which received the HTML for keystroke ``seq``.
+    def html_delivered(self, viewer_id, seq):
+        with self.delivered:
+            self.viewer_seqs[viewer_id] = seq
+            self.delivered.notify_all()
+
+    # Wait up to ``timeout`` seconds for every viewer to receive the HTML for the last keystroke, then stop the client, which stops its viewers.
+    def finish(self, viewer_count, timeout):
+        deadline = time.perf_counter() + timeout
+        with self.delivered:
+            self.delivered.wait_for(
+                lambda: len(self.viewer_seqs) == viewer_count and
+                    min(self.viewer_seqs.values()) >= self.seq,
+                max(0, deadline - time.perf_counter())
+            )
+        self.client.stop_render_client(self.id)
+        self.trans.close()
+
+
+# Viewers
+# =======
+# Long-poll for the results of an editor's client, recording the latency of each keystroke delivered.
+class Viewer(threading.Thread):
+    def __init__(self, editor, viewer_id, args, window):
+        super().__init__(daemon=True)
+        self.editor = editor
+        self.viewer_id = viewer_id
+        # ``[start, end]`` times of the measurement window; only keystrokes typed in it are recorded.
+        self.window = window
+        trans = THttpClient.THttpClient("http://{}:{}/".format(args.host, args.web_port))
+        self.client = Web_Sync.Client(TJSONProtocol.TJSONProtocol(trans))
+        self.latencies = []
+        self.keystrokes_delivered = 0
+        self.html_count = 0
+        self.html_bytes = 0
+        self.last_seq = -1
+
+    def run(self):
+        while True:
+            result = self.client.get_result(self.editor.id, self.viewer_id)
+            if result.gr_type == Get_Result_Type.status and json.loads(result.text).get("stopped"):
+                # The editor stopped its client.
+                return
+            if result.gr_type != Get_Result_Type.html:
+                continue
+            now = time.perf_counter()
+            match = MARKER_RE.search(result.text)
+            if not match:
+                continue
+            seq = int(match.group(1))
+            if seq > self.last_seq:
+                if self.window[0] <= self.editor.keystroke_times[seq] < self.window[1]:
+                    self.html_count += 1
+                    self.html_bytes += len(result.text)
+                # This HTML also shows the keystrokes skipped since the last HTML.
+                for delivered_seq in range(self.last_seq + 1, seq + 1):
+                    typed_time = self.editor.keystroke_times[delivered_seq]
+                    if self.window[0] <= typed_time < self.window[1]:
+                        self.latencies.append(now - typed_time)
+                        self.keystrokes_delivered += 1
+                self.last_seq = seq
+                self.editor.html_delivered(self.viewer_id, seq)
+
+
+# Load tests
+# ==========
+# Run one step of the load test with the given number of editors, returning a dict of results.
+def run_step(args, editor_count):
+    stop_typing = threading.Event()
+    window = [float("inf"), float("inf")]
+    editors = [Editor(i, args, stop_typing) for i in range(editor_count)]
+    viewers = [
+        Viewer(editor, viewer_id, args, window)
+        for editor in editors
+        for viewer_id in range(1, args.viewers_per_editor + 1)
+    ]
+    for thread in viewers + editors:
+        thread.start()
+
+    time.sleep(args.warmup)
+    window[0] = time.perf_counter()
+    time.sleep(args.duration)
+    window[1] = time.perf_counter()
+    stop_typing.set()
+    for editor in editors:
+        editor.join()
+    for editor in editors:
+        editor.finish(args.viewers_per_editor, args.drain)
+    for viewer in viewers:
+        viewer.join(args.drain)
+
+    elapsed = window[1] - window[0]
+    keystrokes = sum(
+        1 for editor in editors for t in editor.keystroke_times.values()
+        if window[0] <= t < window[1]
+    )
+    latencies = sorted(latency for viewer in viewers for latency in viewer.latencies)
+    call_times = sorted(t for editor in editors for t in editor.call_times)
+    html_count = sum(viewer.html_count for viewer in viewers)
+    keystrokes_delivered = sum(viewer.keystrokes_delivered for viewer in viewers)
+    # Each viewer should receive HTML reflecting the last keystroke typed in the window, unless it was stopped before catching up.
+    undelivered = sum(
+        max(0, viewer.editor.seq - viewer.last_seq) for viewer in viewers
+    )
+    return {
+        "editors": editor_count,
+        "viewers": len(viewers),
+        "keystrokes_per_second": keystrokes/elapsed,
+        "html_per_second": html_count/elapsed,
+        # The fraction of keystrokes typed which each viewer was shown, in HTML for that keystroke or a later one; below 1, the server is falling behind.
+        "delivery_ratio": keystrokes_delivered/(keystrokes*args.viewers_per_editor) if keystrokes and viewers else None,
+        "undelivered_keystrokes": undelivered,
+        "p50": percentile(latencies, 50) if latencies else None,
+        "p90": percentile(latencies, 90) if latencies else None,
+        "p99": percentile(latencies, 99) if latencies else None,
+        "max": latencies[-1] if latencies else None,
+        "start_render_p50": percentile(call_times, 50) if call_times else None,
+        "start_render_p99": percentile(call_times, 99) if call_times else None,
+        "html_bytes_per_second": sum(viewer.html_bytes for viewer in viewers)/elapsed,
+        "errors": sum(editor.errors for editor in editors),
+        "max_rss_kb": max_rss_kb(),
+    }
+
+
+# Return True if the results of a step show the server is saturated.
+def is_saturated(result, args):
+    return (
+        result["p99"] is None or result["p99"] > args.latency_target or
+        result["undelivered_keystrokes"] > 0 or
+        (result["delivery_ratio"] or 0) < args.min_delivery_ratio
+    )
+
+
+def run(args):
+    if not args.external:
+        start_servers(args)
+
+    results = []
+    for editor_count in args.ramp:
+        result = run_step(args, editor_count)
+        result["saturated"] = is_saturated(result, args)
+        results.append(result)
+        print_result(result)
+        if result["saturated"] and not args.keep_going:
+            break
+
+    saturated = [r["editors"] for r in results if r["saturated"]]
+    if saturated:
+        print("Saturated at {} editors.".format(saturated[0]))
+    else:
+        print("Not saturated at {} editors.".format(results[-1]["editors"]))
+    return results
+
+
+# Reporting
+# =========
+def _ms(value):
+    return "{:8.1f} ms".format(value*1000) if value is not None else "       - ms"
+
+
+def print_result(result):
+    print(
+        "{editors:4} editors {viewers:4} viewers  {keystrokes_per_second:7.1f} keys/s  "
+        "{html_per_second:7.1f} HTML/s  p50 {p50}  p99 {p99}  max {max}  "
+        "undelivered {undelivered_keystrokes}{saturated}".format(
+            p50=_ms(result["p50"]), p99=_ms(result["p99"]), max=_ms(result["max"]),
+            saturated="  SATURATED" if result["saturated"] else "", **{
+                k: v for k, v in result.items() if k not in ("p50", "p99", "max", "saturated")
+            }
+        )
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the CodeChat rendering server.")
+    parser.add_argument('--ramp', nargs='+', type=int, default=(1, 2, 4, 8, 16), metavar='EDITORS', help="The number of editors in each step.")
+    parser.add_argument('--viewers-per-editor', type=int, default=1, help="Web views showing each editor's client.")
+    parser.add_argument('--cps', type=float, default=5, help="Average keystrokes per second typed by each editor; 5 is about 60 words per minute.")
+    parser.add_argument('--lines', type=int, default=500, help="Size of each editor's document, in lines.")
+    parser.add_argument('--comment-density', type=float, default=0.5, help="Fraction of each document which is comments.")
+    parser.add_argument('--duration', type=float, default=10, help="Seconds measured in each step.")
+    parser.add_argument('--warmup', type=float, default=2, help="Seconds of typing before measuring each step.")
+    parser.add_argument('--drain', type=float, default=30, help="Seconds to wait after typing stops for viewers to receive the last keystroke.")
+    parser.add_argument('--latency-target', type=float, default=1.0, help="The server is saturated when the p99 keystroke-to-HTML latency exceeds this, in seconds.")
+    parser.add_argument('--min-delivery-ratio', type=float, default=0.9, help="The server is saturated when viewers are shown less than this fraction of keystrokes, counting those skipped by a later render.")
+    parser.add_argument('--keep-going', action='store_true', help="Run every step, even after the server saturates.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the documents and typing.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--editor-port', type=int, default=9090)
+    parser.add_argument('--web-port', type=int, default=5000)
+    parser.add_argument('--external', action='store_true', help="Use an already-running server instead of starting one in this process.")
+    parser.add_argument('--json', metavar='FILE', help="Save the results as JSON.")
+    args = parser.parse_args(argv)
+
+    run_info = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "versions": versions(),
+        "args": vars(args),
+        "results": run(args),
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(run_info, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************
+# |docname| - Metrics for the render server
+# ****************************************
+# This module provides counters, gauges and histograms which the CodeChat server uses to record render counts, latencies, queue depths and so on. A registry collects these metrics and reports them either in the `Prometheus text format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_ or as a JSON-compatible snapshot.
+#
+# Each metric may have labels. The value for a given set of labels is selected by passing the label values as keyword arguments, for example ``results_delivered.inc(gr_type="html")``.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import bisect
+from contextlib import ContextDecorator
+import threading
+import time
+
+
+# Metrics
+# =======
+# The base class for all metrics. It stores one value per combination of label values.
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    # Return the key into ``_values`` for the given labels.
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError("{} expects labels {}, got {}.".format(
+                self.name, self.labelnames, tuple(labels)
+            ))
+        return tuple(str(labels[labelname]) for labelname in self.labelnames)
+
+    # Return a list of ``(labels dict, value)`` for this metric.
+    def samples(self):
+        with self._lock:
+            return [
+                (dict(zip(self.labelnames, key)), value)
+                for key, value in self._values.items()
+            ]
+
+
+# A value which only increases, such as the number of renders performed.
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+# A value which may go up or down, such as the depth of a queue. Instead of setting a gauge, a function may be provided which computes the gauge's samples each time the metric is read; it must return a list of ``(labels dict, value)``.
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name, help, labelnames=(), function=None):
+        super().__init__(name, help, labelnames)
+        self.function = function
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        if self.function:
+            return self.function()
+        return super().samples()
+
+
+# The default histogram buckets, in seconds, span a fast render of a small file through a slow project build.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+    30, 60,
+)
+
+
+# Count observations, such as render latencies, in a fixed set of buckets.
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            # The value for a histogram is ``[bucket counts, sum, count]``; the last bucket is ``+Inf``.
+            hist = self._values.get(key)
+            if hist is None:
+                hist = self._values[key] = [[0]*(len(self.buckets) + 1), 0, 0]
+            hist[0][bisect.bisect_left(self.buckets, value)] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    # Time a block of code or a function, recording its run time in seconds. Use as ``with histogram.time():`` or as a decorator ``@histogram.time()``.
+    def time(self, **labels):
+        return _Timer(self, labels)
+
+    def samples(self):
+        with self._lock:
+            return [
+                (dict(zip(self.labelnames, key)), {
+                    "buckets": list(zip(self.buckets + (float("inf"),), _cumulative(counts))),
+                    "sum": sum_,
+                    "count": count,
+                })
+                for key, (counts, sum_, count) in self._values.items()
+            ]
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+        # Each thread times its own calls, since a decorated function may be called from several threads at once.
+        self._local = threading.local()
+
+    def __enter__(self):
+        self._local.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self._local.start_time, **self.labels)
+        return False
+
+
+def _cumulative(counts):
+    total = 0
+    ret = []
+    for count in counts:
+        total += count
+        ret.append(total)
+    return ret
+
+
+# Registry
+# ========
+# A collection of metrics.
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self.start_time = time.time()
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, *args, **kwargs):
+        return self.register(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs):
+        return self.register(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs):
+        return self.register(Histogram(*args, **kwargs))
+
+    # Return all metrics in the Prometheus text format.
+    def prometheus_text(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append("# HELP {} {}".format(metric.name, _escape_help(metric.help)))
+            lines.append("# TYPE {} {}".format(metric.name, metric.type_name))
+            for labels, value in metric.samples():
+                if metric.type_name == "histogram":
+                    for le, count in value["buckets"]:
+                        lines.append(_sample_line(
+                            metric.name + "_bucket", dict(labels, le=_format_value(le)), count
+                        ))
+                    lines.append(_sample_line(metric.name + "_sum", labels, value["sum"]))
+                    lines.append(_sample_line(metric.name + "_count", labels, value["count"]))
+                else:
+                    lines.append(_sample_line(metric.name, labels, value))
+        return "\n".join(lines) + "\n"
+
+    # Return all metrics as a JSON-compatible dict. Histograms also include estimated quantiles.
+    def snapshot(self):
+        ret = {"uptime": time.time() - self.start_time, "metrics": {}}
+        for metric in self._metrics:
+            samples = []
+            for labels, value in metric.samples():
+                if metric.type_name == "histogram":
+                    value = dict(
+                        value,
+                        buckets=[[_format_value(le), count] for le, count in value["buckets"]],
+                        p50=_quantile(0.5, value),
+                        p99=_quantile(0.99, value),
+                    )
+                samples.append({"labels": labels, "value": value})
+            ret["metrics"][metric.name] = {
+                "type": metric.type_name,
+                "help": metric.help,
+                "samples": samples,
+            }
+        return ret
+
+
+# Estimate a quantile from histogram buckets by returning the upper bound of the bucket containing it, as Prometheus does without interpolation. Return None if there are no observations.
+def _quantile(q, hist):
+    if not hist["count"]:
+        return None
+    rank = q*hist["count"]
+    for le, count in hist["buckets"]:
+        if count >= rank:
+            return le if le != float("inf") else None
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_help(s):
+    return s.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _escape_label(s):
+    return _escape_help(s).replace('"', r'\"')
+
+
+def _sample_line(name, labels, value):
+    if labels:
+        name += "{" + ",".join(
+            '{}="{}"'.format(k, _escape_label(str(v))) for k, v in labels.items()
+        ) + "}"
+    return "{} {}".format(name, _format_value(value))
+
+
+# The registry used by the CodeChat server.
+registry = Registry()
@@ -0,0 +1,155 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **************************************************************
+# |docname| - Map between source lines and rendered HTML elements
+# **************************************************************
+# Syncing the editor and web view requires finding the HTML element produced from a given source line, and the reverse. To do this, each render adds an anchor (an ``id`` attribute) to every block-level element in the doctree before it's written as HTML, then records the source line at which each element begins. These lines are stored in a compact sorted array, so each lookup is a binary search which needs no re-render; the anchor for the ``k``\ th element is ``CodeChat-sync-k``, so the array needs no other data. The exception is an element which already has an id, such as a paragraph following a ``.. _target:``: since adding a second id changes the HTML, its existing id is its anchor, which the map stores.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from array import array
+from bisect import bisect_right
+
+# Third-party imports
+# -------------------
+from docutils import nodes
+
+
+ANCHOR_PREFIX = "CodeChat-sync-"
+
+
+# Position map
+# ============
+class PositionMap:
+    # ``lines`` is a sorted array of the 1-based source line at which each anchored element begins; the source contains ``line_count`` lines. Anchors begin with ``prefix``, except those in ``ids``, which maps an element's index to the id used as its anchor.
+    def __init__(self, lines, line_count, prefix=ANCHOR_PREFIX, ids=None):
+        self.lines = lines
+        self.line_count = line_count
+        self.prefix = prefix
+        self.ids = ids or {}
+        self._id_indexes = {id: index for index, id in self.ids.items()}
+        # The version of the document rendered to produce this map; see |document|. The server sets this.
+        self.version = None
+
+    # Return a map sharing these lines, for the given version of another document with the same text.
+    def with_version(self, version):
+        position_map = PositionMap(self.lines, self.line_count, self.prefix, self.ids)
+        position_map.version = version
+        return position_map
+
+    # Return a map for these elements within a larger source of ``line_count`` lines, in which they begin ``offset`` lines later.
+    def offset(self, offset, line_count):
+        return PositionMap(array("l", (line + offset for line in self.lines)), line_count, self.prefix, self.ids)
+
+    # Return ``(anchor, line offset)`` for the element containing the given 1-based source line, where the offset gives the number of lines from the start of the element to this line. Return ``(None, 0)`` if the map is empty.
+    def anchor_for_line(self, line):
+        if not self.lines:
+            return None, 0
+        index = max(bisect_right(self.lines, line) - 1, 0)
+        return self.ids.get(index) or self.prefix + str(index), max(line - self.lines[index], 0)
+
+    # Return the 1-based source line for the given anchor plus ``line_offset`` lines, or None if the anchor isn't in this map.
+    def line_for_anchor(self, anchor, line_offset=0):
+        index = self._index(anchor)
+        if index is None:
+            return None
+        return self.lines[index] + max(line_offset, 0)
+
+    # Return ``(start line, end line)`` of the source for the given anchor, where the end line is the line after the element, or None if the anchor isn't in this map.
+    def line_range_for_anchor(self, anchor):
+        index = self._index(anchor)
+        if index is None:
+            return None
+        if index + 1 < len(self.lines):
+            return self.lines[index], self.lines[index + 1]
+        return self.lines[index], self.line_count + 1
+
+    # Return True if ``anchor`` is in this map.
+    def has_anchor(self, anchor):
+        return self._index(anchor) is not None
+
+    # Return the first of ``anchors``, the ids of an element and its ancestors separated by spaces as a web view sends them, which is in this map, or None.
+    def find_anchor(self, anchors):
+        return next((anchor for anchor in anchors.split() if self.has_anchor(anchor)), None)
+
+    def _index(self, anchor):
+        if anchor in self._id_indexes:
+            return self._id_indexes[anchor]
+        if not anchor.startswith(self.prefix):
+            return None
+        try:
+            index = int(anchor[len(self.prefix):])
+        except ValueError:
+            return None
+        return index if 0 <= index < len(self.lines) and index not in self.ids else None
+
+
+# Add an anchor to each block-level element in ``document``, a doctree rendered from source code with ``line_count`` lines, and return a PositionMap for these anchors. Each anchor is ``prefix`` followed by a number.
+#
+# Docutils reports the first line of paragraphs and similar elements, and the underline of titles. However, CodeChat's code blocks report unrelated lines; since a code block contains its source lines verbatim, its first line is instead computed from the start of the element following it. Elements which would leave the map unsorted, such as system messages, aren't anchored.
+#
+# Anchors add ids only, leaving the rest of the HTML unchanged: an element which already has an id is anchored by it, and the HTML writer's compact paragraphs are anchored by their parents.
+def add_sync_anchors(document, line_count, prefix=ANCHOR_PREFIX):
+    # Find the starting line of each element, in document order.
+    elements = []
+    for node in document.findall(nodes.TextElement):
+        if isinstance(node, (nodes.Inline, nodes.comment, nodes.raw)) or node.line is None:
+            continue
+        if isinstance(node, nodes.title):
+            elements.append([node, node.line - 1])
+        elif isinstance(node, nodes.literal_block):
+            elements.append([node, None])
+        else:
+            elements.append([node, node.line])
+    next_line = line_count + 1
+    for element in reversed(elements):
+        if element[1] is None:
+            element[1] = next_line - (element[0].astext().count("\n") + 1)
+        next_line = element[1]
+
+    lines = array("l")
+    ids = {}
+    for node, line in elements:
+        if lines and line <= lines[-1]:
+            continue
+        if _may_be_compact(node):
+            node = node.parent
+        if node["ids"]:
+            ids[len(lines)] = node["ids"][0]
+        else:
+            node["ids"].append(prefix + str(len(lines)))
+        lines.append(line)
+    return PositionMap(lines, line_count, prefix, ids)
+
+
+# Return True if ``node`` is a paragraph which the HTML writer may render compactly, without ``<p>`` tags, as it does the only paragraph of a list item, table cell, footnote or citation. It won't if the paragraph has an id. This follows ``should_be_compact_paragraph`` in ``docutils.writers.html4css1``.
+def _may_be_compact(node):
+    parent = node.parent
+    if not isinstance(node, nodes.paragraph) or isinstance(parent, (nodes.document, nodes.compound)):
+        return False
+    for child in parent.children[isinstance(parent[0], nodes.label):]:
+        if child is node:
+            return True
+        if not isinstance(child, nodes.Invisible):
+            return False
+    return False
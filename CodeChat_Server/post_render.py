@@ -0,0 +1,125 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***********************************************
+# |docname| - Process renders before sending them
+# ***********************************************
+# Before the server sends a render's HTML to the web views, it passes the HTML through a pipeline of stages, each a function which takes HTML and returns HTML. The default stages are:
+#
+# ExtractStylesheets_
+#   Every render embeds the same style sheets: those of Docutils and ``CodeChat.css``, about 10 KB, or Pygments' for a quick highlight. This stage replaces each with a placeholder naming it, keeping its text in an AssetStore_. The web view requests each style sheet it hasn't seen once through ``get_asset``, then puts it back in place of the placeholder before showing the HTML.
+# minify_html_
+#   Remove comments and collapse whitespace outside preformatted elements.
+#
+# Other stages, such as sanitizing the HTML, can be added to the pipeline's list of stages. Renders are kept as rendered, so the pipeline runs each time one is sent; renders written to files, such as by |export|, don't pass through it.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import hashlib
+import re
+import threading
+
+
+# Pipeline
+# ========
+class PostRenderPipeline:
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    def __call__(self, html):
+        for stage in self.stages:
+            html = stage(html)
+        return html
+
+
+# .. _AssetStore:
+#
+# Assets
+# ======
+# The assets removed from renders, keyed by a hash of their text, so the same text always has the same name. Only a few distinct style sheets occur, so these are never discarded.
+class AssetStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assets = {}
+
+    # Store ``text``, returning its name.
+    def add(self, text):
+        name = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            self._assets.setdefault(name, text)
+        return name
+
+    # Return the text of the named asset, or None if it's unknown.
+    def get(self, name):
+        with self._lock:
+            return self._assets.get(name)
+
+
+# .. _ExtractStylesheets:
+#
+# Style sheets
+# ============
+# Docutils and Pygments embed style sheets in the document's head.
+STYLE_RE = re.compile(r'<style type="text/css">(.*?)</style>', re.S)
+ASSET_TAG = '<style data-codechat-asset="{}"></style>'
+
+
+class ExtractStylesheets:
+    def __init__(self, store):
+        self.store = store
+
+    def __call__(self, html):
+        head_end = html.find("</head>")
+        if head_end < 0:
+            return html
+        head = STYLE_RE.sub(lambda match: ASSET_TAG.format(self.store.add(match.group(1))), html[:head_end])
+        return head + html[head_end:]
+
+
+# .. _minify_html:
+#
+# Minifying
+# =========
+# Elements whose contents are kept as they are, comments, and other tags.
+_MINIFY_RE = re.compile(
+    r"(<(pre|textarea|script|style)\b.*?</\2\s*>|<!--.*?-->|<[^>]*>)",
+    re.S | re.I
+)
+# Whitespace in text, as HTML defines it; a no-break space isn't whitespace.
+_NEWLINE_RE = re.compile(r"[ \t\r\f]*\n[ \t\r\n\f]*")
+_SPACES_RE = re.compile(r"[ \t\r\f]{2,}")
+
+
+# Remove comments and collapse each run of whitespace in text to one newline, if it contains one, or one space. This doesn't change how the HTML is shown.
+def minify_html(html):
+    pieces = _MINIFY_RE.split(html)
+    out = []
+    # ``split`` returns the text between matches, followed by each match and the name of the element it kept, if any.
+    for index in range(0, len(pieces), 3):
+        text = pieces[index]
+        if text:
+            out.append(_SPACES_RE.sub(" ", _NEWLINE_RE.sub("\n", text)))
+        if index + 1 < len(pieces):
+            tag = pieces[index + 1]
+            if not tag.startswith("<!--"):
+                out.append(tag)
+    return "".join(out)
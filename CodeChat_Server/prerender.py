@@ -0,0 +1,118 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **********************************************
+# |docname| - Render files before they're opened
+# **********************************************
+# This asks a running server to render files, and every supported file in the directories given, through its ``render_batch`` service, so that opening any of them later shows a render immediately; for example, run ``python prerender.py ~/project`` at login. It then reports the time taken to render each file and any errors, slowest first.
+#
+# With ``--local``, this renders the files in this process's own pool of workers instead of a server's and only reports the results; a CI job can use this to check that a repository's files render without errors. It exits with status 1 if any file failed to render. Run this from the ``CodeChat_Server`` directory; use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+import json
+import os
+import sys
+import time
+
+# Third-party imports
+# -------------------
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TSocket, TTransport
+
+# Local application imports
+# -------------------------
+import CodeChatServer
+from CodeChat_Services import Editor_Extension
+
+
+# Rendering
+# =========
+# Return a Batch_Render_Result for each file, using the server's Editor_Extension service.
+def render_remote(paths, host, port):
+    transport = TTransport.TBufferedTransport(TSocket.TSocket(host, port))
+    client = Editor_Extension.Client(TBinaryProtocol.TBinaryProtocol(transport))
+    transport.open()
+    try:
+        return client.render_batch(paths)
+    finally:
+        transport.close()
+
+
+# Return a Batch_Render_Result for each file, rendering in this process's own workers.
+def render_local(paths, workers):
+    handler = CodeChatServer.CodeChatHandler()
+    handler.render_workers = workers
+    return handler.render_batch(paths)
+
+
+# Reporting
+# =========
+def print_report(results, seconds):
+    errors = 0
+    for result in sorted(results, key=lambda result: result.seconds, reverse=True):
+        print("{:8.3f} s  {}".format(result.seconds, result.path))
+        if result.error:
+            errors += 1
+            print("            Error: {}".format(result.error))
+    print("Rendered {} files in {:.2f} s ({:.2f} s of rendering); {} errors.".format(
+        len(results), seconds, sum(result.seconds for result in results), errors
+    ))
+
+
+# Main
+# ====
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render files before they're opened, and report the time each took.")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="A file, or a directory whose supported files are rendered.")
+    parser.add_argument("--host", default="127.0.0.1", help="The server's host.")
+    parser.add_argument("--port", type=int, default=9090, help="The port of the server's Editor_Extension service.")
+    parser.add_argument("--local", action="store_true", help="Render in this process instead of a server, only reporting the results.")
+    parser.add_argument("--workers", type=int, help="With --local, the number of processes to use; by default, one per CPU.")
+    parser.add_argument("--json", metavar="FILE", help="Also save the results to this file as JSON.")
+    args = parser.parse_args(argv)
+
+    # The server may run in another directory.
+    paths = [os.path.abspath(path) for path in args.paths]
+    start = time.perf_counter()
+    if args.local:
+        results = render_local(paths, args.workers)
+    else:
+        results = render_remote(paths, args.host, args.port)
+    seconds = time.perf_counter() - start
+
+    print_report(results, seconds)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "seconds": seconds,
+                "files": [
+                    {"path": result.path, "seconds": result.seconds, "error": result.error}
+                    for result in results
+                ],
+            }, f, indent=2)
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************
+# |docname| - Choose how to render a file
+# ****************************************
+# render_phases_ renders a file with one of several backends. Each is registered for the file names it handles and has a cost; a render uses the cheapest backend which handles its file and accepts its text. The backends are:
+#
+# CodeOnlyBackend_
+#   Source code with no reST comments, though it may have comments which follow code on the same line. CodeChat turns the whole file into one code block, which this writes directly instead of classifying each line. The result is the same as CodeChat's.
+# RestBackend_
+#   ``.rst`` files, which Docutils parses directly.
+# MarkdownBackend_
+#   ``.md`` files, when the optional Markdown package is installed. Its HTML doesn't record source lines, so the editor and web view can't be synced.
+# CodeChatBackend_
+#   Everything else, through ``CodeChat.CodeToRest.code_to_rest_string``.
+#
+# All but the Markdown backend produce reST, which the server then parses, transforms and writes as usual.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from array import array
+import ast
+import fnmatch
+import os
+import re
+
+# Third-party imports
+# -------------------
+from CodeChat.CodeToRest import code_to_rest_string, rest_codechat_style
+from CodeChat.CommentDelimiterInfo import COMMENT_DELIMITER_INFO
+from CodeChat.SourceClassifier import get_lexer
+from pygments.token import Comment, String, Text, Whitespace
+
+try:
+    import markdown
+except ImportError:
+    markdown = None
+
+# Local application imports
+# -------------------------
+from position_map import PositionMap
+
+
+# Source
+# ======
+# The text to render and its path. Since several backends may examine a file before one accepts it, its lexer is found once, when first needed; a backend may also keep what it found while accepting the file here, for its render.
+class Source:
+    def __init__(self, text, path, lex_cache):
+        self.text = text
+        self.path = path
+        self._lex_cache = lex_cache
+        self._lexer = None
+
+    @property
+    def lexer(self):
+        if self._lexer is None:
+            self._lexer = self._lex_cache.wrap(get_lexer(filename=self.path, code=self.text))
+        return self._lexer
+
+
+# Registry
+# ========
+# The backends, cheapest first. If ``enabled`` isn't None, only the backends it names, plus ``codechat``, which renders any file CodeChat supports, are chosen.
+class RenderBackends:
+    def __init__(self):
+        self._backends = []
+        self.enabled = None
+
+    def register(self, backend):
+        self._backends.append(backend)
+        self._backends.sort(key=lambda backend: backend.cost)
+
+    def names(self):
+        return [backend.name for backend in self._backends]
+
+    # Return the cheapest enabled backend for ``source``.
+    def choose(self, source):
+        name = os.path.basename(source.path or "")
+        for backend in self._backends:
+            if self.enabled is not None and backend.name not in self.enabled and backend.name != CodeChatBackend.name:
+                continue
+            if any(fnmatch.fnmatch(name, glob) for glob in backend.globs) and backend.accepts(source):
+                return backend
+        raise LookupError("No render backend accepts {}.".format(source.path))
+
+
+# Backends
+# ========
+# A backend has a ``name``, a relative ``cost``, and ``globs`` giving the file names it handles. ``accepts(source)`` tells if it can render this text of the file; ``render(source, publish, anchor_prefix, parts)`` renders it, returning ``(html, position map)`` as render_phases_ does. ``publish(rest)`` renders reST as the server does, returning the same.
+class RestSourceBackend:
+    globs = ("*",)
+
+    def accepts(self, source):
+        return True
+
+    def render(self, source, publish, anchor_prefix, parts):
+        return publish(self.convert(source))
+
+
+# .. _CodeChatBackend:
+#
+# CodeChat
+# --------
+class CodeChatBackend(RestSourceBackend):
+    name = "codechat"
+    cost = 100
+
+    def convert(self, source):
+        return code_to_rest_string(source.text, lexer=source.lexer)
+
+
+# .. _CodeOnlyBackend:
+#
+# Code only
+# ---------
+# CodeChat groups tokens as ``CodeChat.SourceClassifier._group_for_tokentype`` does: whitespace, these comments, or other tokens. A line is a reST comment only if it has no other tokens, so a comment which follows code on its line, such as ``x = 1  # Note``, is part of the code; so are the following lines of a block comment which begins this way.
+COMMENT_TOKENS = {Comment, Comment.Single, Comment.Singleline, Comment.Multiline}
+# CodeChat splits lines at these characters as well as newlines, which makes a line of only whitespace which contains one into a comment.
+LINE_BREAKS_RE = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class CodeOnlyBackend(RestSourceBackend):
+    name = "code"
+    cost = 10
+
+    # Accept source code in which every comment follows code on its line. Before classifying lines, CodeChat preprocesses the text as Pygments does, then reports any syntax error in Python code and makes its docstrings into comments; this does the same, keeping the text for convert_.
+    def accepts(self, source):
+        lexer = source.lexer
+        if lexer.name not in COMMENT_DELIMITER_INFO or lexer.filters:
+            return False
+        is_python = lexer.name in ("Python", "Python 3")
+        # This follows ``pygments.lexer.Lexer.get_tokens``, v. 2.21.
+        text = lexer._preprocess_lexer_input(source.text)
+        if not text.endswith("\n") or LINE_BREAKS_RE.search(text):
+            return False
+        # True if the current line has a token other than whitespace or a comment.
+        line_has_code = False
+        for index, tokentype, value in lexer.get_tokens_unprocessed(text):
+            if tokentype in COMMENT_TOKENS:
+                if not line_has_code:
+                    return False
+                # The next line may begin with the rest of this comment.
+                if "\n" in value:
+                    line_has_code = False
+            elif tokentype in Text or tokentype in Whitespace:
+                if "\n" in value:
+                    line_has_code = False
+            elif is_python and tokentype in String.Doc:
+                return False
+            else:
+                line_has_code = not value.endswith("\n")
+        if is_python:
+            try:
+                ast.parse(text)
+            except SyntaxError:
+                return False
+        source.code_only_text = text
+        return True
+
+    # .. _convert:
+    #
+    # This produces the same reST as ``_generate_rest`` in ``CodeChat.CodeToRest`` does for a file of code lines. CodeChat ends a line only at a newline, and the preprocessed text always ends with one.
+    def convert(self, source):
+        lines = source.code_only_text[:-1].split("\n")
+        return "{}\n.. fenced-code::\n\n Beginning fence\n {}\n Ending fence\n\n..\n\n".format(
+            rest_codechat_style, "\n ".join(lines)
+        )
+
+
+# .. _RestBackend:
+#
+# reST
+# ----
+class RestBackend(RestSourceBackend):
+    name = "rest"
+    cost = 0
+    globs = ("*.rst", "*.rest")
+
+    def convert(self, source):
+        return source.text
+
+
+# .. _MarkdownBackend:
+#
+# Markdown
+# --------
+MARKDOWN_HEAD_PREFIX = '<!DOCTYPE html>\n<html>\n<head>\n'
+MARKDOWN_HEAD = '<meta charset="utf-8" />\n'
+MARKDOWN_BODY_PREFIX = '</head>\n<body>\n'
+MARKDOWN_BODY_SUFFIX = '\n</body>\n</html>\n'
+
+
+class MarkdownBackend:
+    name = "markdown"
+    cost = 0
+    globs = ("*.md", "*.markdown")
+    extensions = ["fenced_code", "tables"]
+
+    def accepts(self, source):
+        return True
+
+    def render(self, source, publish, anchor_prefix, parts):
+        body = markdown.markdown(source.text, extensions=self.extensions)
+        position_map = PositionMap(array("l"), len(source.text.splitlines()), anchor_prefix)
+        if parts:
+            return {
+                "head_prefix": MARKDOWN_HEAD_PREFIX, "head": MARKDOWN_HEAD, "stylesheet": "",
+                "body_prefix": MARKDOWN_BODY_PREFIX, "body": body, "body_suffix": MARKDOWN_BODY_SUFFIX,
+            }, position_map
+        return MARKDOWN_HEAD_PREFIX + MARKDOWN_HEAD + MARKDOWN_BODY_PREFIX + body + MARKDOWN_BODY_SUFFIX, position_map
+
+
+# The backends used by the server.
+def default_backends():
+    backends = RenderBackends()
+    backends.register(RestBackend())
+    if markdown:
+        backends.register(MarkdownBackend())
+    backends.register(CodeOnlyBackend())
+    backends.register(CodeChatBackend())
+    return backends
@@ -0,0 +1,117 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ********************************************
+# |docname| - Bounded, coalescing render queue
+# ********************************************
+# An editor sends its text after every change, which may be faster than the server can render it. Rendering each change in the thread which received it would let a fast typist, or many clients, queue up unbounded work, delaying every render. Instead, ``start_render`` submits a job to this queue and returns at once; a fixed number of threads run the jobs.
+#
+# The queue bounds the work pending:
+#
+# -   Each client has at most one job waiting. A newer job replaces it, since only the latest text needs rendering; this coalesces a burst of keystrokes into one render.
+# -   Clients take turns: after a client's job runs, its next job waits behind those of other clients.
+# -   When more than ``max_queued`` clients are waiting, the queue reports that the server is overloaded, so the caller can show a cheaper result meanwhile. When ``max_waiting`` clients are waiting, it rejects jobs from any other client.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from collections import deque
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# The outcomes of ``submit``.
+QUEUED = "queued"
+COALESCED = "coalesced"
+OVERLOADED = "overloaded"
+REJECTED = "rejected"
+
+
+class RenderQueue:
+    def __init__(self, threads=2, max_queued=4, max_waiting=64):
+        self.threads = threads
+        self.max_queued = max_queued
+        self.max_waiting = max_waiting
+        self._condition = threading.Condition()
+        # Maps a client's ID to its waiting job.
+        self._jobs = {}
+        # The IDs of clients with a job waiting and none running, in the order they run.
+        self._ready = deque()
+        # The IDs of clients with a job running.
+        self._running = set()
+        self._workers = []
+
+    # Submit ``job``, a function taking no arguments, for the client ``id``. Return QUEUED, COALESCED if it replaced a waiting job, OVERLOADED if it was queued behind more than ``max_queued`` clients, or REJECTED if it was discarded.
+    def submit(self, id, job):
+        with self._condition:
+            if id in self._jobs:
+                self._jobs[id] = job
+                return COALESCED
+            if id in self._running:
+                # This runs after the current job.
+                self._jobs[id] = job
+                return QUEUED
+            waiting = len(self._ready)
+            if waiting >= self.max_waiting:
+                return REJECTED
+            self._jobs[id] = job
+            self._ready.append(id)
+            self._condition.notify()
+            if len(self._workers) < self.threads:
+                worker = threading.Thread(target=self._work, daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            return OVERLOADED if waiting >= self.max_queued else QUEUED
+
+    # Discard any waiting job of the client ``id``.
+    def discard(self, id):
+        with self._condition:
+            if self._jobs.pop(id, None) and id not in self._running:
+                self._ready.remove(id)
+
+    # Return True if the client ``id`` has a job waiting.
+    def is_waiting(self, id):
+        with self._condition:
+            return id in self._jobs
+
+    # Return the number of clients with a job waiting.
+    def waiting(self):
+        with self._condition:
+            return len(self._jobs)
+
+    def _work(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready)
+                id = self._ready.popleft()
+                job = self._jobs.pop(id)
+                self._running.add(id)
+            try:
+                job()
+            except Exception:
+                logger.exception("Render job for client %s failed.", id)
+            with self._condition:
+                self._running.discard(id)
+                if id in self._jobs:
+                    self._ready.append(id)
+                    self._condition.notify()
@@ -0,0 +1,295 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *****************************************************
+# |docname| - Route clients to several server processes
+# *****************************************************
+# A server renders in one process, so it uses at most one core, however many editors share it. To serve a team from one machine, ``python router.py --workers N`` runs N server processes, called workers, behind a router which provides both services on the usual ports. Each client lives in one worker, which keeps all its state; the router sends every call with a client's ID to that worker, and the worker's results straight back.
+#
+# The router chooses each client's worker by consistent hashing of its ID (see HashRing_), so it needs no table of clients. The router assigns IDs itself, calling ``render_client_with_id`` on the chosen worker, so that IDs are unique across the workers.
+#
+# The workers are ``CodeChatServer.py`` processes, serving both services through Unix sockets in a temporary directory. The router forwards each Web_Sync request to its worker unchanged, then streams the worker's response back without decoding it, so that a large render is never copied whole in the router. Editor_Extension calls, which are small, are decoded and made again on the worker.
+#
+# Arguments not recognized by the router, such as ``--workspace-memory-mb``, are passed to each worker. Since ``render_batch`` keeps its renders in the worker which made them, the router splits a batch between the workers by hashing each file's path; opening a file rendered in advance shows that render only if the client's worker rendered it. Run this from the ``CodeChat_Server`` directory; use ``--help`` for all the options.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from bisect import bisect
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import itertools
+import logging
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Third-party imports
+# -------------------
+from flask import Flask, request
+from flask_cors import cross_origin
+from thrift.protocol import TBinaryProtocol, TJSONProtocol
+from thrift.server import TServer
+from thrift.transport import TSocket, TTransport
+
+# Local application imports
+# -------------------------
+sys.path.append('gen-py')
+from CodeChat_Services import Editor_Extension, Web_Sync
+from file_watcher import is_supported, walk_files
+
+logger = logging.getLogger(__name__)
+
+
+# The length which precedes each Web_Sync request and response sent between the router and a worker; see ``web_sync_socket_service``.
+FRAME = struct.Struct("!I")
+
+
+# .. _HashRing:
+#
+# Consistent hashing
+# ==================
+# Map keys to nodes so that each node receives about the same share of keys, and adding or removing a node moves only the keys of that node. Each node is placed at ``replicas`` points on a ring of hashes; a key belongs to the node at the first point after the key's hash.
+class HashRing:
+    def __init__(self, nodes, replicas=64):
+        points = sorted(
+            (self._hash("{}-{}".format(node, replica)), node)
+            for node in nodes for replica in range(replicas)
+        )
+        self._hashes = [hash_ for hash_, node in points]
+        self._nodes = [node for hash_, node in points]
+
+    def node_for(self, key):
+        return self._nodes[bisect(self._hashes, self._hash(key)) % len(self._nodes)]
+
+    @staticmethod
+    def _hash(key):
+        return int.from_bytes(hashlib.md5(str(key).encode("utf-8")).digest()[:8], "big")
+
+
+# Workers
+# =======
+# A worker process, serving both services through Unix sockets at ``socket_path``.editor and ``socket_path``.web.
+class Worker:
+    def __init__(self, socket_path, worker_args):
+        self.editor_socket = socket_path + ".editor"
+        self.web_socket = socket_path + ".web"
+        self.process = subprocess.Popen(
+            [sys.executable, "CodeChatServer.py", "--router-socket", socket_path] + worker_args
+        )
+        # True once the router is stopping this worker.
+        self.stopping = False
+
+    # Wait until both sockets accept connections.
+    def wait_until_ready(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        for path in (self.editor_socket, self.web_socket):
+            while True:
+                if self.process.poll() is not None:
+                    raise RuntimeError("A worker exited while starting.")
+                try:
+                    with socket.socket(socket.AF_UNIX) as sock:
+                        sock.connect(path)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise RuntimeError("A worker did not start.")
+                    time.sleep(0.05)
+
+    # Return a new, open transport to this worker's Editor_Extension service.
+    def editor_transport(self):
+        transport = TTransport.TBufferedTransport(TSocket.TSocket(unix_socket=self.editor_socket))
+        transport.open()
+        return transport
+
+    def stop(self):
+        self.stopping = True
+        self.process.terminate()
+
+
+# Router
+# ======
+# This implements the Editor_Extension service by calling the worker of each client.
+class Router:
+    def __init__(self, workers):
+        self.workers = workers
+        self.ring = HashRing(range(len(workers)))
+        self._ids = itertools.count(1)
+        # Each thread of the editor server, which serves one connection from an editor, has its own connection to each worker.
+        self._local = threading.local()
+
+    def worker_for(self, id):
+        return self.workers[self.ring.node_for(id)]
+
+    def render_client(self):
+        return self.render_client_with_id(next(self._ids))
+
+    def render_client_with_id(self, id):
+        return self._client(id).render_client_with_id(id)
+
+    def start_render(self, text, path, id):
+        self._client(id).start_render(text, path, id)
+
+    def start_render_shared(self, name, offset, length, path, id):
+        self._client(id).start_render_shared(name, offset, length, path, id)
+
+    def stop_render_client(self, id):
+        self._client(id).stop_render_client(id)
+
+    def sync_web_view(self, id, line):
+        self._client(id).sync_web_view(id, line)
+
+    def get_editor_result(self, id):
+        return self._client(id).get_editor_result(id)
+
+    def grant_ownership(self, id):
+        self._client(id).grant_ownership(id)
+
+    # Render each file in the worker given by hashing its path, with the workers rendering in parallel.
+    def render_batch(self, paths):
+        batches = {}
+        for path in paths:
+            files = [file for file in walk_files(path) if is_supported(file)] if os.path.isdir(path) else [path]
+            for file in files:
+                batches.setdefault(self.ring.node_for(os.path.normcase(os.path.abspath(file))), []).append(file)
+        with ThreadPoolExecutor(len(batches) or 1) as executor:
+            futures = [executor.submit(self._render_batch, index, files) for index, files in batches.items()]
+            return [result for future in futures for result in future.result()]
+
+    def _render_batch(self, index, files):
+        transport = self.workers[index].editor_transport()
+        try:
+            return Editor_Extension.Client(TBinaryProtocol.TBinaryProtocol(transport)).render_batch(files)
+        finally:
+            transport.close()
+
+    # Return this thread's client for the worker of the client ``id``.
+    def _client(self, id):
+        clients = self._local.__dict__.setdefault("clients", {})
+        index = self.ring.node_for(id)
+        if index not in clients:
+            transport = self.workers[index].editor_transport()
+            clients[index] = Editor_Extension.Client(TBinaryProtocol.TBinaryProtocol(transport))
+        return clients[index]
+
+    # Return the worker for the Web_Sync request ``data``, given the ID which is the first argument of every Web_Sync call.
+    def worker_for_request(self, data):
+        iprot = TJSONProtocol.TJSONProtocol(TTransport.TMemoryBuffer(data))
+        name, message_type, seqid = iprot.readMessageBegin()
+        args_class = getattr(Web_Sync, name + "_args", None)
+        if args_class is None:
+            # Any worker reports the unknown method.
+            return self.workers[0]
+        args = args_class()
+        args.read(iprot)
+        return self.worker_for(args.id)
+
+
+# Created by ``main``.
+router = None
+
+
+# Servers
+# =======
+app = Flask(__name__)
+@app.route('/', methods=['POST'])
+@cross_origin(max_age=100000)
+def web_sync_service():
+    data = request.data
+    sock = socket.socket(socket.AF_UNIX)
+    sock.connect(router.worker_for_request(data).web_socket)
+    sock.sendall(FRAME.pack(len(data)) + data)
+    reader = sock.makefile("rb")
+    length = FRAME.unpack(reader.read(FRAME.size))[0]
+
+    # Stream the response from the worker.
+    def response():
+        try:
+            remaining = length
+            while remaining:
+                chunk = reader.read(min(remaining, 2**16))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            reader.close()
+            sock.close()
+
+    return app.response_class(response(), headers={"Content-Length": str(length)})
+
+
+def editor_extension_service(host, port):
+    server = TServer.TThreadedServer(
+        Editor_Extension.Processor(router), TSocket.TServerSocket(host=host, port=port),
+        TTransport.TBufferedTransportFactory(), TBinaryProtocol.TBinaryProtocolFactory(), daemon=True
+    )
+    server.serve()
+
+
+# Stop the router if a worker exits, since its clients are lost.
+def watch_worker(worker):
+    code = worker.process.wait()
+    if worker.stopping:
+        return
+    logger.error("Worker %d exited with status %d; stopping.", worker.process.pid, code)
+    os._exit(1)
+
+
+# Main
+# ====
+def main(argv=None):
+    global router
+    parser = argparse.ArgumentParser(
+        description="Run several CodeChat servers behind one router. Other arguments are passed to each server."
+    )
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="The number of server processes; by default, one per CPU.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--editor-port', type=int, default=9090)
+    parser.add_argument('--web-port', type=int, default=5000)
+    args, worker_args = parser.parse_known_args(argv)
+    logging.basicConfig()
+
+    socket_dir = tempfile.mkdtemp(prefix="codechat-")
+    workers = [Worker(os.path.join(socket_dir, "worker-{}".format(index)), worker_args) for index in range(args.workers)]
+    try:
+        for worker in workers:
+            worker.wait_until_ready()
+            threading.Thread(target=watch_worker, args=(worker,), daemon=True).start()
+        router = Router(workers)
+        threading.Thread(target=editor_extension_service, args=(args.host, args.editor_port), daemon=True).start()
+        print("Routing to {} workers...".format(len(workers)))
+        app.run(args.host, args.web_port, threaded=True)
+    finally:
+        for worker in workers:
+            worker.stop()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************
+# |docname| - Prioritize renders by source
+# ****************************************
+# Renders come from several sources which compete for the CPU: an editor sending each keystroke, files changed on disk (see |file_watcher|), and batches of files rendered in advance (see ``prerender.py``). So that a large batch never delays what the user is looking at, each render must first acquire a slot from the RenderScheduler, at one of these priorities:
+#
+# FOCUSED
+#   A change made in an editor or web view. The user is waiting for this, so it always runs immediately.
+# VISIBLE
+#   A change shown in a web view but made by another program. This waits while a focused render runs.
+# BACKGROUND
+#   A render only kept for later, such as for a document not shown or a file no editor has open. This waits while any render of higher priority runs or waits, then runs in first-come order, with at most ``background_limit`` at once. A render already running isn't stopped, so background work yields at the end of each file.
+#
+# To prevent starvation when renders of higher priority never stop, a render which has waited ``max_wait`` seconds runs anyway, though background renders still respect ``background_limit``.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from contextlib import contextmanager
+import itertools
+import threading
+import time
+
+
+# Priorities; a lower number runs first.
+FOCUSED = 0
+VISIBLE = 1
+BACKGROUND = 2
+PRIORITY_NAMES = ("focused", "visible", "background")
+
+
+# Scheduler
+# =========
+class RenderScheduler:
+    def __init__(self, background_limit=1, max_wait=5.0):
+        self.background_limit = background_limit
+        self.max_wait = max_wait
+        self._condition = threading.Condition()
+        # The number of renders running at each priority.
+        self.running = [0]*len(PRIORITY_NAMES)
+        # A list of ``[priority, sequence number, time queued]`` for each render waiting, in the order they arrived.
+        self._waiting = []
+        self._sequence = itertools.count()
+
+    # Wait until a render at ``priority`` may run, then hold its slot for the body of this ``with`` statement, which receives the number of seconds waited.
+    @contextmanager
+    def slot(self, priority):
+        seconds = self.acquire(priority)
+        try:
+            yield seconds
+        finally:
+            self.release(priority)
+
+    # Wait until a render at ``priority`` may run; return the number of seconds waited. The caller must then call ``release``.
+    def acquire(self, priority):
+        with self._condition:
+            entry = [priority, next(self._sequence), time.monotonic()]
+            self._waiting.append(entry)
+            while not self._may_run(entry):
+                # Wake when the render would starve, if it hasn't already.
+                starve_time = entry[2] + self.max_wait - time.monotonic()
+                self._condition.wait(starve_time if starve_time > 0 else None)
+            self._waiting.remove(entry)
+            self.running[priority] += 1
+            # Removing this entry may allow the next background render to run.
+            self._condition.notify_all()
+            return time.monotonic() - entry[2]
+
+    def release(self, priority):
+        with self._condition:
+            self.running[priority] -= 1
+            self._condition.notify_all()
+
+    # Return the number of renders waiting at each priority.
+    def waiting(self):
+        with self._condition:
+            counts = [0]*len(PRIORITY_NAMES)
+            for entry in self._waiting:
+                counts[entry[0]] += 1
+            return counts
+
+    def _may_run(self, entry):
+        priority, sequence, queued = entry
+        if priority == FOCUSED:
+            return True
+        starved = time.monotonic() - queued >= self.max_wait
+        if priority == VISIBLE:
+            return starved or not self._busy(FOCUSED)
+        # Background renders run in order, within their limit.
+        if self.running[BACKGROUND] >= self.background_limit:
+            return False
+        first = next(waiting for waiting in self._waiting if waiting[0] == BACKGROUND)
+        return first is entry and (starved or not self._busy(VISIBLE))
+
+    # Return True if any render with a priority of ``priority`` or higher (a lower number) is running or waiting.
+    def _busy(self, priority):
+        return any(self.running[:priority + 1]) or any(entry[0] <= priority for entry in self._waiting)
@@ -0,0 +1,179 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *****************************************************
+# |docname| - Save and restore sessions across restarts
+# *****************************************************
+# When the server restarts, its clients are lost: each web view receives a ``stopped`` status and must be reopened, and every document must be rendered again. To avoid this, the server may periodically save a snapshot of its clients to a file, then restore them from that file when it starts. A snapshot holds each client's ID, its editor's cursor line, and the path, version and text of its active document with that document's latest render and position map. After a restart, each web view's next poll shows that render at once; when the editor reconnects and sends the same text, the render is shown again instead of rendered.
+#
+# The file begins with ``MAGIC``, then the length of a header, then the header, which is JSON. The header lists the clients; each client's text, HTML and position map lines are stored after the header as raw bytes, given by their offset and length, so that neither saving nor restoring escapes or parses megabytes of HTML. Restoring maps the file into memory, then copies each piece from there. A snapshot is written to a temporary file which then replaces the last, so a crash while saving leaves the last snapshot intact.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from array import array
+from collections import namedtuple
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+
+# Local application imports
+# -------------------------
+from position_map import PositionMap
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b"CodeChat session 1\n"
+LENGTH = struct.Struct("!Q")
+
+# The saved state of one client. If its active document hasn't been rendered since it last changed, or it has no active document, then ``html`` and ``position_map`` are None; without a render, ``text`` is None as well.
+ClientState = namedtuple("ClientState", "id cursor_line path version text html position_map")
+
+
+# Saving
+# ======
+# Write a snapshot of ``clients``, a list of ClientState, to ``path``.
+def write_snapshot(path, clients):
+    header = []
+    data = []
+    offset = 0
+
+    # Add ``piece``, which is bytes, to the data, returning its ``[offset, length]``.
+    def add(piece):
+        nonlocal offset
+        data.append(piece)
+        offset += len(piece)
+        return [offset - len(piece), len(piece)]
+
+    for client in clients:
+        entry = {"id": client.id, "cursor_line": client.cursor_line, "path": client.path, "version": client.version}
+        if client.text is not None:
+            entry["text"] = add(client.text.encode("utf-8"))
+        if client.html is not None:
+            entry["html"] = add(client.html.encode("utf-8"))
+        position_map = client.position_map
+        if position_map is not None:
+            entry["position_map"] = {
+                "typecode": position_map.lines.typecode,
+                "lines": add(position_map.lines.tobytes()),
+                "line_count": position_map.line_count,
+                "prefix": position_map.prefix,
+                "ids": sorted(position_map.ids.items()),
+            }
+        header.append(entry)
+
+    header_bytes = json.dumps({"clients": header}).encode("utf-8")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for piece in data:
+            f.write(piece)
+    os.replace(temp_path, path)
+
+
+# Restoring
+# =========
+# Return a list of the ClientState saved in the snapshot at ``path``. If there's no snapshot, or it can't be read, return an empty list.
+def read_snapshot(path):
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as map_:
+            return _read_clients(map_)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+        logger.warning("Unable to restore the session from %s: %s", path, e)
+        return []
+
+
+def _read_clients(map_):
+    if map_[:len(MAGIC)] != MAGIC:
+        raise ValueError("This isn't a CodeChat session snapshot.")
+    header_start = len(MAGIC) + LENGTH.size
+    header_length = LENGTH.unpack(map_[len(MAGIC):header_start])[0]
+    data_start = header_start + header_length
+    header = json.loads(map_[header_start:data_start].decode("utf-8"))
+
+    # Return the bytes at ``[offset, length]`` in the data.
+    def get(location):
+        offset, length = location
+        start = data_start + offset
+        if start + length > len(map_):
+            raise ValueError("The snapshot is truncated.")
+        return map_[start:start + length]
+
+    clients = []
+    for entry in header["clients"]:
+        text = entry.get("text")
+        html = entry.get("html")
+        saved_map = entry.get("position_map")
+        position_map = None
+        if saved_map:
+            lines = array(saved_map["typecode"])
+            lines.frombytes(get(saved_map["lines"]))
+            position_map = PositionMap(
+                lines, saved_map["line_count"], saved_map["prefix"], {index: id for index, id in saved_map.get("ids", [])}
+            )
+        clients.append(ClientState(
+            entry["id"], entry["cursor_line"], entry["path"], entry["version"],
+            text and get(text).decode("utf-8"),
+            html and get(html).decode("utf-8"),
+            position_map,
+        ))
+    return clients
+
+
+# Periodic snapshots
+# ==================
+# Every ``interval`` seconds, save the clients returned by ``get_clients()``, a list of ClientState, to ``path``, unless no client's document changed or finished rendering since the last snapshot. Moving a cursor alone doesn't cause a snapshot, since an editor moves its cursor often.
+class SessionSaver(threading.Thread):
+    def __init__(self, path, get_clients, interval=10.0):
+        super().__init__(daemon=True)
+        self.path = path
+        self.get_clients = get_clients
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._last_key = None
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.save()
+
+    # Save a snapshot now if anything changed.
+    def save(self):
+        clients = self.get_clients()
+        key = [(client.id, client.path, client.version, client.html is not None) for client in clients]
+        if key == self._last_key:
+            return
+        try:
+            write_snapshot(self.path, clients)
+        except OSError as e:
+            logger.warning("Unable to save the session to %s: %s", self.path, e)
+        else:
+            self._last_key = key
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,114 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************************
+# |docname| - Pass document text through shared memory
+# ****************************************************
+# An editor on the same machine as the server may pass large documents through shared memory rather than its connection. The editor creates a ring buffer: a file in ``SHARED_TEXT_DIR``, which is memory on Linux, named ``codechat-`` followed by a unique suffix. For each document, it writes the text, encoded in UTF-8, after the previous one, wrapping around at the end of the file. Then it calls ``start_render_shared`` with the file's name and the text's offset and length. The space is free again once that call returns, since the server has copied the text by then; calls on one connection return in the order they were made.
+#
+# The server maps each file into its memory once. It only reads files in ``SHARED_TEXT_DIR`` with names of this form.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from collections import OrderedDict
+import mmap
+import os
+import re
+import secrets
+import threading
+
+
+# The directory of the ring buffers. Where this doesn't exist, such as on Windows, text is sent through the connection instead.
+SHARED_TEXT_DIR = "/dev/shm"
+NAME_RE = re.compile(r"codechat-[A-Za-z0-9_-]+\Z")
+
+
+# Reader
+# ======
+# The server's side. It keeps at most ``max_maps`` files mapped, closing the least recently used.
+class SharedTextReader:
+    def __init__(self, directory=SHARED_TEXT_DIR, max_maps=16):
+        self.directory = directory
+        self.max_maps = max_maps
+        self._lock = threading.Lock()
+        self._maps = OrderedDict()
+
+    # Return the text of ``length`` bytes at ``offset`` in the named ring buffer.
+    def read(self, name, offset, length):
+        if not NAME_RE.match(name):
+            raise ValueError("Invalid shared text name {}.".format(name))
+        with self._lock:
+            map_ = self._maps.pop(name, None) or self._map(name)
+            self._maps[name] = map_
+            if len(self._maps) > self.max_maps:
+                self._maps.popitem(last=False)[1].close()
+            size = len(map_)
+            if not (0 <= offset < size and 0 <= length <= size):
+                raise ValueError("The text is outside the shared text {}.".format(name))
+            end = offset + length
+            data = map_[offset:end] if end <= size else map_[offset:] + map_[:end - size]
+        return data.decode("utf-8")
+
+    def _map(self, name):
+        with open(os.path.join(self.directory, name), "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Writer
+# ======
+# The editor's side, for editors written in Python, such as |benchmark|.
+class SharedTextWriter:
+    def __init__(self, size=64*2**20, directory=SHARED_TEXT_DIR):
+        self.name = "codechat-{}-{}".format(os.getpid(), secrets.token_hex(4))
+        self.path = os.path.join(directory, self.name)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.size = size
+        # The offset of the next text, and the number of bytes free.
+        self._head = 0
+        self._free = size
+
+    # Write ``data``, which is bytes, returning its offset, or None if there isn't room; then, once the server has read it, call ``release``.
+    def write(self, data):
+        length = len(data)
+        if length > self._free:
+            return None
+        offset = self._head
+        first = min(length, self.size - offset)
+        view = memoryview(data)
+        self._map[offset:offset + first] = view[:first]
+        self._map[:length - first] = view[first:]
+        self._head = (offset + length) % self.size
+        self._free -= length
+        return offset
+
+    # Free the oldest ``length`` bytes written.
+    def release(self, length):
+        self._free += length
+
+    def close(self):
+        self._map.close()
+        os.remove(self.path)
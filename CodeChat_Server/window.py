@@ -0,0 +1,217 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***************************************************
+# |docname| - Windowed rendering of very large files
+# ***************************************************
+# Rendering a file of tens of thousands of lines, then loading all that HTML into the web view, is slow at both ends. Instead, the server splits such a file into blocks of a few hundred lines, each rendered on its own. It sends a skeleton holding a placeholder for each block, sized to approximate its height, with only the blocks near the editor's cursor rendered. As the web view scrolls, it asks for the blocks coming into view; see ``set_viewport``.
+#
+# Block boundaries are chosen from the text near them, so an edit changes only the blocks around it. Each block's render is kept, keyed by its text, so after an edit only the changed blocks are rendered again.
+#
+# Since each block is rendered separately, reST constructs can't span blocks. Blocks therefore end only at a blank line followed by an unindented line, which usually separates top-level comments and definitions.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from bisect import bisect_right
+import itertools
+import threading
+
+# Local application imports
+# -------------------------
+from position_map import ANCHOR_PREFIX
+
+
+# The ``id`` of each block's element is this followed by the block's index.
+BLOCK_PREFIX = "CodeChat-block-"
+# The estimated height of a placeholder per source line, in ems.
+LINE_HEIGHT_EM = 1.25
+
+
+# Blocks
+# ======
+# Return a list of ``(start, end)`` for each block of ``lines``, where ``start`` and ``end`` are 0-based line numbers and the block ends before ``end``. A block ends at the first boundary at least ``block_lines`` lines from its start, or after twice that if there's no boundary.
+def split_blocks(lines, block_lines):
+    blocks = []
+    start = 0
+    while start < len(lines):
+        end = start + block_lines
+        limit = start + 2*block_lines
+        while end < min(limit, len(lines)) and not (
+            not lines[end - 1].strip() and lines[end].strip() and not lines[end][0].isspace()
+        ):
+            end += 1
+        end = min(end, len(lines))
+        blocks.append((start, end))
+        start = end
+    return blocks
+
+
+# Windowed view
+# =============
+# The blocks of one client's document, and the renders of those sent to its web views.
+class WindowedView:
+    # ``render(text, anchor_prefix)`` renders the text of a block, returning ``(parts, position map)``, where ``parts`` is the HTML writer's dict of parts.
+    def __init__(self, path, render, block_lines=500):
+        self.path = path
+        self.block_lines = block_lines
+        self._render = render
+        self._lock = threading.Lock()
+        # Maps the text of a block to ``(uid, HTML body, position map)``. The uid makes the anchors of each block unique.
+        self._cache = {}
+        self._uids = itertools.count()
+        # The head of the HTML document, from any block.
+        self._head = ""
+        # A list of ``(start, end, text)`` for each block in the current version.
+        self.blocks = []
+        self.version = None
+        # The indices of the blocks sent to web views for this version.
+        self._sent = set()
+        self.position_map = None
+
+    # Split version ``version`` of the document, whose text is ``text``, into blocks.
+    def update(self, text, version):
+        lines = text.splitlines(True)
+        with self._lock:
+            self.blocks = [(start, end, "".join(lines[start:end])) for start, end in split_blocks(lines, self.block_lines)]
+            # Keep only the renders of blocks still present.
+            texts = {text for start, end, text in self.blocks}
+            self._cache = {text: entry for text, entry in self._cache.items() if text in texts}
+            self.version = version
+            self._sent = set()
+            self.position_map = WindowedPositionMap(self.blocks, self._cache, self._sent, len(lines))
+            self.position_map.version = version
+
+    # Return the index of the block containing the given 1-based line.
+    def block_for_line(self, line):
+        return self.position_map.block_for_line(line)
+
+    # Return the skeleton HTML for the current version, with the blocks at ``indices`` rendered and every other block a placeholder.
+    def skeleton(self, indices):
+        with self._lock:
+            bodies = {index: self._take(index) for index in indices if 0 <= index < len(self.blocks)}
+            html = [self._head, '</head>\n<body>\n<div class="document" data-codechat-version="{}">\n'.format(self.version)]
+            for index, (start, end, text) in enumerate(self.blocks):
+                if index in bodies:
+                    html.append('<div class="CodeChat-block" id="{}{}">\n{}</div>\n'.format(BLOCK_PREFIX, index, bodies[index]))
+                else:
+                    html.append(
+                        '<div class="CodeChat-block CodeChat-placeholder" id="{}{}" data-index="{}" data-lines="{}" style="min-height: {:.1f}em"></div>\n'.format(
+                            BLOCK_PREFIX, index, index, end - start, (end - start)*LINE_HEIGHT_EM
+                        )
+                    )
+            html.append("</div>\n</body>\n</html>\n")
+            return "".join(html)
+
+    # Return the HTML body of the block at ``index``, rendering it if necessary, or None if it was already sent or ``version`` isn't the current version.
+    def take_block(self, version, index):
+        with self._lock:
+            if version != self.version or index in self._sent or not 0 <= index < len(self.blocks):
+                return None
+            return self._take(index)
+
+    # The caller must hold ``_lock``.
+    def _take(self, index):
+        start, end, text = self.blocks[index]
+        entry = self._cache.get(text)
+        if entry is None:
+            uid = next(self._uids)
+            parts, position_map = self._render(text, "{}{}-".format(ANCHOR_PREFIX, uid))
+            entry = self._cache[text] = (uid, parts["body"], position_map)
+            self._head = parts["head_prefix"] + parts["head"] + parts["stylesheet"]
+        self._sent.add(index)
+        return entry[1]
+
+
+# Position map
+# ============
+# This provides the methods of a PositionMap (see |position_map|) for a windowed document. Lines in blocks sent to the web views map to the anchors in those blocks; other lines map to their block's placeholder.
+class WindowedPositionMap:
+    def __init__(self, blocks, cache, sent, line_count):
+        self._blocks = blocks
+        self._cache = cache
+        self._sent = sent
+        self._starts = [start for start, end, text in blocks]
+        self.line_count = line_count
+        self.version = None
+
+    def block_for_line(self, line):
+        return max(bisect_right(self._starts, line - 1) - 1, 0)
+
+    def anchor_for_line(self, line):
+        if not self._blocks:
+            return None, 0
+        index = self.block_for_line(line)
+        start, end, text = self._blocks[index]
+        block_map = self._block_map(index)
+        if block_map:
+            anchor, line_offset = block_map.anchor_for_line(line - start)
+            if anchor:
+                return anchor, line_offset
+        return BLOCK_PREFIX + str(index), max(line - 1 - start, 0)
+
+    def line_for_anchor(self, anchor, line_offset=0):
+        found = self._find(anchor)
+        if not found:
+            return None
+        index, block_map = found
+        start = self._blocks[index][0]
+        if block_map:
+            line = block_map.line_for_anchor(anchor, line_offset)
+            return line and line + start
+        return start + 1 + max(line_offset, 0)
+
+    def has_anchor(self, anchor):
+        return self._find(anchor) is not None
+
+    def find_anchor(self, anchors):
+        return next((anchor for anchor in anchors.split() if self.has_anchor(anchor)), None)
+
+    def line_range_for_anchor(self, anchor):
+        found = self._find(anchor)
+        if not found:
+            return None
+        index, block_map = found
+        start, end, text = self._blocks[index]
+        if block_map:
+            line_range = block_map.line_range_for_anchor(anchor)
+            return line_range and (line_range[0] + start, line_range[1] + start)
+        return start + 1, end + 1
+
+    # Return the position map of the block at ``index`` if it was sent, or None.
+    def _block_map(self, index):
+        if index not in self._sent:
+            return None
+        return self._cache[self._blocks[index][2]][2]
+
+    # Return ``(block index, position map of the block or None if the anchor is a placeholder)``, or None if the anchor isn't in this map.
+    def _find(self, anchor):
+        if anchor.startswith(BLOCK_PREFIX):
+            try:
+                index = int(anchor[len(BLOCK_PREFIX):])
+            except ValueError:
+                return None
+            return (index, None) if 0 <= index < len(self._blocks) else None
+        for index in list(self._sent):
+            block_map = self._block_map(index)
+            if block_map.has_anchor(anchor):
+                return index, block_map
+        return None
@@ -0,0 +1,102 @@
+# .. Copyright (C) 2012-2020 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *****************************************
+# |docname| - Multi-document workspaces
+# *****************************************
+# An editor may switch between several open documents while showing one web view. Each client therefore has a workspace: the documents its editor has sent, keyed by path, each with its latest render and position map (see |document|). One of these is the active document, which the web view shows. When the editor switches back to a document whose text hasn't changed, the server shows its last render again instead of rendering it.
+#
+# Inactive documents are kept in a least-recently-used list shared by all workspaces. When their total size exceeds a memory budget, the least recently used are evicted; switching to an evicted document renders it again. Active documents are never evicted.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from collections import OrderedDict
+import threading
+
+# Local application imports
+# -------------------------
+from document import Document
+
+
+# Inactive documents
+# ==================
+# The inactive documents of all workspaces, in least-recently-used order. This lock also protects every workspace's documents, so that evicting a document from one workspace never waits on another's lock.
+class WorkspaceCache:
+    def __init__(self, memory_budget):
+        self.memory_budget = memory_budget
+        self.lock = threading.Lock()
+        # Maps ``(workspace, path)`` to the size of that inactive document, in bytes.
+        self._lru = OrderedDict()
+        self.memory_used = 0
+        self.evictions = 0
+
+    # Add a document which just became inactive. The caller must hold ``lock``.
+    def _add(self, workspace, document):
+        size = document.memory_size()
+        self._lru[workspace, document.path] = size
+        self.memory_used += size
+        while self.memory_used > self.memory_budget and self._lru:
+            (lru_workspace, path), lru_size = self._lru.popitem(last=False)
+            self.memory_used -= lru_size
+            lru_workspace.documents.pop(path).close()
+            self.evictions += 1
+
+    # Remove a document which is about to become active or be discarded. The caller must hold ``lock``.
+    def _remove(self, workspace, path):
+        self.memory_used -= self._lru.pop((workspace, path), 0)
+
+
+# Workspaces
+# ==========
+# The documents open in one client's editor.
+class Workspace:
+    def __init__(self, cache):
+        self.cache = cache
+        # Maps a path to its Document.
+        self.documents = {}
+        # The document shown in the web view, or None.
+        self.active = None
+
+    # Make the document at ``path`` active, creating it if necessary. Return ``(document, switched)``, where ``switched`` is True if another document was active before.
+    def open(self, path):
+        with self.cache.lock:
+            if self.active and self.active.path == path:
+                return self.active, False
+            previous = self.active
+            if previous:
+                self.cache._add(self, previous)
+            document = self.documents.get(path)
+            if document:
+                self.cache._remove(self, path)
+            else:
+                document = self.documents[path] = Document(path)
+            self.active = document
+            return document, previous is not None
+
+    # Discard all documents.
+    def close(self):
+        with self.cache.lock:
+            for path, document in self.documents.items():
+                self.cache._remove(self, path)
+                document.close()
+            self.documents = {}
+            self.active = None
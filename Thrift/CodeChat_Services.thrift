@@ -7,23 +7,104 @@ enum Get_Result_Type {
     html,
     build,
     status,
+    sync,
+    // One block of a windowed render; the text is JSON with the version, index and HTML of the block.
+    block,
+}
+
+// A preview shows part of the document, or a simplified form of it, until the full render follows. A windowed render shows placeholders for most of a very large document; the web view requests blocks to replace them as they scroll into view.
+enum Render_Quality {
+    full,
+    preview,
+    windowed,
 }
 
 struct Get_Result_Return {
     1:Get_Result_Type gr_type,
     2:string text,
+    // For html results; if unset, this is a full render.
+    3:Render_Quality quality,
+}
+
+struct Render_Client_Return {
+    1:i32 id,
+    2:string html,
+}
+
+// Replace the 1-based source lines from start_line up to, but not including, end_line with text.
+struct Text_Edit {
+    1:i32 start_line,
+    2:i32 end_line,
+    3:string text,
+}
+
+enum Editor_Result_Type {
+    sync,
+    stopped,
+    // Apply the edits made in a web view.
+    text,
+    // A web view asks to edit; call grant_ownership to allow this.
+    request_ownership,
+}
+
+struct Editor_Result_Return {
+    1:Editor_Result_Type er_type,
+    2:i32 line,
+    3:list<Text_Edit> edits,
+}
+
+// If granted, the web view may edit the source lines from start_line up to, but not including, end_line, whose text is given, of the given version of the document. These are the source of the element with the given anchor.
+struct Ownership_Return {
+    1:bool granted,
+    2:i32 version,
+    3:i32 start_line,
+    4:i32 end_line,
+    5:string text,
+    6:string anchor,
+}
+
+// The outcome of rendering one file with render_batch: the time it took in seconds, and an error message, which is empty on success.
+struct Batch_Render_Result {
+    1:string path,
+    2:double seconds,
+    3:string error,
 }
 
 // Provide CodeChat services to editor extensions.
 service Editor_Extension  {
-    // TODO: return the ID, along with a string.
-    string render_client(),
+    // Return the HTML for a new web client, along with the ID used to render to it.
+    Render_Client_Return render_client(),
+    // Like render_client, but use the given ID. The router in router.py uses this so that IDs are unique across its server processes.
+    Render_Client_Return render_client_with_id(1:i32 id),
     void start_render(1:string text, 2:string path, 3:i32 id),
-    void stop_render_client(1:i32 id)
+    // Like start_render, but read the text, encoded in UTF-8, from length bytes at offset in the named ring buffer in shared memory; see shared_text.py.
+    void start_render_shared(1:string name, 2:i32 offset, 3:i32 length, 4:string path, 5:i32 id),
+    void stop_render_client(1:i32 id),
+    // Scroll the client's web views to show the given 1-based source line.
+    void sync_web_view(1:i32 id, 2:i32 line),
+    // Wait for the next result for the editor, such as a line to show after a click in a web view.
+    Editor_Result_Return get_editor_result(1:i32 id),
+    // Allow the web views to edit, after sending any changes with start_render.
+    void grant_ownership(1:i32 id),
+    // Render files, and the supported files in any directories given, in parallel, keeping the renders so that opening these files shows them immediately.
+    list<Batch_Render_Result> render_batch(1:list<string> paths),
  }
 
 
 // Provide CodeChat services to the web browser.
  service Web_Sync {
-    Get_Result_Return get_result(1:i32 id),
+    // Each web view showing the same ID passes its own viewer_id, so that every web view receives every result.
+    Get_Result_Return get_result(1:i32 id, 2:i32 viewer_id),
+    // Show the source of the given anchor, plus line_offset lines, in the editor. The anchor may instead be the ids of an element and its ancestors, innermost first, separated by spaces; the first id which is an anchor is used.
+    void sync_editor(1:i32 id, 2:string anchor, 3:i32 line_offset),
+    // Ask the editor for permission to edit the source of the element with the given anchor, which may be several ids as for sync_editor. This returns when the editor grants permission or the request times out.
+    Ownership_Return request_ownership(1:i32 id, 2:string anchor),
+    // Apply edits to the given version of the document, then return ownership to the editor. An empty list of edits only returns ownership. This returns false if the document changed since that version, in which case the edits are discarded.
+    bool edit_text(1:i32 id, 2:i32 version, 3:list<Text_Edit> edits),
+    // Render the blocks from first_block to last_block of the given version of a windowed render, which the web view is about to show. Each block is sent as a block result.
+    void set_viewport(1:i32 id, 2:i32 version, 3:i32 first_block, 4:i32 last_block),
+    // Return the text of an asset, such as a style sheet, which the server removed from the HTML it sent; it's replaced there by <style data-codechat-asset="name"></style>. Return an empty string if the name is unknown.
+    string get_asset(1:i32 id, 2:string name),
+    // Tell the server whether this web view is shown. A hidden web view stops polling get_result. While every web view of a client is hidden, the server doesn't render for it; once one is shown, it renders the latest change.
+    void set_visibility(1:i32 id, 2:i32 viewer_id, 3:bool visible),
  }
\ No newline at end of file
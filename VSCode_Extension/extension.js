@@ -8,14 +8,27 @@
 // ========
 const vscode = require('vscode');
 const thrift = require('thrift');
-const assert = require('assert');
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
 const Editor_Extension = require('./gen-nodejs/Editor_Extension');
+const CodeChat_Services_types = require('./gen-nodejs/CodeChat_Services_types');
 
 // Globals
 // =======
 var subscription;
+var selection_subscription;
 var connection;
 var client;
+// ``get_editor_result`` waits for a result, so it uses its own connection.
+var poll_connection;
+var poll_client;
+// The text editor whose contents are rendered.
+var text_editor;
+// The ID of the render client shown in the web view.
+var id;
+// The ring buffer in shared memory used to send large documents, or null; see `Shared memory`_.
+var shared_text = null;
 
 
 // Activation
@@ -26,16 +39,31 @@ function activate(context) {
         vscode.window.showInformationMessage('CodeChat activated.');
 
         // Connect to the CodeChat server.
-        connection = thrift.createConnection("localhost", 9090, {
-            transport: thrift.TBufferedTransport,
-            protocol:  thrift.TBinaryProtocol,
-        });
+        connection = create_connection();
         
         connection.on('error', function(err) {
-            assert(false, err);
+            console.log("CodeChat: " + err);
+        });
+        // After the server restarts, send the document again. A server which restored its session (see ``--session``) shows its last render of this text rather than rendering it.
+        connection.on('connect', function() {
+            if (id !== undefined && vscode.window.activeTextEditor) {
+                start_renderfunc();
+            }
         });
         
         client = thrift.createClient(Editor_Extension, connection);
+
+        poll_connection = create_connection();
+        poll_connection.on('error', function(err) {
+            console.log("CodeChat: " + err);
+        });
+        // A poll waiting when the connection was lost is never answered, so poll again.
+        poll_connection.on('connect', function() {
+            if (id !== undefined) {
+                get_editor_resultfunc();
+            }
+        });
+        poll_client = thrift.createClient(Editor_Extension, poll_connection);
         
         // Create a web view which will display CodeChat output. 
         var panel = vscode.window.createWebviewPanel('CodeChat', "CodeChat", 
@@ -43,41 +71,191 @@ function activate(context) {
 
         // Get the render client from the CodeChat server and place it in the web view.
         client.render_client(
-            function(err, html) {
-                panel.webview.html = html;
+            function(err, ret) {
+                id = ret.id;
+                panel.webview.html = ret.html;
+                text_editor = vscode.window.activeTextEditor;
 
                 // Do an initial render.
                 start_renderfunc();
+                get_editor_resultfunc();
+        });
+
+        // Free the server's resources for this web view when it's closed.
+        panel.onDidDispose(function() {
+            client.stop_render_client(id, function(err) {
+            });
+            id = undefined;
         });
     });
     context.subscriptions.push(disposable);
 
     // Render when the text is changed by listening for the correct `event <https://code.visualstudio.com/docs/extensionAPI/vscode-api#Event>`_.
     subscription = vscode.workspace.onDidChangeTextDocument(function(event) {
-        start_renderfunc();
+        if (id !== undefined) {
+            start_renderfunc();
+        }
+    });
+
+    // Keep the web view scrolled to the cursor.
+    selection_subscription = vscode.window.onDidChangeTextEditorSelection(function(event) {
+        if (id !== undefined) {
+            text_editor = event.textEditor;
+            // VSCode's lines are 0-based; CodeChat's are 1-based.
+            client.sync_web_view(id, event.selections[0].active.line + 1, function(err) {
+            });
+        }
     });
 }
 
 
 function deactivate() {
     subscription.dispose();
+    selection_subscription.dispose();
     connection.end();
+    poll_connection.end();
+    close_shared_text();
+}
+
+
+// Connect to the server through the Unix socket given by the ``codechat.socketPath`` setting, which the server provides with ``--editor-socket``; otherwise, through TCP. Documents are passed through shared memory only with a Unix socket, which ensures the server is on this machine.
+function create_connection() {
+    var options = {
+        transport: thrift.TBufferedTransport,
+        protocol:  thrift.TBinaryProtocol,
+        // Reconnect, waiting at most 2 s between attempts, if the server restarts. Calls made meanwhile are sent once reconnected.
+        max_attempts: Infinity,
+        retry_max_delay: 2000,
+    };
+    var socket_path = vscode.workspace.getConfiguration('codechat').get('socketPath');
+    if (socket_path) {
+        if (!shared_text) {
+            shared_text = open_shared_text();
+        }
+        return thrift.createUDSConnection(socket_path, options);
+    }
+    return thrift.createConnection("localhost", 9090, options);
 }
 
 
 // CodeChat services
 // =================
 function start_renderfunc() {
-    client.start_render(
-        vscode.window.activeTextEditor.document.getText(),
-        vscode.window.activeTextEditor.document.fileName, 
-        // TODO: a dynamically-chosen ID.
-        1,
-        function(err) {
+    var text = vscode.window.activeTextEditor.document.getText();
+    var file_name = vscode.window.activeTextEditor.document.fileName;
+    if (shared_text && text.length >= SHARED_TEXT_MIN_LENGTH) {
+        var data = Buffer.from(text, 'utf8');
+        var offset = write_shared_text(data);
+        if (offset !== null) {
+            client.start_render_shared(shared_text.name, offset, data.length, file_name, id, function(err) {
+                if (err) {
+                    // The server can't read this shared memory, so stop using it.
+                    close_shared_text();
+                    client.start_render(text, file_name, id, function(err) {
+                    });
+                } else if (shared_text) {
+                    // The server has read the text, so its space is free.
+                    shared_text.free += data.length;
+                }
+            });
+            return;
+        }
+    }
+    client.start_render(text, file_name, id, function(err) {
     });
 }
 
 
+// Wait for results for the editor from the server. When the user clicks in the web view, this moves the cursor to the corresponding line.
+function get_editor_resultfunc() {
+    poll_client.get_editor_result(id, function(err, result) {
+        if (err || result.er_type == CodeChat_Services_types.Editor_Result_Type.stopped) {
+            return;
+        }
+        if (result.er_type == CodeChat_Services_types.Editor_Result_Type.sync) {
+            // When the web view has the focus, there's no active text editor.
+            var editor = text_editor || vscode.window.activeTextEditor;
+            if (editor) {
+                var position = new vscode.Position(result.line - 1, 0);
+                editor.selection = new vscode.Selection(position, position);
+                editor.revealRange(new vscode.Range(position, position), vscode.TextEditorRevealType.InCenterIfOutsideViewport);
+            }
+        } else if (result.er_type == CodeChat_Services_types.Editor_Result_Type.request_ownership) {
+            // Any changes were already sent by start_renderfunc, so let the web view edit.
+            vscode.window.setStatusBarMessage('CodeChat: editing in the web view.', 5000);
+            client.grant_ownership(id, function(err) {
+            });
+        } else if (result.er_type == CodeChat_Services_types.Editor_Result_Type.text) {
+            apply_text_edits(result.edits);
+        }
+        get_editor_resultfunc();
+    });
+}
+
+
+// Apply the edits made in the web view. Each replaces whole lines; all line numbers refer to the document before any of these edits, as a WorkspaceEdit expects. Applying them changes the document, which sends the new text to the server as usual; the server recognizes that it was already rendered.
+function apply_text_edits(edits) {
+    var editor = text_editor || vscode.window.activeTextEditor;
+    if (!editor) {
+        return;
+    }
+    var workspace_edit = new vscode.WorkspaceEdit();
+    edits.forEach(function(edit) {
+        // VSCode's lines are 0-based; CodeChat's are 1-based.
+        workspace_edit.replace(editor.document.uri, new vscode.Range(
+            new vscode.Position(edit.start_line - 1, 0),
+            new vscode.Position(edit.end_line - 1, 0)
+        ), edit.text);
+    });
+    vscode.workspace.applyEdit(workspace_edit);
+}
+
+
+// Shared memory
+// =============
+// A ring buffer in a file in shared memory, through which large documents are passed to a server on this machine; see the server's shared_text.py. Each document is written after the previous one, wrapping around at the end; its space is free once the server replies.
+const SHARED_TEXT_DIR = '/dev/shm';
+const SHARED_TEXT_SIZE = 64*1024*1024;
+// Smaller documents are sent through the connection.
+const SHARED_TEXT_MIN_LENGTH = 256*1024;
+
+// Return a new ring buffer, or null if shared memory isn't available.
+function open_shared_text() {
+    if (!fs.existsSync(SHARED_TEXT_DIR)) {
+        return null;
+    }
+    var name = 'codechat-' + process.pid + '-' + crypto.randomBytes(4).toString('hex');
+    var file_path = path.join(SHARED_TEXT_DIR, name);
+    var fd = fs.openSync(file_path, 'wx+', 0o600);
+    fs.ftruncateSync(fd, SHARED_TEXT_SIZE);
+    return {name: name, path: file_path, fd: fd, head: 0, free: SHARED_TEXT_SIZE};
+}
+
+// Write ``data``, a Buffer, to the ring buffer, returning its offset, or null if there isn't room.
+function write_shared_text(data) {
+    if (data.length > shared_text.free) {
+        return null;
+    }
+    var offset = shared_text.head;
+    var first = Math.min(data.length, SHARED_TEXT_SIZE - offset);
+    fs.writeSync(shared_text.fd, data, 0, first, offset);
+    if (first < data.length) {
+        fs.writeSync(shared_text.fd, data, first, data.length - first, 0);
+    }
+    shared_text.head = (offset + data.length) % SHARED_TEXT_SIZE;
+    shared_text.free -= data.length;
+    return offset;
+}
+
+function close_shared_text() {
+    if (shared_text) {
+        fs.closeSync(shared_text.fd);
+        fs.unlinkSync(shared_text.path);
+        shared_text = null;
+    }
+}
+
+
 // Exports
 // =======
 exports.activate = activate;
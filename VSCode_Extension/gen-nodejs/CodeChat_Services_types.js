@@ -15,11 +15,25 @@ var ttypes = module.exports = {};
 ttypes.Get_Result_Type = {
   'html' : 0,
   'build' : 1,
-  'status' : 2
+  'status' : 2,
+  'sync' : 3,
+  'block' : 4
+};
+ttypes.Render_Quality = {
+  'full' : 0,
+  'preview' : 1,
+  'windowed' : 2
+};
+ttypes.Editor_Result_Type = {
+  'sync' : 0,
+  'stopped' : 1,
+  'text' : 2,
+  'request_ownership' : 3
 };
 var Get_Result_Return = module.exports.Get_Result_Return = function(args) {
   this.gr_type = null;
   this.text = null;
+  this.quality = null;
   if (args) {
     if (args.gr_type !== undefined && args.gr_type !== null) {
       this.gr_type = args.gr_type;
@@ -27,6 +41,9 @@ var Get_Result_Return = module.exports.Get_Result_Return = function(args) {
     if (args.text !== undefined && args.text !== null) {
       this.text = args.text;
     }
+    if (args.quality !== undefined && args.quality !== null) {
+      this.quality = args.quality;
+    }
   }
 };
 Get_Result_Return.prototype = {};
@@ -54,6 +71,13 @@ Get_Result_Return.prototype.read = function(input) {
         input.skip(ftype);
       }
       break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.quality = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
       default:
         input.skip(ftype);
     }
@@ -75,6 +99,454 @@ Get_Result_Return.prototype.write = function(output) {
     output.writeString(this.text);
     output.writeFieldEnd();
   }
+  if (this.quality !== null && this.quality !== undefined) {
+    output.writeFieldBegin('quality', Thrift.Type.I32, 3);
+    output.writeI32(this.quality);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Render_Client_Return = module.exports.Render_Client_Return = function(args) {
+  this.id = null;
+  this.html = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.html !== undefined && args.html !== null) {
+      this.html = args.html;
+    }
+  }
+};
+Render_Client_Return.prototype = {};
+Render_Client_Return.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.html = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Render_Client_Return.prototype.write = function(output) {
+  output.writeStructBegin('Render_Client_Return');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.html !== null && this.html !== undefined) {
+    output.writeFieldBegin('html', Thrift.Type.STRING, 2);
+    output.writeString(this.html);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Text_Edit = module.exports.Text_Edit = function(args) {
+  this.start_line = null;
+  this.end_line = null;
+  this.text = null;
+  if (args) {
+    if (args.start_line !== undefined && args.start_line !== null) {
+      this.start_line = args.start_line;
+    }
+    if (args.end_line !== undefined && args.end_line !== null) {
+      this.end_line = args.end_line;
+    }
+    if (args.text !== undefined && args.text !== null) {
+      this.text = args.text;
+    }
+  }
+};
+Text_Edit.prototype = {};
+Text_Edit.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.start_line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.end_line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.STRING) {
+        this.text = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Text_Edit.prototype.write = function(output) {
+  output.writeStructBegin('Text_Edit');
+  if (this.start_line !== null && this.start_line !== undefined) {
+    output.writeFieldBegin('start_line', Thrift.Type.I32, 1);
+    output.writeI32(this.start_line);
+    output.writeFieldEnd();
+  }
+  if (this.end_line !== null && this.end_line !== undefined) {
+    output.writeFieldBegin('end_line', Thrift.Type.I32, 2);
+    output.writeI32(this.end_line);
+    output.writeFieldEnd();
+  }
+  if (this.text !== null && this.text !== undefined) {
+    output.writeFieldBegin('text', Thrift.Type.STRING, 3);
+    output.writeString(this.text);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Result_Return = module.exports.Editor_Result_Return = function(args) {
+  this.er_type = null;
+  this.line = null;
+  this.edits = null;
+  if (args) {
+    if (args.er_type !== undefined && args.er_type !== null) {
+      this.er_type = args.er_type;
+    }
+    if (args.line !== undefined && args.line !== null) {
+      this.line = args.line;
+    }
+    if (args.edits !== undefined && args.edits !== null) {
+      this.edits = Thrift.copyList(args.edits, [ttypes.Text_Edit]);
+    }
+  }
+};
+Editor_Result_Return.prototype = {};
+Editor_Result_Return.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.er_type = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.LIST) {
+        this.edits = [];
+        var _rtmp31 = input.readListBegin();
+        var _size0 = _rtmp31.size || 0;
+        for (var _i2 = 0; _i2 < _size0; ++_i2) {
+          var elem3 = null;
+          elem3 = new ttypes.Text_Edit();
+          elem3.read(input);
+          this.edits.push(elem3);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Result_Return.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Result_Return');
+  if (this.er_type !== null && this.er_type !== undefined) {
+    output.writeFieldBegin('er_type', Thrift.Type.I32, 1);
+    output.writeI32(this.er_type);
+    output.writeFieldEnd();
+  }
+  if (this.line !== null && this.line !== undefined) {
+    output.writeFieldBegin('line', Thrift.Type.I32, 2);
+    output.writeI32(this.line);
+    output.writeFieldEnd();
+  }
+  if (this.edits !== null && this.edits !== undefined) {
+    output.writeFieldBegin('edits', Thrift.Type.LIST, 3);
+    output.writeListBegin(Thrift.Type.STRUCT, this.edits.length);
+    for (var iter4 in this.edits) {
+      if (this.edits.hasOwnProperty(iter4)) {
+        iter4 = this.edits[iter4];
+        iter4.write(output);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Ownership_Return = module.exports.Ownership_Return = function(args) {
+  this.granted = null;
+  this.version = null;
+  this.start_line = null;
+  this.end_line = null;
+  this.text = null;
+  this.anchor = null;
+  if (args) {
+    if (args.granted !== undefined && args.granted !== null) {
+      this.granted = args.granted;
+    }
+    if (args.version !== undefined && args.version !== null) {
+      this.version = args.version;
+    }
+    if (args.start_line !== undefined && args.start_line !== null) {
+      this.start_line = args.start_line;
+    }
+    if (args.end_line !== undefined && args.end_line !== null) {
+      this.end_line = args.end_line;
+    }
+    if (args.text !== undefined && args.text !== null) {
+      this.text = args.text;
+    }
+    if (args.anchor !== undefined && args.anchor !== null) {
+      this.anchor = args.anchor;
+    }
+  }
+};
+Ownership_Return.prototype = {};
+Ownership_Return.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.BOOL) {
+        this.granted = input.readBool();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.version = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.start_line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 4:
+      if (ftype == Thrift.Type.I32) {
+        this.end_line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 5:
+      if (ftype == Thrift.Type.STRING) {
+        this.text = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 6:
+      if (ftype == Thrift.Type.STRING) {
+        this.anchor = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Ownership_Return.prototype.write = function(output) {
+  output.writeStructBegin('Ownership_Return');
+  if (this.granted !== null && this.granted !== undefined) {
+    output.writeFieldBegin('granted', Thrift.Type.BOOL, 1);
+    output.writeBool(this.granted);
+    output.writeFieldEnd();
+  }
+  if (this.version !== null && this.version !== undefined) {
+    output.writeFieldBegin('version', Thrift.Type.I32, 2);
+    output.writeI32(this.version);
+    output.writeFieldEnd();
+  }
+  if (this.start_line !== null && this.start_line !== undefined) {
+    output.writeFieldBegin('start_line', Thrift.Type.I32, 3);
+    output.writeI32(this.start_line);
+    output.writeFieldEnd();
+  }
+  if (this.end_line !== null && this.end_line !== undefined) {
+    output.writeFieldBegin('end_line', Thrift.Type.I32, 4);
+    output.writeI32(this.end_line);
+    output.writeFieldEnd();
+  }
+  if (this.text !== null && this.text !== undefined) {
+    output.writeFieldBegin('text', Thrift.Type.STRING, 5);
+    output.writeString(this.text);
+    output.writeFieldEnd();
+  }
+  if (this.anchor !== null && this.anchor !== undefined) {
+    output.writeFieldBegin('anchor', Thrift.Type.STRING, 6);
+    output.writeString(this.anchor);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Batch_Render_Result = module.exports.Batch_Render_Result = function(args) {
+  this.path = null;
+  this.seconds = null;
+  this.error = null;
+  if (args) {
+    if (args.path !== undefined && args.path !== null) {
+      this.path = args.path;
+    }
+    if (args.seconds !== undefined && args.seconds !== null) {
+      this.seconds = args.seconds;
+    }
+    if (args.error !== undefined && args.error !== null) {
+      this.error = args.error;
+    }
+  }
+};
+Batch_Render_Result.prototype = {};
+Batch_Render_Result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.STRING) {
+        this.path = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.DOUBLE) {
+        this.seconds = input.readDouble();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.STRING) {
+        this.error = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Batch_Render_Result.prototype.write = function(output) {
+  output.writeStructBegin('Batch_Render_Result');
+  if (this.path !== null && this.path !== undefined) {
+    output.writeFieldBegin('path', Thrift.Type.STRING, 1);
+    output.writeString(this.path);
+    output.writeFieldEnd();
+  }
+  if (this.seconds !== null && this.seconds !== undefined) {
+    output.writeFieldBegin('seconds', Thrift.Type.DOUBLE, 2);
+    output.writeDouble(this.seconds);
+    output.writeFieldEnd();
+  }
+  if (this.error !== null && this.error !== undefined) {
+    output.writeFieldBegin('error', Thrift.Type.STRING, 3);
+    output.writeString(this.error);
+    output.writeFieldEnd();
+  }
   output.writeFieldStop();
   output.writeStructEnd();
   return;
@@ -43,7 +43,7 @@ var Editor_Extension_render_client_result = function(args) {
   this.success = null;
   if (args) {
     if (args.success !== undefined && args.success !== null) {
-      this.success = args.success;
+      this.success = new ttypes.Render_Client_Return(args.success);
     }
   }
 };
@@ -59,8 +59,9 @@ Editor_Extension_render_client_result.prototype.read = function(input) {
     }
     switch (fid) {
       case 0:
-      if (ftype == Thrift.Type.STRING) {
-        this.success = input.readString();
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new ttypes.Render_Client_Return();
+        this.success.read(input);
       } else {
         input.skip(ftype);
       }
@@ -80,8 +81,109 @@ Editor_Extension_render_client_result.prototype.read = function(input) {
 Editor_Extension_render_client_result.prototype.write = function(output) {
   output.writeStructBegin('Editor_Extension_render_client_result');
   if (this.success !== null && this.success !== undefined) {
-    output.writeFieldBegin('success', Thrift.Type.STRING, 0);
-    output.writeString(this.success);
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_render_client_with_id_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_render_client_with_id_args.prototype = {};
+Editor_Extension_render_client_with_id_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_client_with_id_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_render_client_with_id_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new ttypes.Render_Client_Return(args.success);
+    }
+  }
+};
+Editor_Extension_render_client_with_id_result.prototype = {};
+Editor_Extension_render_client_with_id_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new ttypes.Render_Client_Return();
+        this.success.read(input);
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_client_with_id_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_client_with_id_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
     output.writeFieldEnd();
   }
   output.writeFieldStop();
@@ -193,6 +295,142 @@ Editor_Extension_start_render_result.prototype.write = function(output) {
   return;
 };
 
+var Editor_Extension_start_render_shared_args = function(args) {
+  this.name = null;
+  this.offset = null;
+  this.length = null;
+  this.path = null;
+  this.id = null;
+  if (args) {
+    if (args.name !== undefined && args.name !== null) {
+      this.name = args.name;
+    }
+    if (args.offset !== undefined && args.offset !== null) {
+      this.offset = args.offset;
+    }
+    if (args.length !== undefined && args.length !== null) {
+      this.length = args.length;
+    }
+    if (args.path !== undefined && args.path !== null) {
+      this.path = args.path;
+    }
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_start_render_shared_args.prototype = {};
+Editor_Extension_start_render_shared_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.STRING) {
+        this.name = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.offset = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.length = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 4:
+      if (ftype == Thrift.Type.STRING) {
+        this.path = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 5:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_start_render_shared_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_start_render_shared_args');
+  if (this.name !== null && this.name !== undefined) {
+    output.writeFieldBegin('name', Thrift.Type.STRING, 1);
+    output.writeString(this.name);
+    output.writeFieldEnd();
+  }
+  if (this.offset !== null && this.offset !== undefined) {
+    output.writeFieldBegin('offset', Thrift.Type.I32, 2);
+    output.writeI32(this.offset);
+    output.writeFieldEnd();
+  }
+  if (this.length !== null && this.length !== undefined) {
+    output.writeFieldBegin('length', Thrift.Type.I32, 3);
+    output.writeI32(this.length);
+    output.writeFieldEnd();
+  }
+  if (this.path !== null && this.path !== undefined) {
+    output.writeFieldBegin('path', Thrift.Type.STRING, 4);
+    output.writeString(this.path);
+    output.writeFieldEnd();
+  }
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 5);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_start_render_shared_result = function(args) {
+};
+Editor_Extension_start_render_shared_result.prototype = {};
+Editor_Extension_start_render_shared_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_start_render_shared_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_start_render_shared_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
 var Editor_Extension_stop_render_client_args = function(args) {
   this.id = null;
   if (args) {
@@ -227,58 +465,799 @@ Editor_Extension_stop_render_client_args.prototype.read = function(input) {
     }
     input.readFieldEnd();
   }
-  input.readStructEnd();
-  return;
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_stop_render_client_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_stop_render_client_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_stop_render_client_result = function(args) {
+};
+Editor_Extension_stop_render_client_result.prototype = {};
+Editor_Extension_stop_render_client_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_stop_render_client_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_stop_render_client_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_sync_web_view_args = function(args) {
+  this.id = null;
+  this.line = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.line !== undefined && args.line !== null) {
+      this.line = args.line;
+    }
+  }
+};
+Editor_Extension_sync_web_view_args.prototype = {};
+Editor_Extension_sync_web_view_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.line = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_sync_web_view_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_sync_web_view_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.line !== null && this.line !== undefined) {
+    output.writeFieldBegin('line', Thrift.Type.I32, 2);
+    output.writeI32(this.line);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_sync_web_view_result = function(args) {
+};
+Editor_Extension_sync_web_view_result.prototype = {};
+Editor_Extension_sync_web_view_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_sync_web_view_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_sync_web_view_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_get_editor_result_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_get_editor_result_args.prototype = {};
+Editor_Extension_get_editor_result_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_get_editor_result_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_get_editor_result_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new ttypes.Editor_Result_Return(args.success);
+    }
+  }
+};
+Editor_Extension_get_editor_result_result.prototype = {};
+Editor_Extension_get_editor_result_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new ttypes.Editor_Result_Return();
+        this.success.read(input);
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_get_editor_result_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_get_editor_result_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_grant_ownership_args = function(args) {
+  this.id = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+  }
+};
+Editor_Extension_grant_ownership_args.prototype = {};
+Editor_Extension_grant_ownership_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_grant_ownership_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_grant_ownership_result = function(args) {
+};
+Editor_Extension_grant_ownership_result.prototype = {};
+Editor_Extension_grant_ownership_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_grant_ownership_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_grant_ownership_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_render_batch_args = function(args) {
+  this.paths = null;
+  if (args) {
+    if (args.paths !== undefined && args.paths !== null) {
+      this.paths = Thrift.copyList(args.paths, [null]);
+    }
+  }
+};
+Editor_Extension_render_batch_args.prototype = {};
+Editor_Extension_render_batch_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.LIST) {
+        this.paths = [];
+        var _rtmp36 = input.readListBegin();
+        var _size5 = _rtmp36.size || 0;
+        for (var _i7 = 0; _i7 < _size5; ++_i7) {
+          var elem8 = null;
+          elem8 = input.readString();
+          this.paths.push(elem8);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_args.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_batch_args');
+  if (this.paths !== null && this.paths !== undefined) {
+    output.writeFieldBegin('paths', Thrift.Type.LIST, 1);
+    output.writeListBegin(Thrift.Type.STRING, this.paths.length);
+    for (var iter9 in this.paths) {
+      if (this.paths.hasOwnProperty(iter9)) {
+        iter9 = this.paths[iter9];
+        output.writeString(iter9);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_Extension_render_batch_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = Thrift.copyList(args.success, [ttypes.Batch_Render_Result]);
+    }
+  }
+};
+Editor_Extension_render_batch_result.prototype = {};
+Editor_Extension_render_batch_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.LIST) {
+        this.success = [];
+        var _rtmp311 = input.readListBegin();
+        var _size10 = _rtmp311.size || 0;
+        for (var _i12 = 0; _i12 < _size10; ++_i12) {
+          var elem13 = null;
+          elem13 = new ttypes.Batch_Render_Result();
+          elem13.read(input);
+          this.success.push(elem13);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Editor_Extension_render_batch_result.prototype.write = function(output) {
+  output.writeStructBegin('Editor_Extension_render_batch_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.LIST, 0);
+    output.writeListBegin(Thrift.Type.STRUCT, this.success.length);
+    for (var iter14 in this.success) {
+      if (this.success.hasOwnProperty(iter14)) {
+        iter14 = this.success[iter14];
+        iter14.write(output);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Editor_ExtensionClient = exports.Client = function(output, pClass) {
+  this.output = output;
+  this.pClass = pClass;
+  this._seqid = 0;
+  this._reqs = {};
+};
+Editor_ExtensionClient.prototype = {};
+Editor_ExtensionClient.prototype.seqid = function() { return this._seqid; };
+Editor_ExtensionClient.prototype.new_seqid = function() { return this._seqid += 1; };
+
+Editor_ExtensionClient.prototype.render_client = function(callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_render_client();
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_render_client();
+  }
+};
+
+Editor_ExtensionClient.prototype.send_render_client = function() {
+  var output = new this.pClass(this.output);
+  var args = new Editor_Extension_render_client_args();
+  try {
+    output.writeMessageBegin('render_client', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_render_client = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_render_client_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('render_client failed: unknown result');
+};
+
+Editor_ExtensionClient.prototype.render_client_with_id = function(id, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_render_client_with_id(id);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_render_client_with_id(id);
+  }
+};
+
+Editor_ExtensionClient.prototype.send_render_client_with_id = function(id) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_render_client_with_id_args(params);
+  try {
+    output.writeMessageBegin('render_client_with_id', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_render_client_with_id = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_render_client_with_id_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('render_client_with_id failed: unknown result');
+};
+
+Editor_ExtensionClient.prototype.start_render = function(text, path, id, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_start_render(text, path, id);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_start_render(text, path, id);
+  }
+};
+
+Editor_ExtensionClient.prototype.send_start_render = function(text, path, id) {
+  var output = new this.pClass(this.output);
+  var params = {
+    text: text,
+    path: path,
+    id: id
+  };
+  var args = new Editor_Extension_start_render_args(params);
+  try {
+    output.writeMessageBegin('start_render', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_start_render = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_start_render_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+
+Editor_ExtensionClient.prototype.start_render_shared = function(name, offset, length, path, id, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_start_render_shared(name, offset, length, path, id);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_start_render_shared(name, offset, length, path, id);
+  }
+};
+
+Editor_ExtensionClient.prototype.send_start_render_shared = function(name, offset, length, path, id) {
+  var output = new this.pClass(this.output);
+  var params = {
+    name: name,
+    offset: offset,
+    length: length,
+    path: path,
+    id: id
+  };
+  var args = new Editor_Extension_start_render_shared_args(params);
+  try {
+    output.writeMessageBegin('start_render_shared', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_start_render_shared = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_start_render_shared_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+
+Editor_ExtensionClient.prototype.stop_render_client = function(id, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_stop_render_client(id);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_stop_render_client(id);
+  }
+};
+
+Editor_ExtensionClient.prototype.send_stop_render_client = function(id) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_stop_render_client_args(params);
+  try {
+    output.writeMessageBegin('stop_render_client', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Editor_ExtensionClient.prototype.recv_stop_render_client = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_stop_render_client_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+
+Editor_ExtensionClient.prototype.sync_web_view = function(id, line, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_sync_web_view(id, line);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_sync_web_view(id, line);
+  }
 };
 
-Editor_Extension_stop_render_client_args.prototype.write = function(output) {
-  output.writeStructBegin('Editor_Extension_stop_render_client_args');
-  if (this.id !== null && this.id !== undefined) {
-    output.writeFieldBegin('id', Thrift.Type.I32, 1);
-    output.writeI32(this.id);
-    output.writeFieldEnd();
+Editor_ExtensionClient.prototype.send_sync_web_view = function(id, line) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    line: line
+  };
+  var args = new Editor_Extension_sync_web_view_args(params);
+  try {
+    output.writeMessageBegin('sync_web_view', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
   }
-  output.writeFieldStop();
-  output.writeStructEnd();
-  return;
-};
-
-var Editor_Extension_stop_render_client_result = function(args) {
-};
-Editor_Extension_stop_render_client_result.prototype = {};
-Editor_Extension_stop_render_client_result.prototype.read = function(input) {
-  input.readStructBegin();
-  while (true) {
-    var ret = input.readFieldBegin();
-    var ftype = ret.ftype;
-    if (ftype == Thrift.Type.STOP) {
-      break;
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
     }
-    input.skip(ftype);
-    input.readFieldEnd();
+    throw e;
   }
-  input.readStructEnd();
-  return;
 };
 
-Editor_Extension_stop_render_client_result.prototype.write = function(output) {
-  output.writeStructBegin('Editor_Extension_stop_render_client_result');
-  output.writeFieldStop();
-  output.writeStructEnd();
-  return;
-};
+Editor_ExtensionClient.prototype.recv_sync_web_view = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Editor_Extension_sync_web_view_result();
+  result.read(input);
+  input.readMessageEnd();
 
-var Editor_ExtensionClient = exports.Client = function(output, pClass) {
-  this.output = output;
-  this.pClass = pClass;
-  this._seqid = 0;
-  this._reqs = {};
+  callback(null);
 };
-Editor_ExtensionClient.prototype = {};
-Editor_ExtensionClient.prototype.seqid = function() { return this._seqid; };
-Editor_ExtensionClient.prototype.new_seqid = function() { return this._seqid += 1; };
 
-Editor_ExtensionClient.prototype.render_client = function(callback) {
+Editor_ExtensionClient.prototype.get_editor_result = function(id, callback) {
   this._seqid = this.new_seqid();
   if (callback === undefined) {
     var _defer = Q.defer();
@@ -289,19 +1268,22 @@ Editor_ExtensionClient.prototype.render_client = function(callback) {
         _defer.resolve(result);
       }
     };
-    this.send_render_client();
+    this.send_get_editor_result(id);
     return _defer.promise;
   } else {
     this._reqs[this.seqid()] = callback;
-    this.send_render_client();
+    this.send_get_editor_result(id);
   }
 };
 
-Editor_ExtensionClient.prototype.send_render_client = function() {
+Editor_ExtensionClient.prototype.send_get_editor_result = function(id) {
   var output = new this.pClass(this.output);
-  var args = new Editor_Extension_render_client_args();
+  var params = {
+    id: id
+  };
+  var args = new Editor_Extension_get_editor_result_args(params);
   try {
-    output.writeMessageBegin('render_client', Thrift.MessageType.CALL, this.seqid());
+    output.writeMessageBegin('get_editor_result', Thrift.MessageType.CALL, this.seqid());
     args.write(output);
     output.writeMessageEnd();
     return this.output.flush();
@@ -315,7 +1297,7 @@ Editor_ExtensionClient.prototype.send_render_client = function() {
   }
 };
 
-Editor_ExtensionClient.prototype.recv_render_client = function(input,mtype,rseqid) {
+Editor_ExtensionClient.prototype.recv_get_editor_result = function(input,mtype,rseqid) {
   var callback = this._reqs[rseqid] || function() {};
   delete this._reqs[rseqid];
   if (mtype == Thrift.MessageType.EXCEPTION) {
@@ -324,17 +1306,17 @@ Editor_ExtensionClient.prototype.recv_render_client = function(input,mtype,rseqi
     input.readMessageEnd();
     return callback(x);
   }
-  var result = new Editor_Extension_render_client_result();
+  var result = new Editor_Extension_get_editor_result_result();
   result.read(input);
   input.readMessageEnd();
 
   if (null !== result.success) {
     return callback(null, result.success);
   }
-  return callback('render_client failed: unknown result');
+  return callback('get_editor_result failed: unknown result');
 };
 
-Editor_ExtensionClient.prototype.start_render = function(text, path, id, callback) {
+Editor_ExtensionClient.prototype.grant_ownership = function(id, callback) {
   this._seqid = this.new_seqid();
   if (callback === undefined) {
     var _defer = Q.defer();
@@ -345,24 +1327,22 @@ Editor_ExtensionClient.prototype.start_render = function(text, path, id, callbac
         _defer.resolve(result);
       }
     };
-    this.send_start_render(text, path, id);
+    this.send_grant_ownership(id);
     return _defer.promise;
   } else {
     this._reqs[this.seqid()] = callback;
-    this.send_start_render(text, path, id);
+    this.send_grant_ownership(id);
   }
 };
 
-Editor_ExtensionClient.prototype.send_start_render = function(text, path, id) {
+Editor_ExtensionClient.prototype.send_grant_ownership = function(id) {
   var output = new this.pClass(this.output);
   var params = {
-    text: text,
-    path: path,
     id: id
   };
-  var args = new Editor_Extension_start_render_args(params);
+  var args = new Editor_Extension_grant_ownership_args(params);
   try {
-    output.writeMessageBegin('start_render', Thrift.MessageType.CALL, this.seqid());
+    output.writeMessageBegin('grant_ownership', Thrift.MessageType.CALL, this.seqid());
     args.write(output);
     output.writeMessageEnd();
     return this.output.flush();
@@ -376,7 +1356,7 @@ Editor_ExtensionClient.prototype.send_start_render = function(text, path, id) {
   }
 };
 
-Editor_ExtensionClient.prototype.recv_start_render = function(input,mtype,rseqid) {
+Editor_ExtensionClient.prototype.recv_grant_ownership = function(input,mtype,rseqid) {
   var callback = this._reqs[rseqid] || function() {};
   delete this._reqs[rseqid];
   if (mtype == Thrift.MessageType.EXCEPTION) {
@@ -385,14 +1365,14 @@ Editor_ExtensionClient.prototype.recv_start_render = function(input,mtype,rseqid
     input.readMessageEnd();
     return callback(x);
   }
-  var result = new Editor_Extension_start_render_result();
+  var result = new Editor_Extension_grant_ownership_result();
   result.read(input);
   input.readMessageEnd();
 
   callback(null);
 };
 
-Editor_ExtensionClient.prototype.stop_render_client = function(id, callback) {
+Editor_ExtensionClient.prototype.render_batch = function(paths, callback) {
   this._seqid = this.new_seqid();
   if (callback === undefined) {
     var _defer = Q.defer();
@@ -403,22 +1383,22 @@ Editor_ExtensionClient.prototype.stop_render_client = function(id, callback) {
         _defer.resolve(result);
       }
     };
-    this.send_stop_render_client(id);
+    this.send_render_batch(paths);
     return _defer.promise;
   } else {
     this._reqs[this.seqid()] = callback;
-    this.send_stop_render_client(id);
+    this.send_render_batch(paths);
   }
 };
 
-Editor_ExtensionClient.prototype.send_stop_render_client = function(id) {
+Editor_ExtensionClient.prototype.send_render_batch = function(paths) {
   var output = new this.pClass(this.output);
   var params = {
-    id: id
+    paths: paths
   };
-  var args = new Editor_Extension_stop_render_client_args(params);
+  var args = new Editor_Extension_render_batch_args(params);
   try {
-    output.writeMessageBegin('stop_render_client', Thrift.MessageType.CALL, this.seqid());
+    output.writeMessageBegin('render_batch', Thrift.MessageType.CALL, this.seqid());
     args.write(output);
     output.writeMessageEnd();
     return this.output.flush();
@@ -432,7 +1412,7 @@ Editor_ExtensionClient.prototype.send_stop_render_client = function(id) {
   }
 };
 
-Editor_ExtensionClient.prototype.recv_stop_render_client = function(input,mtype,rseqid) {
+Editor_ExtensionClient.prototype.recv_render_batch = function(input,mtype,rseqid) {
   var callback = this._reqs[rseqid] || function() {};
   delete this._reqs[rseqid];
   if (mtype == Thrift.MessageType.EXCEPTION) {
@@ -441,11 +1421,14 @@ Editor_ExtensionClient.prototype.recv_stop_render_client = function(input,mtype,
     input.readMessageEnd();
     return callback(x);
   }
-  var result = new Editor_Extension_stop_render_client_result();
+  var result = new Editor_Extension_render_batch_result();
   result.read(input);
   input.readMessageEnd();
 
-  callback(null);
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('render_batch failed: unknown result');
 };
 var Editor_ExtensionProcessor = exports.Processor = function(handler) {
   this._handler = handler;
@@ -500,6 +1483,43 @@ Editor_ExtensionProcessor.prototype.process_render_client = function(seqid, inpu
     });
   }
 };
+Editor_ExtensionProcessor.prototype.process_render_client_with_id = function(seqid, input, output) {
+  var args = new Editor_Extension_render_client_with_id_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.render_client_with_id.length === 1) {
+    Q.fcall(this._handler.render_client_with_id.bind(this._handler),
+      args.id
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_render_client_with_id_result({success: result});
+      output.writeMessageBegin("render_client_with_id", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("render_client_with_id", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.render_client_with_id(args.id, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_render_client_with_id_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("render_client_with_id", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("render_client_with_id", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
 Editor_ExtensionProcessor.prototype.process_start_render = function(seqid, input, output) {
   var args = new Editor_Extension_start_render_args();
   args.read(input);
@@ -539,6 +1559,47 @@ Editor_ExtensionProcessor.prototype.process_start_render = function(seqid, input
     });
   }
 };
+Editor_ExtensionProcessor.prototype.process_start_render_shared = function(seqid, input, output) {
+  var args = new Editor_Extension_start_render_shared_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.start_render_shared.length === 5) {
+    Q.fcall(this._handler.start_render_shared.bind(this._handler),
+      args.name,
+      args.offset,
+      args.length,
+      args.path,
+      args.id
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_start_render_shared_result({success: result});
+      output.writeMessageBegin("start_render_shared", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("start_render_shared", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.start_render_shared(args.name, args.offset, args.length, args.path, args.id, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_start_render_shared_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("start_render_shared", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("start_render_shared", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
 Editor_ExtensionProcessor.prototype.process_stop_render_client = function(seqid, input, output) {
   var args = new Editor_Extension_stop_render_client_args();
   args.read(input);
@@ -576,3 +1637,152 @@ Editor_ExtensionProcessor.prototype.process_stop_render_client = function(seqid,
     });
   }
 };
+Editor_ExtensionProcessor.prototype.process_sync_web_view = function(seqid, input, output) {
+  var args = new Editor_Extension_sync_web_view_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.sync_web_view.length === 2) {
+    Q.fcall(this._handler.sync_web_view.bind(this._handler),
+      args.id,
+      args.line
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_sync_web_view_result({success: result});
+      output.writeMessageBegin("sync_web_view", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("sync_web_view", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.sync_web_view(args.id, args.line, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_sync_web_view_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("sync_web_view", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("sync_web_view", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Editor_ExtensionProcessor.prototype.process_get_editor_result = function(seqid, input, output) {
+  var args = new Editor_Extension_get_editor_result_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.get_editor_result.length === 1) {
+    Q.fcall(this._handler.get_editor_result.bind(this._handler),
+      args.id
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_get_editor_result_result({success: result});
+      output.writeMessageBegin("get_editor_result", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("get_editor_result", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.get_editor_result(args.id, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_get_editor_result_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("get_editor_result", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("get_editor_result", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Editor_ExtensionProcessor.prototype.process_grant_ownership = function(seqid, input, output) {
+  var args = new Editor_Extension_grant_ownership_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.grant_ownership.length === 1) {
+    Q.fcall(this._handler.grant_ownership.bind(this._handler),
+      args.id
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_grant_ownership_result({success: result});
+      output.writeMessageBegin("grant_ownership", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("grant_ownership", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.grant_ownership(args.id, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_grant_ownership_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("grant_ownership", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("grant_ownership", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Editor_ExtensionProcessor.prototype.process_render_batch = function(seqid, input, output) {
+  var args = new Editor_Extension_render_batch_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.render_batch.length === 1) {
+    Q.fcall(this._handler.render_batch.bind(this._handler),
+      args.paths
+    ).then(function(result) {
+      var result_obj = new Editor_Extension_render_batch_result({success: result});
+      output.writeMessageBegin("render_batch", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("render_batch", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.render_batch(args.paths, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Editor_Extension_render_batch_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("render_batch", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("render_batch", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
@@ -16,10 +16,14 @@ var ttypes = require('./CodeChat_Services_types');
 
 var Web_Sync_get_result_args = function(args) {
   this.id = null;
+  this.viewer_id = null;
   if (args) {
     if (args.id !== undefined && args.id !== null) {
       this.id = args.id;
     }
+    if (args.viewer_id !== undefined && args.viewer_id !== null) {
+      this.viewer_id = args.viewer_id;
+    }
   }
 };
 Web_Sync_get_result_args.prototype = {};
@@ -40,9 +44,13 @@ Web_Sync_get_result_args.prototype.read = function(input) {
         input.skip(ftype);
       }
       break;
-      case 0:
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.viewer_id = input.readI32();
+      } else {
         input.skip(ftype);
-        break;
+      }
+      break;
       default:
         input.skip(ftype);
     }
@@ -59,6 +67,11 @@ Web_Sync_get_result_args.prototype.write = function(output) {
     output.writeI32(this.id);
     output.writeFieldEnd();
   }
+  if (this.viewer_id !== null && this.viewer_id !== undefined) {
+    output.writeFieldBegin('viewer_id', Thrift.Type.I32, 2);
+    output.writeI32(this.viewer_id);
+    output.writeFieldEnd();
+  }
   output.writeFieldStop();
   output.writeStructEnd();
   return;
@@ -115,121 +128,1412 @@ Web_Sync_get_result_result.prototype.write = function(output) {
   return;
 };
 
-var Web_SyncClient = exports.Client = function(output, pClass) {
-  this.output = output;
-  this.pClass = pClass;
-  this._seqid = 0;
-  this._reqs = {};
+var Web_Sync_sync_editor_args = function(args) {
+  this.id = null;
+  this.anchor = null;
+  this.line_offset = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.anchor !== undefined && args.anchor !== null) {
+      this.anchor = args.anchor;
+    }
+    if (args.line_offset !== undefined && args.line_offset !== null) {
+      this.line_offset = args.line_offset;
+    }
+  }
 };
-Web_SyncClient.prototype = {};
-Web_SyncClient.prototype.seqid = function() { return this._seqid; };
-Web_SyncClient.prototype.new_seqid = function() { return this._seqid += 1; };
-
-Web_SyncClient.prototype.get_result = function(id, callback) {
-  this._seqid = this.new_seqid();
-  if (callback === undefined) {
-    var _defer = Q.defer();
-    this._reqs[this.seqid()] = function(error, result) {
-      if (error) {
-        _defer.reject(error);
+Web_Sync_sync_editor_args.prototype = {};
+Web_Sync_sync_editor_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
       } else {
-        _defer.resolve(result);
+        input.skip(ftype);
       }
-    };
-    this.send_get_result(id);
-    return _defer.promise;
-  } else {
-    this._reqs[this.seqid()] = callback;
-    this.send_get_result(id);
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.anchor = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.line_offset = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
   }
+  input.readStructEnd();
+  return;
 };
 
-Web_SyncClient.prototype.send_get_result = function(id) {
-  var output = new this.pClass(this.output);
-  var params = {
-    id: id
-  };
-  var args = new Web_Sync_get_result_args(params);
-  try {
-    output.writeMessageBegin('get_result', Thrift.MessageType.CALL, this.seqid());
-    args.write(output);
-    output.writeMessageEnd();
-    return this.output.flush();
+Web_Sync_sync_editor_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_sync_editor_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
   }
-  catch (e) {
-    delete this._reqs[this.seqid()];
-    if (typeof output.reset === 'function') {
-      output.reset();
-    }
-    throw e;
+  if (this.anchor !== null && this.anchor !== undefined) {
+    output.writeFieldBegin('anchor', Thrift.Type.STRING, 2);
+    output.writeString(this.anchor);
+    output.writeFieldEnd();
+  }
+  if (this.line_offset !== null && this.line_offset !== undefined) {
+    output.writeFieldBegin('line_offset', Thrift.Type.I32, 3);
+    output.writeI32(this.line_offset);
+    output.writeFieldEnd();
   }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
 };
 
-Web_SyncClient.prototype.recv_get_result = function(input,mtype,rseqid) {
-  var callback = this._reqs[rseqid] || function() {};
-  delete this._reqs[rseqid];
-  if (mtype == Thrift.MessageType.EXCEPTION) {
-    var x = new Thrift.TApplicationException();
-    x.read(input);
-    input.readMessageEnd();
-    return callback(x);
+var Web_Sync_sync_editor_result = function(args) {
+};
+Web_Sync_sync_editor_result.prototype = {};
+Web_Sync_sync_editor_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
   }
-  var result = new Web_Sync_get_result_result();
-  result.read(input);
-  input.readMessageEnd();
+  input.readStructEnd();
+  return;
+};
 
-  if (null !== result.success) {
-    return callback(null, result.success);
+Web_Sync_sync_editor_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_sync_editor_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_request_ownership_args = function(args) {
+  this.id = null;
+  this.anchor = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.anchor !== undefined && args.anchor !== null) {
+      this.anchor = args.anchor;
+    }
   }
-  return callback('get_result failed: unknown result');
 };
-var Web_SyncProcessor = exports.Processor = function(handler) {
-  this._handler = handler;
+Web_Sync_request_ownership_args.prototype = {};
+Web_Sync_request_ownership_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.anchor = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
 };
-Web_SyncProcessor.prototype.process = function(input, output) {
-  var r = input.readMessageBegin();
-  if (this['process_' + r.fname]) {
-    return this['process_' + r.fname].call(this, r.rseqid, input, output);
-  } else {
-    input.skip(Thrift.Type.STRUCT);
-    input.readMessageEnd();
-    var x = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN_METHOD, 'Unknown function ' + r.fname);
-    output.writeMessageBegin(r.fname, Thrift.MessageType.EXCEPTION, r.rseqid);
-    x.write(output);
-    output.writeMessageEnd();
-    output.flush();
+
+Web_Sync_request_ownership_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_request_ownership_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.anchor !== null && this.anchor !== undefined) {
+    output.writeFieldBegin('anchor', Thrift.Type.STRING, 2);
+    output.writeString(this.anchor);
+    output.writeFieldEnd();
   }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
 };
-Web_SyncProcessor.prototype.process_get_result = function(seqid, input, output) {
-  var args = new Web_Sync_get_result_args();
-  args.read(input);
-  input.readMessageEnd();
-  if (this._handler.get_result.length === 1) {
-    Q.fcall(this._handler.get_result.bind(this._handler),
-      args.id
-    ).then(function(result) {
-      var result_obj = new Web_Sync_get_result_result({success: result});
-      output.writeMessageBegin("get_result", Thrift.MessageType.REPLY, seqid);
-      result_obj.write(output);
-      output.writeMessageEnd();
-      output.flush();
-    }).catch(function (err) {
-      var result;
-      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
-      output.writeMessageBegin("get_result", Thrift.MessageType.EXCEPTION, seqid);
-      result.write(output);
-      output.writeMessageEnd();
-      output.flush();
-    });
-  } else {
-    this._handler.get_result(args.id, function (err, result) {
-      var result_obj;
-      if ((err === null || typeof err === 'undefined')) {
-        result_obj = new Web_Sync_get_result_result((err !== null || typeof err === 'undefined') ? err : {success: result});
-        output.writeMessageBegin("get_result", Thrift.MessageType.REPLY, seqid);
+
+var Web_Sync_request_ownership_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = new ttypes.Ownership_Return(args.success);
+    }
+  }
+};
+Web_Sync_request_ownership_result.prototype = {};
+Web_Sync_request_ownership_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRUCT) {
+        this.success = new ttypes.Ownership_Return();
+        this.success.read(input);
       } else {
-        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
-        output.writeMessageBegin("get_result", Thrift.MessageType.EXCEPTION, seqid);
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_request_ownership_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_request_ownership_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRUCT, 0);
+    this.success.write(output);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_edit_text_args = function(args) {
+  this.id = null;
+  this.version = null;
+  this.edits = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.version !== undefined && args.version !== null) {
+      this.version = args.version;
+    }
+    if (args.edits !== undefined && args.edits !== null) {
+      this.edits = Thrift.copyList(args.edits, [ttypes.Text_Edit]);
+    }
+  }
+};
+Web_Sync_edit_text_args.prototype = {};
+Web_Sync_edit_text_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.version = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.LIST) {
+        this.edits = [];
+        var _rtmp316 = input.readListBegin();
+        var _size15 = _rtmp316.size || 0;
+        for (var _i17 = 0; _i17 < _size15; ++_i17) {
+          var elem18 = null;
+          elem18 = new ttypes.Text_Edit();
+          elem18.read(input);
+          this.edits.push(elem18);
+        }
+        input.readListEnd();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_edit_text_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.version !== null && this.version !== undefined) {
+    output.writeFieldBegin('version', Thrift.Type.I32, 2);
+    output.writeI32(this.version);
+    output.writeFieldEnd();
+  }
+  if (this.edits !== null && this.edits !== undefined) {
+    output.writeFieldBegin('edits', Thrift.Type.LIST, 3);
+    output.writeListBegin(Thrift.Type.STRUCT, this.edits.length);
+    for (var iter19 in this.edits) {
+      if (this.edits.hasOwnProperty(iter19)) {
+        iter19 = this.edits[iter19];
+        iter19.write(output);
+      }
+    }
+    output.writeListEnd();
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_edit_text_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = args.success;
+    }
+  }
+};
+Web_Sync_edit_text_result.prototype = {};
+Web_Sync_edit_text_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.BOOL) {
+        this.success = input.readBool();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_edit_text_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_edit_text_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.BOOL, 0);
+    output.writeBool(this.success);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_set_viewport_args = function(args) {
+  this.id = null;
+  this.version = null;
+  this.first_block = null;
+  this.last_block = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.version !== undefined && args.version !== null) {
+      this.version = args.version;
+    }
+    if (args.first_block !== undefined && args.first_block !== null) {
+      this.first_block = args.first_block;
+    }
+    if (args.last_block !== undefined && args.last_block !== null) {
+      this.last_block = args.last_block;
+    }
+  }
+};
+Web_Sync_set_viewport_args.prototype = {};
+Web_Sync_set_viewport_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.version = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.I32) {
+        this.first_block = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 4:
+      if (ftype == Thrift.Type.I32) {
+        this.last_block = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_viewport_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.version !== null && this.version !== undefined) {
+    output.writeFieldBegin('version', Thrift.Type.I32, 2);
+    output.writeI32(this.version);
+    output.writeFieldEnd();
+  }
+  if (this.first_block !== null && this.first_block !== undefined) {
+    output.writeFieldBegin('first_block', Thrift.Type.I32, 3);
+    output.writeI32(this.first_block);
+    output.writeFieldEnd();
+  }
+  if (this.last_block !== null && this.last_block !== undefined) {
+    output.writeFieldBegin('last_block', Thrift.Type.I32, 4);
+    output.writeI32(this.last_block);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_set_viewport_result = function(args) {
+};
+Web_Sync_set_viewport_result.prototype = {};
+Web_Sync_set_viewport_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_viewport_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_viewport_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_get_asset_args = function(args) {
+  this.id = null;
+  this.name = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.name !== undefined && args.name !== null) {
+      this.name = args.name;
+    }
+  }
+};
+Web_Sync_get_asset_args.prototype = {};
+Web_Sync_get_asset_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.STRING) {
+        this.name = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_get_asset_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.name !== null && this.name !== undefined) {
+    output.writeFieldBegin('name', Thrift.Type.STRING, 2);
+    output.writeString(this.name);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_get_asset_result = function(args) {
+  this.success = null;
+  if (args) {
+    if (args.success !== undefined && args.success !== null) {
+      this.success = args.success;
+    }
+  }
+};
+Web_Sync_get_asset_result.prototype = {};
+Web_Sync_get_asset_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 0:
+      if (ftype == Thrift.Type.STRING) {
+        this.success = input.readString();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 0:
+        input.skip(ftype);
+        break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_get_asset_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_get_asset_result');
+  if (this.success !== null && this.success !== undefined) {
+    output.writeFieldBegin('success', Thrift.Type.STRING, 0);
+    output.writeString(this.success);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_set_visibility_args = function(args) {
+  this.id = null;
+  this.viewer_id = null;
+  this.visible = null;
+  if (args) {
+    if (args.id !== undefined && args.id !== null) {
+      this.id = args.id;
+    }
+    if (args.viewer_id !== undefined && args.viewer_id !== null) {
+      this.viewer_id = args.viewer_id;
+    }
+    if (args.visible !== undefined && args.visible !== null) {
+      this.visible = args.visible;
+    }
+  }
+};
+Web_Sync_set_visibility_args.prototype = {};
+Web_Sync_set_visibility_args.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    var fid = ret.fid;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    switch (fid) {
+      case 1:
+      if (ftype == Thrift.Type.I32) {
+        this.id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 2:
+      if (ftype == Thrift.Type.I32) {
+        this.viewer_id = input.readI32();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      case 3:
+      if (ftype == Thrift.Type.BOOL) {
+        this.visible = input.readBool();
+      } else {
+        input.skip(ftype);
+      }
+      break;
+      default:
+        input.skip(ftype);
+    }
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_args.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_visibility_args');
+  if (this.id !== null && this.id !== undefined) {
+    output.writeFieldBegin('id', Thrift.Type.I32, 1);
+    output.writeI32(this.id);
+    output.writeFieldEnd();
+  }
+  if (this.viewer_id !== null && this.viewer_id !== undefined) {
+    output.writeFieldBegin('viewer_id', Thrift.Type.I32, 2);
+    output.writeI32(this.viewer_id);
+    output.writeFieldEnd();
+  }
+  if (this.visible !== null && this.visible !== undefined) {
+    output.writeFieldBegin('visible', Thrift.Type.BOOL, 3);
+    output.writeBool(this.visible);
+    output.writeFieldEnd();
+  }
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_Sync_set_visibility_result = function(args) {
+};
+Web_Sync_set_visibility_result.prototype = {};
+Web_Sync_set_visibility_result.prototype.read = function(input) {
+  input.readStructBegin();
+  while (true) {
+    var ret = input.readFieldBegin();
+    var ftype = ret.ftype;
+    if (ftype == Thrift.Type.STOP) {
+      break;
+    }
+    input.skip(ftype);
+    input.readFieldEnd();
+  }
+  input.readStructEnd();
+  return;
+};
+
+Web_Sync_set_visibility_result.prototype.write = function(output) {
+  output.writeStructBegin('Web_Sync_set_visibility_result');
+  output.writeFieldStop();
+  output.writeStructEnd();
+  return;
+};
+
+var Web_SyncClient = exports.Client = function(output, pClass) {
+  this.output = output;
+  this.pClass = pClass;
+  this._seqid = 0;
+  this._reqs = {};
+};
+Web_SyncClient.prototype = {};
+Web_SyncClient.prototype.seqid = function() { return this._seqid; };
+Web_SyncClient.prototype.new_seqid = function() { return this._seqid += 1; };
+
+Web_SyncClient.prototype.get_result = function(id, viewer_id, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_get_result(id, viewer_id);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_get_result(id, viewer_id);
+  }
+};
+
+Web_SyncClient.prototype.send_get_result = function(id, viewer_id) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    viewer_id: viewer_id
+  };
+  var args = new Web_Sync_get_result_args(params);
+  try {
+    output.writeMessageBegin('get_result', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_get_result = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_get_result_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('get_result failed: unknown result');
+};
+
+Web_SyncClient.prototype.sync_editor = function(id, anchor, line_offset, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_sync_editor(id, anchor, line_offset);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_sync_editor(id, anchor, line_offset);
+  }
+};
+
+Web_SyncClient.prototype.send_sync_editor = function(id, anchor, line_offset) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    anchor: anchor,
+    line_offset: line_offset
+  };
+  var args = new Web_Sync_sync_editor_args(params);
+  try {
+    output.writeMessageBegin('sync_editor', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_sync_editor = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_sync_editor_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+
+Web_SyncClient.prototype.request_ownership = function(id, anchor, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_request_ownership(id, anchor);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_request_ownership(id, anchor);
+  }
+};
+
+Web_SyncClient.prototype.send_request_ownership = function(id, anchor) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    anchor: anchor
+  };
+  var args = new Web_Sync_request_ownership_args(params);
+  try {
+    output.writeMessageBegin('request_ownership', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_request_ownership = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_request_ownership_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('request_ownership failed: unknown result');
+};
+
+Web_SyncClient.prototype.edit_text = function(id, version, edits, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_edit_text(id, version, edits);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_edit_text(id, version, edits);
+  }
+};
+
+Web_SyncClient.prototype.send_edit_text = function(id, version, edits) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    version: version,
+    edits: edits
+  };
+  var args = new Web_Sync_edit_text_args(params);
+  try {
+    output.writeMessageBegin('edit_text', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_edit_text = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_edit_text_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('edit_text failed: unknown result');
+};
+
+Web_SyncClient.prototype.set_viewport = function(id, version, first_block, last_block, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_set_viewport(id, version, first_block, last_block);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_set_viewport(id, version, first_block, last_block);
+  }
+};
+
+Web_SyncClient.prototype.send_set_viewport = function(id, version, first_block, last_block) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    version: version,
+    first_block: first_block,
+    last_block: last_block
+  };
+  var args = new Web_Sync_set_viewport_args(params);
+  try {
+    output.writeMessageBegin('set_viewport', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_set_viewport = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_set_viewport_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+
+Web_SyncClient.prototype.get_asset = function(id, name, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_get_asset(id, name);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_get_asset(id, name);
+  }
+};
+
+Web_SyncClient.prototype.send_get_asset = function(id, name) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    name: name
+  };
+  var args = new Web_Sync_get_asset_args(params);
+  try {
+    output.writeMessageBegin('get_asset', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_get_asset = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_get_asset_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  if (null !== result.success) {
+    return callback(null, result.success);
+  }
+  return callback('get_asset failed: unknown result');
+};
+
+Web_SyncClient.prototype.set_visibility = function(id, viewer_id, visible, callback) {
+  this._seqid = this.new_seqid();
+  if (callback === undefined) {
+    var _defer = Q.defer();
+    this._reqs[this.seqid()] = function(error, result) {
+      if (error) {
+        _defer.reject(error);
+      } else {
+        _defer.resolve(result);
+      }
+    };
+    this.send_set_visibility(id, viewer_id, visible);
+    return _defer.promise;
+  } else {
+    this._reqs[this.seqid()] = callback;
+    this.send_set_visibility(id, viewer_id, visible);
+  }
+};
+
+Web_SyncClient.prototype.send_set_visibility = function(id, viewer_id, visible) {
+  var output = new this.pClass(this.output);
+  var params = {
+    id: id,
+    viewer_id: viewer_id,
+    visible: visible
+  };
+  var args = new Web_Sync_set_visibility_args(params);
+  try {
+    output.writeMessageBegin('set_visibility', Thrift.MessageType.CALL, this.seqid());
+    args.write(output);
+    output.writeMessageEnd();
+    return this.output.flush();
+  }
+  catch (e) {
+    delete this._reqs[this.seqid()];
+    if (typeof output.reset === 'function') {
+      output.reset();
+    }
+    throw e;
+  }
+};
+
+Web_SyncClient.prototype.recv_set_visibility = function(input,mtype,rseqid) {
+  var callback = this._reqs[rseqid] || function() {};
+  delete this._reqs[rseqid];
+  if (mtype == Thrift.MessageType.EXCEPTION) {
+    var x = new Thrift.TApplicationException();
+    x.read(input);
+    input.readMessageEnd();
+    return callback(x);
+  }
+  var result = new Web_Sync_set_visibility_result();
+  result.read(input);
+  input.readMessageEnd();
+
+  callback(null);
+};
+var Web_SyncProcessor = exports.Processor = function(handler) {
+  this._handler = handler;
+};
+Web_SyncProcessor.prototype.process = function(input, output) {
+  var r = input.readMessageBegin();
+  if (this['process_' + r.fname]) {
+    return this['process_' + r.fname].call(this, r.rseqid, input, output);
+  } else {
+    input.skip(Thrift.Type.STRUCT);
+    input.readMessageEnd();
+    var x = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN_METHOD, 'Unknown function ' + r.fname);
+    output.writeMessageBegin(r.fname, Thrift.MessageType.EXCEPTION, r.rseqid);
+    x.write(output);
+    output.writeMessageEnd();
+    output.flush();
+  }
+};
+Web_SyncProcessor.prototype.process_get_result = function(seqid, input, output) {
+  var args = new Web_Sync_get_result_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.get_result.length === 2) {
+    Q.fcall(this._handler.get_result.bind(this._handler),
+      args.id,
+      args.viewer_id
+    ).then(function(result) {
+      var result_obj = new Web_Sync_get_result_result({success: result});
+      output.writeMessageBegin("get_result", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("get_result", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.get_result(args.id, args.viewer_id, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_get_result_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("get_result", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("get_result", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_sync_editor = function(seqid, input, output) {
+  var args = new Web_Sync_sync_editor_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.sync_editor.length === 3) {
+    Q.fcall(this._handler.sync_editor.bind(this._handler),
+      args.id,
+      args.anchor,
+      args.line_offset
+    ).then(function(result) {
+      var result_obj = new Web_Sync_sync_editor_result({success: result});
+      output.writeMessageBegin("sync_editor", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("sync_editor", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.sync_editor(args.id, args.anchor, args.line_offset, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_sync_editor_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("sync_editor", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("sync_editor", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_request_ownership = function(seqid, input, output) {
+  var args = new Web_Sync_request_ownership_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.request_ownership.length === 2) {
+    Q.fcall(this._handler.request_ownership.bind(this._handler),
+      args.id,
+      args.anchor
+    ).then(function(result) {
+      var result_obj = new Web_Sync_request_ownership_result({success: result});
+      output.writeMessageBegin("request_ownership", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("request_ownership", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.request_ownership(args.id, args.anchor, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_request_ownership_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("request_ownership", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("request_ownership", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_edit_text = function(seqid, input, output) {
+  var args = new Web_Sync_edit_text_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.edit_text.length === 3) {
+    Q.fcall(this._handler.edit_text.bind(this._handler),
+      args.id,
+      args.version,
+      args.edits
+    ).then(function(result) {
+      var result_obj = new Web_Sync_edit_text_result({success: result});
+      output.writeMessageBegin("edit_text", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("edit_text", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.edit_text(args.id, args.version, args.edits, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_edit_text_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("edit_text", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("edit_text", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_set_viewport = function(seqid, input, output) {
+  var args = new Web_Sync_set_viewport_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.set_viewport.length === 4) {
+    Q.fcall(this._handler.set_viewport.bind(this._handler),
+      args.id,
+      args.version,
+      args.first_block,
+      args.last_block
+    ).then(function(result) {
+      var result_obj = new Web_Sync_set_viewport_result({success: result});
+      output.writeMessageBegin("set_viewport", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("set_viewport", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.set_viewport(args.id, args.version, args.first_block, args.last_block, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_set_viewport_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("set_viewport", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("set_viewport", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_get_asset = function(seqid, input, output) {
+  var args = new Web_Sync_get_asset_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.get_asset.length === 2) {
+    Q.fcall(this._handler.get_asset.bind(this._handler),
+      args.id,
+      args.name
+    ).then(function(result) {
+      var result_obj = new Web_Sync_get_asset_result({success: result});
+      output.writeMessageBegin("get_asset", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("get_asset", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.get_asset(args.id, args.name, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_get_asset_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("get_asset", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("get_asset", Thrift.MessageType.EXCEPTION, seqid);
+      }
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  }
+};
+Web_SyncProcessor.prototype.process_set_visibility = function(seqid, input, output) {
+  var args = new Web_Sync_set_visibility_args();
+  args.read(input);
+  input.readMessageEnd();
+  if (this._handler.set_visibility.length === 3) {
+    Q.fcall(this._handler.set_visibility.bind(this._handler),
+      args.id,
+      args.viewer_id,
+      args.visible
+    ).then(function(result) {
+      var result_obj = new Web_Sync_set_visibility_result({success: result});
+      output.writeMessageBegin("set_visibility", Thrift.MessageType.REPLY, seqid);
+      result_obj.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    }).catch(function (err) {
+      var result;
+      result = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+      output.writeMessageBegin("set_visibility", Thrift.MessageType.EXCEPTION, seqid);
+      result.write(output);
+      output.writeMessageEnd();
+      output.flush();
+    });
+  } else {
+    this._handler.set_visibility(args.id, args.viewer_id, args.visible, function (err, result) {
+      var result_obj;
+      if ((err === null || typeof err === 'undefined')) {
+        result_obj = new Web_Sync_set_visibility_result((err !== null || typeof err === 'undefined') ? err : {success: result});
+        output.writeMessageBegin("set_visibility", Thrift.MessageType.REPLY, seqid);
+      } else {
+        result_obj = new Thrift.TApplicationException(Thrift.TApplicationExceptionType.UNKNOWN, err.message);
+        output.writeMessageBegin("set_visibility", Thrift.MessageType.EXCEPTION, seqid);
       }
       result_obj.write(output);
       output.writeMessageEnd();